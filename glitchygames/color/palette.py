@@ -7,17 +7,132 @@ palette: Manages the custom color palette file format used by the engine.
 from __future__ import annotations
 
 import configparser
+import contextlib
+import functools
+import hashlib
 import json
+import logging
+import operator
+import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import ClassVar, Self
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
+import pygame
+from glitchygames.pixels import image_from_indexed, packed_pixels, pixel_view
 from pygame import Color
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the lookup cube and dithering fall back to Python
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+LOG = logging.getLogger('game.color.palette')
+LOG.addHandler(logging.NullHandler())
+
+# Set GLITCHYGAMES_CACHE_DIR to keep parsed palettes between runs
+PALETTE_CACHE_DIR: str | None = os.environ.get('GLITCHYGAMES_CACHE_DIR')
+
+# Cached palettes start with their color count, as a little endian integer
+CACHE_HEADER_SIZE = 4
+
 VGA = 'vga'
 SYSTEM = 'system'
 NES = 'nes'
 
+# Bits per channel of the nearest color lookup cube
+CUBE_BITS = 5
+CUBE_SIZE = 1 << (CUBE_BITS * 3)
+
+# 4x4 Bayer matrix for ordered dithering
+BAYER_MATRIX = ((0, 8, 2, 10), (12, 4, 14, 6), (3, 11, 1, 9), (15, 7, 13, 5))
+
+DITHER_ORDERED = 'ordered'
+DITHER_FLOYD_STEINBERG = 'floyd-steinberg'
+
+# Bit offsets of R, G and B in a packed pixel, see glitchygames.pixels.packed_pixels()
+PACKED_SHIFTS = (0, 8, 16) if sys.byteorder == 'little' else (24, 16, 8)
+
+
+class ColorTable:
+    """A palette's colors, packed into a bytearray of R, G, B, A bytes.
+
+    Indexing returns a new PyGame Color, so changing one doesn't change
+    the table; use set_color() or item assignment for that.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self: Self, data: bytes = b'') -> None:
+        """Create a color table.
+
+        Args:
+            data: The packed R, G, B, A bytes of each color.
+
+        Raises:
+            ValueError: The data isn't a whole number of colors.
+        """
+        if len(data) % 4:
+            raise ValueError(f'Color table length ({len(data)}) is not divisible by 4')
+
+        self.data = bytearray(data)
+
+    @classmethod
+    def from_colors(cls: Any, colors: Iterable) -> ColorTable:
+        """Pack PyGame Colors or (R, G, B[, A]) tuples into a color table.
+
+        Args:
+            colors: The colors.
+
+        Returns:
+            A ColorTable.
+        """
+        return cls(b''.join(bytes(tuple(Color(color))) for color in colors))
+
+    def __len__(self: Self) -> int:
+        """Return the number of colors."""
+        return len(self.data) // 4
+
+    def __bool__(self: Self) -> bool:
+        """Return whether there are any colors."""
+        return bool(self.data)
+
+    def __getitem__(self: Self, index: int | slice) -> Color | list[Color]:
+        """Return a color, or a list of colors for a slice."""
+        if isinstance(index, slice):
+            return [self[color_index] for color_index in range(*index.indices(len(self)))]
+
+        offset = range(len(self))[index] * 4
+
+        return Color(*self.data[offset : offset + 4])
+
+    def __setitem__(self: Self, index: int, color: tuple) -> None:
+        """Replace a color."""
+        offset = range(len(self))[index] * 4
+        self.data[offset : offset + 4] = bytes(tuple(Color(color)))
+
+    def __iter__(self: Self) -> Iterator[Color]:
+        """Iterate over the colors."""
+        return (Color(*self.data[offset : offset + 4]) for offset in range(0, len(self.data), 4))
+
+    def append(self: Self, color: tuple) -> None:
+        """Add a color to the end of the table."""
+        self.data += bytes(tuple(Color(color)))
+
+    def copy(self: Self) -> ColorTable:
+        """Return a copy of the table."""
+        return ColorTable(self.data)
+
+    def rgb(self: Self) -> list[tuple[int, int, int]]:
+        """Return the colors as (R, G, B) tuples, without building Colors."""
+        data = self.data
+
+        return list(zip(data[0::4], data[1::4], data[2::4], strict=True))
+
 
 class ColorPalette:
     """Manages color palette data for Glitchy Games."""
@@ -25,28 +140,31 @@ class ColorPalette:
     _BUILTIN_PALETTE_LOCATION: ClassVar = Path(__file__).parent / 'resources'
     _DEFAULT_EXTENSION: ClassVar = 'palette'
 
-    def __init__(self: Self, colors: list, filename: str | None = None) -> None:
+    def __init__(self: Self, colors: list | None = None, filename: str | None = None) -> None:
         """Create a color palette object.
 
         Args:
             colors: A list of PyGame Colors.  Default: None
             filename: The name of the palette file to load.  Default: None
         """
-        self._colors = colors
+        self._colors = ColorTable.from_colors(colors or [])
         self._size = 0
 
         if not self._colors and filename:
-            script_path = Path(sys.argv[0]).parent
-            paths = [self._BUILTIN_PALETTE_LOCATION, script_path, Path(script_path) / 'resources']
-            for path in paths:
-                file_path = Path(path) / f'{filename}.{self._DEFAULT_EXTENSION}'
-                if Path.exists(file_path):
-                    self._colors = PaletteUtility.load_palette_from_file(file_path)
-                    break
+            table = palette_table(filename)
+            if table is not None:
+                # The registry's table is shared; set_color() mustn't change it
+                self._colors = table.copy()
 
         if self._colors:
             self._size = len(self._colors) - 1
 
+        # The nearest color lookup cube, filled in as colors are looked up
+        self._cube: bytearray | None = None
+        self._cube_filled: bytearray | None = None
+        self._distances: list | None = None
+        self._exact: dict[tuple[int, int, int], int] = {}
+
     def get_color(self: Self, palette_index: int) -> tuple[int, int, int] | None:
         """Returns PyGame Color from the palette at the specified index.
 
@@ -81,6 +199,377 @@ class ColorPalette:
         else:
             self._colors.append(new_color)
 
+        self._cube = None
+
+    def surface_palette(self: Self) -> list[tuple[int, int, int]]:
+        """Returns the palette's colors for pygame.Surface.set_palette().
+
+        Only the first 256 colors fit an 8 bit surface.
+
+        Returns:
+            A list of colors in the format list[tuple[R: int, G: int, B: int]].
+        """
+        return self._colors.rgb()[:256]
+
+    def _fill_cube(self: Self, cells: Any) -> None:
+        """Find the nearest palette color to the center of each lookup cube cell.
+
+        Args:
+            cells: The cube cells to fill, ints of R, G and B bits (see CUBE_BITS).
+
+        Returns:
+            None
+        """
+        colors = self.surface_palette()
+        shift = 8 - CUBE_BITS
+        mask = (1 << CUBE_BITS) - 1
+        half = 1 << (shift - 1)
+
+        if np is not None:
+            cells = np.asarray(cells, dtype=np.int32)
+            centers = np.stack(
+                [
+                    ((cells >> (CUBE_BITS * 2)) & mask) << shift,
+                    ((cells >> CUBE_BITS) & mask) << shift,
+                    (cells & mask) << shift,
+                ],
+                axis=1,
+            ) + half
+            palette = np.array(colors, dtype=np.int32)
+
+            # In chunks, to bound the (cells, colors) distance matrix
+            for chunk in range(0, len(cells), 4096):
+                deltas = centers[chunk : chunk + 4096, None, :] - palette[None, :, :]
+                nearest = (deltas * deltas).sum(axis=2).argmin(axis=1)
+                for cell, index in zip(
+                    cells[chunk : chunk + 4096].tolist(), nearest.tolist(), strict=True
+                ):
+                    self._cube[cell] = index
+                    self._cube_filled[cell] = 1
+
+            return
+
+        if self._distances is None:
+            # Squared distance from each channel value to every palette color's
+            self._distances = [
+                [[(value - color[channel]) ** 2 for color in colors] for value in range(256)]
+                for channel in range(3)
+            ]
+        (red, green, blue) = self._distances
+
+        for cell in cells:
+            sums = list(
+                map(
+                    operator.add,
+                    map(
+                        operator.add,
+                        red[(((cell >> (CUBE_BITS * 2)) & mask) << shift) + half],
+                        green[(((cell >> CUBE_BITS) & mask) << shift) + half],
+                    ),
+                    blue[((cell & mask) << shift) + half],
+                )
+            )
+            self._cube[cell] = sums.index(min(sums))
+            self._cube_filled[cell] = 1
+
+    def _lookup_cube(self: Self, cells: Any) -> None:
+        """Make sure lookup cube cells are filled in.
+
+        Args:
+            cells: The cube cells about to be looked up.
+
+        Returns:
+            None
+        """
+        if self._cube is None:
+            self._cube = bytearray(CUBE_SIZE)
+            self._cube_filled = bytearray(CUBE_SIZE)
+            self._distances = None
+            self._exact = {}
+            for index, color in enumerate(self.surface_palette()):
+                # The first of any duplicate entries wins
+                self._exact.setdefault(color, index)
+
+        missing = [cell for cell in set(cells) if not self._cube_filled[cell]]
+
+        if missing:
+            self._fill_cube(missing)
+
+    def nearest_index(self: Self, color: tuple) -> int:
+        """Returns the index of the palette color nearest to a color.
+
+        Args:
+            color: A PyGame Color or tuple[R: int, G: int, B: int]
+
+        Returns:
+            The palette index.
+        """
+        return self.nearest_indexes(bytes(color[:3]))[0]
+
+    def nearest_indexes(
+        self: Self, pixel_data: Any, width: int | None = None, dither: str | None = None
+    ) -> bytes:
+        """Map RGB pixel data onto the indexes of the nearest palette colors.
+
+        Colors in the palette map to their own index.  Others map through a
+        32x32x32 lookup cube of the nearest palette color to each cell,
+        which is filled in as cells are first used and kept until the
+        palette changes.
+
+        Args:
+            pixel_data: Raw RGB pixel data, any object supporting the buffer protocol.
+            width: The width of the image in pixels, needed for dithering.
+            dither: None, DITHER_ORDERED (4x4 Bayer) or DITHER_FLOYD_STEINBERG.
+                Floyd-Steinberg diffuses the error pixel by pixel, so it is
+                much slower than the others.
+
+        Returns:
+            One palette index byte per pixel.
+
+        Raises:
+            ValueError: The palette is empty, or the dither or width is invalid.
+        """
+        if not self._colors:
+            raise ValueError("Can't map colors onto an empty palette")
+
+        if dither is not None:
+            if not width or memoryview(pixel_data).nbytes % (width * 3):
+                raise ValueError(f"Pixel data isn't whole rows of {width} pixels")
+
+            if dither == DITHER_FLOYD_STEINBERG:
+                return self._floyd_steinberg(pixel_data, width)
+
+            if dither != DITHER_ORDERED:
+                raise ValueError(f'Unknown dither: {dither}')
+
+            pixel_data = ordered_dither(pixel_data, width)
+
+        shift = 8 - CUBE_BITS
+        mask = (1 << CUBE_BITS) - 1
+        packed = packed_pixels(pixel_data)
+
+        if np is not None:
+            (red_shift, green_shift, blue_shift) = PACKED_SHIFTS
+            (colors, inverse) = np.unique(packed, return_inverse=True)
+            cells = (
+                ((colors >> (red_shift + shift)) & mask) << (CUBE_BITS * 2)
+                | ((colors >> (green_shift + shift)) & mask) << CUBE_BITS
+                | ((colors >> (blue_shift + shift)) & mask)
+            ).astype(np.int32)
+            self._lookup_cube(cells.tolist())
+            lut = np.frombuffer(self._cube, dtype=np.uint8)[cells]
+
+            # Override the cube with the exact matches
+            exact = sorted(
+                (int.from_bytes(bytes(color) + b'\0', sys.byteorder), index)
+                for color, index in self._exact.items()
+            )
+            keys = np.array([key for (key, _) in exact], dtype=np.uint32)
+            positions = np.searchsorted(keys, colors).clip(max=len(keys) - 1)
+            found = keys[positions] == colors
+            lut[found] = np.array([index for (_, index) in exact], dtype=np.uint8)[
+                positions[found]
+            ]
+
+            return lut[inverse.reshape(-1)].tobytes()
+
+        lut = {}
+        for color in set(packed):
+            (red, green, blue) = color.to_bytes(4, sys.byteorder)[:3]
+            lut[color] = (red >> shift) << (CUBE_BITS * 2) | (green >> shift) << CUBE_BITS | (
+                blue >> shift
+            )
+
+        self._lookup_cube(lut.values())
+
+        for color, cell in lut.items():
+            exact = self._exact.get(tuple(color.to_bytes(4, sys.byteorder)[:3]))
+            lut[color] = self._cube[cell] if exact is None else exact
+
+        return bytes(map(lut.__getitem__, packed))
+
+    def _floyd_steinberg(self: Self, pixel_data: Any, width: int) -> bytes:
+        """Map RGB pixel data onto palette indexes with Floyd-Steinberg dithering.
+
+        Args:
+            pixel_data: Raw RGB pixel data, whole rows of width pixels.
+            width: The width of the image in pixels.
+
+        Returns:
+            One palette index byte per pixel.
+        """
+        colors = self.surface_palette()
+        data = memoryview(pixel_data).cast('B')
+        stride = width * 3
+        shift = 8 - CUBE_BITS
+        self._lookup_cube(())
+
+        indexes = bytearray(data.nbytes // 3)
+        # The error carried into this row and the next, with a pixel of margin each side
+        errors = [0] * (stride + 6)
+        next_errors = [0] * (stride + 6)
+
+        for row in range(0, data.nbytes, stride):
+            values = data[row : row + stride].tolist()
+
+            for x in range(width):
+                offset = x * 3
+                (red, green, blue) = (
+                    min(255, max(0, values[offset + channel] + (errors[offset + 3 + channel] >> 4)))
+                    for channel in range(3)
+                )
+
+                index = self._exact.get((red, green, blue))
+                if index is None:
+                    cell = (red >> shift) << (CUBE_BITS * 2) | (green >> shift) << CUBE_BITS | (
+                        blue >> shift
+                    )
+                    if not self._cube_filled[cell]:
+                        self._fill_cube((cell,))
+                    index = self._cube[cell]
+
+                indexes[row // 3 + x] = index
+
+                # Spread the error right (7/16) and below left, below and below right (3, 5, 1)
+                for channel, value in enumerate((red, green, blue)):
+                    error = value - colors[index][channel]
+                    errors[offset + 6 + channel] += error * 7
+                    next_errors[offset + channel] += error * 3
+                    next_errors[offset + 3 + channel] += error * 5
+                    next_errors[offset + 6 + channel] += error
+
+            (errors, next_errors) = (next_errors, [0] * (stride + 6))
+
+        return bytes(indexes)
+
+    def quantize(self: Self, image: pygame.Surface, dither: str | None = None) -> pygame.Surface:
+        """Convert an image to an 8 bit surface of the nearest palette colors.
+
+        Args:
+            image: The image to convert.
+            dither: None, DITHER_ORDERED or DITHER_FLOYD_STEINBERG, see nearest_indexes().
+
+        Returns:
+            The 8 bit image, with the palette's colors as its palette.
+        """
+        (width, height) = image.get_size()
+        indexes = self.nearest_indexes(
+            pygame.image.tobytes(image, 'RGB'), width=width, dither=dither
+        )
+
+        return image_from_indexed(indexes, width, height, self.surface_palette())
+
+
+def ordered_dither(pixel_data: Any, width: int) -> bytearray:
+    """Add a 4x4 Bayer threshold pattern to RGB pixel data.
+
+    The thresholds run from -15 to +15, so mapping the result onto a
+    palette spreads neighbouring pixels between the nearest colors.
+
+    Args:
+        pixel_data: Raw RGB pixel data, whole rows of width pixels.
+        width: The width of the image in pixels.
+
+    Returns:
+        The dithered pixel data.
+    """
+    data = bytearray(pixel_data)
+    stride = width * 3
+    height = len(data) // stride if stride else 0
+
+    if np is not None:
+        view = pixel_view(data, (width, height)).astype(np.int16)
+        thresholds = np.array(BAYER_MATRIX, dtype=np.int16) * 2 - 15
+        pattern = np.tile(thresholds, ((height + 3) // 4, (width + 3) // 4))[:height, :width]
+        view += pattern[:, :, None]
+
+        return bytearray(np.clip(view, 0, 255).astype(np.uint8).tobytes())
+
+    # One saturating add table per threshold
+    tables = {
+        threshold: bytes(min(255, max(0, value + threshold * 2 - 15)) for value in range(256))
+        for threshold in range(16)
+    }
+
+    for row in range(0, len(data), stride):
+        thresholds = BAYER_MATRIX[(row // stride) % 4]
+
+        for column in range(4):
+            table = tables[thresholds[column]]
+            for channel in range(3):
+                pixels = slice(row + column * 3 + channel, row + stride, 12)
+                data[pixels] = data[pixels].translate(table)
+
+    return data
+
+
+@functools.cache
+def palette_table(filename: str) -> ColorTable | None:
+    """Find and parse a named palette, once per process.
+
+    The palette file is looked for in the built in palettes, then next
+    to the running script and in its resources directory.  If
+    GLITCHYGAMES_CACHE_DIR is set, the parsed colors are also saved
+    there as a color count followed by the raw R, G, B, A bytes, keyed
+    by the file's path, size and modification time, so later runs can
+    skip parsing it.  Cache files are written to a temporary file and
+    then renamed into place, and ones whose color count doesn't match
+    their data are ignored.
+
+    Args:
+        filename: The name of the palette, without the .palette extension.
+
+    Returns:
+        The palette's colors, or None if there's no such palette.  The
+        table is shared, so copy it before changing it.
+    """
+    script_path = Path(sys.argv[0]).parent
+    paths = [
+        ColorPalette._BUILTIN_PALETTE_LOCATION,
+        script_path,
+        Path(script_path) / 'resources',
+    ]
+
+    for path in paths:
+        file_path = Path(path) / f'{filename}.{ColorPalette._DEFAULT_EXTENSION}'
+        if Path.exists(file_path):
+            break
+    else:
+        LOG.warning(f'No {filename} palette found in {[str(path) for path in paths]}')
+        return None
+
+    cache_path: Path | None = None
+
+    if PALETTE_CACHE_DIR:
+        stat = file_path.stat()
+        key = hashlib.sha1(  # noqa: S324
+            f'{file_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}'.encode()
+        ).hexdigest()[:16]
+        cache_path = Path(PALETTE_CACHE_DIR) / f'palette-{filename}-{key}.rgba'
+
+        with contextlib.suppress(OSError, ValueError):
+            data = cache_path.read_bytes()
+            if int.from_bytes(data[:CACHE_HEADER_SIZE], 'little') * 4 == (
+                len(data) - CACHE_HEADER_SIZE
+            ):
+                return ColorTable(data[CACHE_HEADER_SIZE:])
+
+            LOG.warning(f'Ignoring truncated palette cache {cache_path}')
+
+    table = ColorTable.from_colors(PaletteUtility.load_palette_from_file(file_path))
+
+    if cache_path:
+        with contextlib.suppress(OSError):
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent, prefix=f'{cache_path.name}.', delete=False
+            ) as cache_file:
+                cache_file.write(len(table).to_bytes(CACHE_HEADER_SIZE, 'little') + table.data)
+
+            Path(cache_file.name).replace(cache_path)
+
+    return table
+
 
 class PaletteUtility:
     """Utility class for working with Glitchy Games palettes."""
@@ -149,14 +638,14 @@ class PaletteUtility:
             A list of PyGame Colors in the format list[tuple[R: int, G: int, B: int]].
         """
         # Read input RGBA Values from file.  No duplicates
-        colors = []
+        colors = {}
         with Path.open(rgb_data_file) as file_obj:
             for line in file_obj.readlines():
                 tmp = [int(x) for x in line.strip().split(',')]
                 color = Color(*tmp)
-                if color not in colors:
-                    colors.append(color)
-        return colors
+                # Colors aren't hashable, so key on their RGBA values
+                colors.setdefault(tuple(color), color)
+        return list(colors.values())
 
     @staticmethod
     def create_palette_data(colors: list) -> configparser.ConfigParser:
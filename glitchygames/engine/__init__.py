@@ -7,7 +7,9 @@ import argparse
 import contextlib
 import cProfile
 import logging
+import math
 import multiprocessing
+import os
 import platform
 import time
 from pathlib import Path
@@ -45,6 +47,29 @@ ASSET_PATH: Path = Path(__file__).parent / 'assets'
 TEST_MODE = False
 
 
+def positive_int(value: str) -> int:
+    """Parse a command line option that must be a whole number of at least 1.
+
+    Args:
+        value (str): The option's value.
+
+    Returns:
+        int: The value.
+
+    Raises:
+        argparse.ArgumentTypeError: The value isn't an integer of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'{value!r} is not an integer of at least 1')
+
+    return number
+
+
 class GameManager(events.ResourceManager):
     """Game event manager."""
 
@@ -215,6 +240,40 @@ class GameManager(events.ResourceManager):
         group.add_argument(
             '-p', '--profile', help='enable profiling', action='store_true', default=False
         )
+        group.add_argument(
+            '--benchmark',
+            help='run the game headless and uncapped for FRAMES frames, '
+            'then print frame timing statistics and exit',
+            metavar='FRAMES',
+            type=positive_int,
+            default=0,
+        )
+        group.add_argument(
+            '--coalesce-events',
+            help="collapse each frame's mouse, joystick and controller motion events "
+            'into one event per device and axis',
+            action='store_true',
+            default=False,
+        )
+        group.add_argument(
+            '--frame-timing-history',
+            help='how many frames of per-phase timing data to keep (default: 300)',
+            type=positive_int,
+            default=300,
+        )
+        group.add_argument(
+            '--tick-rate',
+            help='run the simulation at a fixed rate in Hz, independent of the '
+            'framerate (default: 0, one update per frame)',
+            type=float,
+            default=0.0,
+        )
+        group.add_argument(
+            '--max-ticks-per-frame',
+            help='the most fixed rate simulation ticks to run per frame (default: 5)',
+            type=positive_int,
+            default=5,
+        )
 
         return parser
 
@@ -254,7 +313,7 @@ class GameEngine(events.EventManager):
     # to the events module need to be accounted for here
     # if they're not already handled
     #
-    # These are wired up at the end of __init__()
+    # These are wired up by initialize_event_handlers() in start()
     EVENT_HANDLERS: ClassVar = {}
 
     @classmethod
@@ -456,6 +515,7 @@ class GameEngine(events.EventManager):
         self.windowed = options.get('windowed')
         self.desired_resolution = options.get('resolution')
         self.fps_refresh_rate = options.get('fps_refresh_rate')
+        self.coalesce_events = options.get('coalesce_events')
         self.pygame_version = {'major': 0, 'minor': 0, 'patch': 0}
 
         self.pygame_version['major'] = pygame.version.vernum[0]
@@ -468,6 +528,11 @@ class GameEngine(events.EventManager):
         if pygame.version.vernum[0] < 2 and pygame.version.vernum[1] < 2:  # noqa: PLR2004
             self.USE_FASTEVENTS = True
 
+        # Benchmarks need to run on machines without a display,
+        # so force SDL's dummy video driver before pygame initializes.
+        if options.get('benchmark'):
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
         # Initialize all of the Pygame modules.
         self.init_pass, self.init_fail = pygame.init()
         self.print_game_info()
@@ -510,8 +575,6 @@ class GameEngine(events.EventManager):
         # Initialize display
         self.initialize_display()
 
-        self.initialize_event_handlers()
-
         self.print_system_info()
 
     def initialize_display(self: Self) -> None:
@@ -534,7 +597,12 @@ class GameEngine(events.EventManager):
             self.display_info.current_h,
         )
 
-        self.cursor: list[str] = self.set_cursor(cursor=None)
+        try:
+            self.cursor: list[str] = self.set_cursor(cursor=None)
+        except pygame.error:
+            # The dummy video driver doesn't support cursors
+            self.log.warning(f'Cursors not supported by {pygame.display.get_driver()}.')
+            self.cursor = None
 
         # Set the screen update type.
         if self.scene_manager.update_type == 'update':
@@ -554,13 +622,14 @@ class GameEngine(events.EventManager):
     def initialize_event_handlers(self: Self) -> None:
         """Initialize event handlers.
 
-        The engine calls this on your behalf.
+        The engine calls this on your behalf once the event managers exist.
 
         Event subsystem bootstrapping
 
-        This gives us much faster event processing than
-        doing a lookup every time an event comes in since
-        we can just call the processing function directly.
+        This builds a single table which maps each pygame event
+        type straight to the bound manager method that handles it,
+        so dispatching an event costs one dict lookup and one call
+        instead of a chain of event type comparisons.
 
         It's not as fast as a raw pygame event loop,
         but since we layer richer event types on top of
@@ -570,17 +639,66 @@ class GameEngine(events.EventManager):
         Returns:
             None
         """
-        for event_type in events.AUDIO_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_audio_event
+        GameEngine.EVENT_HANDLERS.clear()
+
+        self.register_event_handlers(
+            manager=self.audio_manager,
+            handlers={
+                # AUDIODEVICEADDED   which, iscapture
+                pygame.AUDIODEVICEADDED: 'on_audio_device_added_event',
+                # AUDIODEVICEREMOVED which, iscapture
+                pygame.AUDIODEVICEREMOVED: 'on_audio_device_removed_event',
+            },
+        )
 
         for event_type in events.MIDI_EVENTS:
             GameEngine.EVENT_HANDLERS[event_type] = self.process_midi_event
 
-        for event_type in events.WINDOW_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_window_event
+        self.register_event_handlers(
+            manager=self.window_manager,
+            handlers={
+                pygame.WINDOWCLOSE: 'on_window_close_event',
+                pygame.WINDOWENTER: 'on_window_enter_event',
+                pygame.WINDOWEXPOSED: 'on_window_exposed_event',
+                pygame.WINDOWFOCUSGAINED: 'on_window_focus_gained_event',
+                pygame.WINDOWFOCUSLOST: 'on_window_focus_lost_event',
+                pygame.WINDOWHIDDEN: 'on_window_hidden_event',
+                pygame.WINDOWHITTEST: 'on_window_hit_test_event',
+                pygame.WINDOWLEAVE: 'on_window_leave_event',
+                pygame.WINDOWMAXIMIZED: 'on_window_maximized_event',
+                pygame.WINDOWMINIMIZED: 'on_window_minimized_event',
+                pygame.WINDOWMOVED: 'on_window_moved_event',
+                pygame.WINDOWRESIZED: 'on_window_resized_event',
+                pygame.WINDOWRESTORED: 'on_window_restored_event',
+                pygame.WINDOWSHOWN: 'on_window_shown_event',
+                pygame.WINDOWSIZECHANGED: 'on_window_size_changed_event',
+                pygame.WINDOWTAKEFOCUS: 'on_window_take_focus_event',
+            },
+        )
 
-        for event_type in events.GAME_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_game_event
+        self.register_event_handlers(
+            manager=self.game_manager,
+            handlers={
+                # FPSEVENT is pygame.USEREVENT + 1
+                events.FPSEVENT: 'on_fps_event',
+                # GAMEEVENT is pygame.USEREVENT + 2
+                events.GAMEEVENT: 'on_game_event',
+                # MENUEVENT is pygame.USEREVENT + 3
+                events.MENUEVENT: 'on_menu_item_event',
+                # ACTIVEEVENT      gain, state
+                pygame.ACTIVEEVENT: 'on_active_event',
+                # USEREVENT        code
+                pygame.USEREVENT: 'on_user_event',
+                # VIDEORESIZE      size, w, h
+                pygame.VIDEORESIZE: 'on_video_resize_event',
+                # VIDEOEXPOSE      none
+                pygame.VIDEOEXPOSE: 'on_video_expose_event',
+                # SYSWMEVENT
+                pygame.SYSWMEVENT: 'on_sys_wm_event',
+                # QUIT             none
+                pygame.QUIT: 'on_quit_event',
+            },
+        )
 
         self.initialize_input_event_handlers()
 
@@ -594,27 +712,103 @@ class GameEngine(events.EventManager):
         Returns:
             None
         """
-        for event_type in events.CONTROLLER_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_controller_event
+        self.register_event_handlers(
+            manager=self.controller_manager,
+            handlers={
+                pygame.CONTROLLERAXISMOTION: 'on_controller_axis_motion_event',
+                pygame.CONTROLLERTOUCHPADMOTION: 'on_controller_touchpad_motion_event',
+                pygame.CONTROLLERBUTTONDOWN: 'on_controller_button_down_event',
+                pygame.CONTROLLERBUTTONUP: 'on_controller_button_up_event',
+                pygame.CONTROLLERTOUCHPADDOWN: 'on_controller_touchpad_down_event',
+                pygame.CONTROLLERTOUCHPADUP: 'on_controller_touchpad_up_event',
+                pygame.CONTROLLERDEVICEREMOVED: 'on_controller_device_removed_event',
+                pygame.CONTROLLERDEVICEADDED: 'on_controller_device_added_event',
+                pygame.CONTROLLERDEVICEREMAPPED: 'on_controller_device_remapped_event',
+            },
+        )
 
-        for event_type in events.DROP_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_drop_event
+        self.register_event_handlers(
+            manager=self.drop_manager,
+            handlers={
+                pygame.DROPBEGIN: 'on_drop_begin_event',
+                pygame.DROPCOMPLETE: 'on_drop_complete_event',
+                pygame.DROPFILE: 'on_drop_file_event',
+                pygame.DROPTEXT: 'on_drop_text_event',
+            },
+        )
 
-        for event_type in events.TOUCH_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_touch_event
+        self.register_event_handlers(
+            manager=self.touch_manager,
+            handlers={
+                pygame.FINGERDOWN: 'on_touch_down_event',
+                pygame.FINGERUP: 'on_touch_up_event',
+                pygame.FINGERMOTION: 'on_touch_motion_event',
+            },
+        )
 
-        for event_type in events.JOYSTICK_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_joystick_event
+        self.register_event_handlers(
+            manager=self.joystick_manager,
+            handlers={
+                # JOYAXISMOTION    joy, axis, value
+                pygame.JOYAXISMOTION: 'on_joy_axis_motion_event',
+                # JOYBALLMOTION    joy, ball, rel
+                pygame.JOYBALLMOTION: 'on_joy_ball_motion_event',
+                # JOYHATMOTION     joy, hat, value
+                pygame.JOYHATMOTION: 'on_joy_hat_motion_event',
+                # JOYBUTTONUP      joy, button
+                pygame.JOYBUTTONUP: 'on_joy_button_up_event',
+                # JOYBUTTONDOWN    joy, button
+                pygame.JOYBUTTONDOWN: 'on_joy_button_down_event',
+                pygame.JOYDEVICEADDED: 'on_joy_device_added_event',
+                pygame.JOYDEVICEREMOVED: 'on_joy_device_removed_event',
+            },
+        )
 
-        for event_type in events.KEYBOARD_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_keyboard_event
+        self.register_event_handlers(
+            manager=self.keyboard_manager,
+            handlers={
+                # KEYDOWN          unicode, key, mod
+                pygame.KEYDOWN: 'on_key_down_event',
+                # KEYUP            key, mod
+                pygame.KEYUP: 'on_key_up_event',
+            },
+        )
 
-        for event_type in events.MOUSE_EVENTS:
-            GameEngine.EVENT_HANDLERS[event_type] = self.process_mouse_event
+        self.register_event_handlers(
+            manager=self.mouse_manager,
+            handlers={
+                # MOUSEMOTION      pos, rel, buttons
+                pygame.MOUSEMOTION: 'on_mouse_motion_event',
+                # MOUSEBUTTONUP    pos, button
+                pygame.MOUSEBUTTONUP: 'on_mouse_button_up_event',
+                # MOUSEBUTTONDOWN  pos, button
+                pygame.MOUSEBUTTONDOWN: 'on_mouse_button_down_event',
+                pygame.MOUSEWHEEL: 'on_mouse_wheel_event',
+            },
+        )
 
         for event_type in events.TEXT_EVENTS:
             GameEngine.EVENT_HANDLERS[event_type] = self.process_text_event
 
+    @classmethod
+    def register_event_handlers(
+        cls, manager: events.ResourceManager, handlers: dict[int, str]
+    ) -> None:
+        """Map pygame event types to a manager's event handlers.
+
+        Each handler is looked up through the manager's proxies once,
+        here, so the bound method can be called directly for every event.
+
+        Args:
+            manager (events.ResourceManager): The event manager.
+            handlers (dict[int, str]): The handler method name for each event type.
+
+        Returns:
+            None
+        """
+        for event_type, handler in handlers.items():
+            cls.EVENT_HANDLERS[event_type] = getattr(manager, handler)
+
     def __del__(self: Self) -> None:
         """Delete the game engine.
 
@@ -860,6 +1054,8 @@ class GameEngine(events.EventManager):
             self.mouse_manager = MouseManager(game=self.scene_manager)
             self.window_manager = WindowManager(game=self.scene_manager)
 
+            self.initialize_event_handlers()
+
             # Get count of joysticks
             self.joysticks = []
             if self.joystick_manager:
@@ -868,6 +1064,9 @@ class GameEngine(events.EventManager):
 
             self.scene_manager.switch_to_scene(self.game)
             self.scene_manager.start()
+
+            if GameEngine.OPTIONS['benchmark']:
+                self.print_benchmark_report()
         except Exception:
             self.log.exception('Error starting game.')
         finally:
@@ -878,174 +1077,111 @@ class GameEngine(events.EventManager):
                 profiler.disable()
                 profiler.print_stats()
 
+    def print_benchmark_report(self: Self) -> None:
+        """Print the frame timing statistics collected by --benchmark.
+
+        Returns:
+            None
+        """
+        frame_times: list[float] = sorted(
+            timing['frame'] for timing in self.scene_manager.recent_frame_timings()
+        )
+        frame_count: int = len(frame_times)
+
+        if not frame_count:
+            self.log.error('No frames were rendered during the benchmark.')
+            return
+
+        summary: dict[str, dict[str, float]] = self.scene_manager.frame_timing_summary()
+        total_time: float = summary['frame']['total']
+
+        def percentile(percent: float) -> float:
+            # Nearest-rank percentile
+            return frame_times[max(0, math.ceil(percent / 100 * frame_count) - 1)]
+
+        report: list[str] = [
+            f'Benchmark: {type(self.game).NAME} v{type(self.game).VERSION}',
+            f'Frames: {frame_count} in {total_time:.3f}s ({frame_count / total_time:.1f} FPS)',
+            f'Frame time p50: {percentile(50) * 1000:.3f} ms',
+            f'Frame time p95: {percentile(95) * 1000:.3f} ms',
+            f'Frame time p99: {percentile(99) * 1000:.3f} ms',
+            f'Frame time max: {frame_times[-1] * 1000:.3f} ms',
+            f'{"Phase":<16} {"Total (ms)":>12} {"Per Frame (ms)":>16} {"Share":>8}',
+        ]
+
+        for phase in self.scene_manager.PHASES:
+            phase_time: float = summary[phase]['total']
+            report.append(
+                f'{phase:<16} {phase_time * 1000:>12.3f} '
+                f'{phase_time * 1000 / frame_count:>16.3f} {phase_time / total_time:>8.1%}'
+            )
+
+        print('\n'.join(report))  # noqa: T201
+
     @classmethod
     def quit_game(cls) -> None:
         """Quit the game.
 
-        Emits a events.HashableEvent(pygame.QUIT, {}) event.
+        Emits a pygame.QUIT event.
 
         Returns:
             None
         """
         # put a quit event in the event queue.
-        pygame.event.post(events.HashableEvent(pygame.QUIT, {}))
+        pygame.event.post(pygame.event.Event(pygame.QUIT, {}))
 
     def process_events(self: Self) -> bool:
         """Process events.
 
+        Every event pulled from the queue is processed, even if
+        some of them have no handler.  With --coalesce-events,
+        runs of high frequency motion events are first collapsed
+        by events.coalesce_events().
+
         Returns:
-            bool: True if the event was handled, False otherwise.
+            bool: True if all of the events were handled, False otherwise.
         """
         event_was_handled = False
         # To use events in a different thread, use the fastevent package from pygame.
         # if you're using pygame < 2.2, you'll need to use pygame.fastevent.
         # if you're using pygame >= 2.2, you can use the new pygame.event.
-        # You can create your own new events with the events.HashableEvent() object type.
+        # You can create your own new events with the pygame.event.Event() object type.
         pump_events = pygame.event.get
 
         if self.USE_FASTEVENTS:
             pump_events = pygame.fastevent.get
 
-        for raw_event in pump_events():
-            # Support scenes processing pygame raw events, bypassing
-            # the glitchygames.engine event processing altogether
-            if hasattr(self._active_scene, 'process_event'):
-                self._active_scene.process_event(raw_event)
-                return True
-
-            event: events.HashableEvent = events.HashableEvent(type=raw_event.type)
-            event.__dict__.update(raw_event.dict)
+        raw_events: list[pygame.event.Event] = pump_events()
 
-            if event.type in GameEngine.EVENT_HANDLERS:
-                event_was_handled = GameEngine.EVENT_HANDLERS[event.type](event)
+        if self.coalesce_events:
+            raw_events = events.coalesce_events(raw_events)
 
-            # If an event is in the event handler map, but the function
-            # called didn't handle the event in question, we'll process it
-            # as an uinimplemented event
-            if not event_was_handled:
-                self.process_unimplemented_event(event)
-                return False
-
-        return event_was_handled
-
-    def process_audio_event(self: Self, event: events.HashableEvent) -> bool:
-        """Process an audio event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.AUDIODEVICEADDED:
-            # AUDIODEVICEADDED which, iscapture
-            self.audio_manager.on_audio_device_added_event(event)
-            return True
-
-        if event.type == pygame.AUDIODEVICEREMOVED:
-            # AUDIODEVICEREMOVED which, iscapture
-            self.audio_manager.on_audio_device_removed_event(event)
-            return True
-
-        return False
-
-    def process_controller_event(self: Self, event: events.HashableEvent) -> bool:
-        """Process a controller event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.CONTROLLERAXISMOTION:
-            self.controller_manager.on_controller_axis_motion_event(event)
-            return True
-
-        if event.type == pygame.CONTROLLERTOUCHPADMOTION:
-            self.controller_manager.on_controller_touchpad_motion_event(event)
-            return True
-
-        if event.type == pygame.CONTROLLERBUTTONDOWN:
-            self.controller_manager.on_controller_button_down_event(event)
-            return True
-
-        if event.type == pygame.CONTROLLERBUTTONUP:
-            self.controller_manager.on_controller_button_up_event(event)
-            return True
-
-        if event.type == pygame.CONTROLLERTOUCHPADDOWN:
-            self.controller_manager.on_controller_touchpad_down_event(event)
-            return True
-
-        if event.type == pygame.CONTROLLERTOUCHPADUP:
-            self.controller_manager.on_controller_touchpad_up_event(event)
-            return True
-
-        if event.type == pygame.CONTROLLERDEVICEREMOVED:
-            self.controller_manager.on_controller_device_removed_event(event)
-            return True
-
-        if event.type == pygame.CONTROLLERDEVICEADDED:
-            self.controller_manager.on_controller_device_added_event(event)
-            return True
-
-        if event.type == pygame.CONTROLLERDEVICEREMAPPED:
-            self.controller_manager.on_controller_device_remapped_event(event)
-            return True
-
-        # We haven't handled this event, so let's see if it's a controller init event
-        return False
-
-    def process_drop_event(self: Self, event: events.HashableEvent) -> bool:
-        """Process a drop event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.DROPBEGIN:
-            self.drop_manager.on_drop_begin_event(event)
-            return True
-
-        if event.type == pygame.DROPCOMPLETE:
-            self.drop_manager.on_drop_complete_event(event)
-            return True
+        # Support scenes processing pygame raw events, bypassing
+        # the glitchygames.engine event processing altogether
+        if hasattr(self._active_scene, 'process_event'):
+            for raw_event in raw_events:
+                self._active_scene.process_event(raw_event)
 
-        if event.type == pygame.DROPFILE:
-            self.drop_manager.on_drop_file_event(event)
             return True
 
-        if event.type == pygame.DROPTEXT:
-            self.drop_manager.on_drop_text_event(event)
-            return True
+        events_were_unhandled = False
 
-        return False
+        for raw_event in raw_events:
+            event: events.HashableEvent = events.HashableEvent.from_event(raw_event)
 
-    def process_touch_event(self: Self, event: events.HashableEvent) -> bool:
-        """Process a touch event.
+            event_handler: Callable | None = GameEngine.EVENT_HANDLERS.get(event.type)
 
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.FINGERDOWN:
-            self.touch_manager.on_touch_down_event(event)
-            return True
-
-        if event.type == pygame.FINGERUP:
-            self.touch_manager.on_touch_up_event(event)
-            return True
+            # If an event isn't in the event handler map,
+            # we'll process it as an unimplemented event
+            if event_handler is None:
+                self.process_unimplemented_event(event)
+                events_were_unhandled = True
+                continue
 
-        if event.type == pygame.FINGERMOTION:
-            self.touch_manager.on_touch_motion_event(event)
-            return True
+            event_handler(event)
+            event_was_handled = True
 
-        return False
+        return event_was_handled and not events_were_unhandled
 
     def process_midi_event(self: Self, event: events.HashableEvent) -> bool:
         """Process a midi event.
@@ -1066,101 +1202,6 @@ class GameEngine(events.EventManager):
 
         return False
 
-    def process_mouse_event(self: Self, event: events.HashableEvent) -> bool:
-        """Process a mouse event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.MOUSEMOTION:
-            # MOUSEMOTION      pos, rel, buttons
-            self.mouse_manager.on_mouse_motion_event(event)
-            return True
-
-        if event.type == pygame.MOUSEBUTTONUP:
-            # MOUSEBUTTONUP    pos, button
-            self.mouse_manager.on_mouse_button_up_event(event)
-            return True
-
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            # MOUSEBUTTONDOWN  pos, button
-            self.mouse_manager.on_mouse_button_down_event(event)
-            return True
-
-        if event.type == pygame.MOUSEWHEEL:
-            self.mouse_manager.on_mouse_wheel_event(event)
-            return True
-
-        return False
-
-    def process_keyboard_event(self: Self, event: events.HashableEvent) -> bool:
-        """Process a keyboard event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.KEYDOWN:
-            # KEYDOWN          unicode, key, mod
-            self.keyboard_manager.on_key_down_event(event)
-            return True
-
-        if event.type == pygame.KEYUP:
-            # KEYUP            key, mod
-            self.keyboard_manager.on_key_up_event(event)
-            return True
-
-        return False
-
-    def process_joystick_event(self: Self, event: events.HashableEvent) -> bool:
-        """Process a joystick event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.JOYAXISMOTION:
-            # JOYAXISMOTION    joy, axis, value
-            self.joystick_manager.on_joy_axis_motion_event(event)
-            return True
-
-        if event.type == pygame.JOYBALLMOTION:
-            # JOYBALLMOTION    joy, ball, rel
-            self.joystick_manager.on_joy_ball_motion_event(event)
-            return True
-
-        if event.type == pygame.JOYHATMOTION:
-            # JOYHATMOTION     joy, hat, value
-            self.joystick_manager.on_joy_hat_motion_event(event)
-            return True
-
-        if event.type == pygame.JOYBUTTONUP:
-            # JOYBUTTONUP      joy, button
-            self.joystick_manager.on_joy_button_up_event(event)
-            return True
-
-        if event.type == pygame.JOYBUTTONDOWN:
-            # JOYBUTTONDOWN    joy, button
-            self.joystick_manager.on_joy_button_down_event(event)
-            return True
-
-        if event.type == pygame.JOYDEVICEADDED:
-            self.joystick_manager.on_joy_device_added_event(event)
-            return True
-
-        if event.type == pygame.JOYDEVICEREMOVED:
-            self.joystick_manager.on_joy_device_removed_event(event)
-            return True
-
-        return False
-
     def process_text_event(self: Self, event: events.HashableEvent) -> None:
         """Process a text event.
 
@@ -1180,183 +1221,6 @@ class GameEngine(events.EventManager):
 
         return False
 
-    def process_window_focus_event(self: Self, event: events.HashableEvent) -> bool:
-        """Process a window focus event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.WINDOWSHOWN:
-            self.window_manager.on_window_shown_event(event)
-            return True
-
-        if event.type == pygame.WINDOWLEAVE:
-            self.window_manager.on_window_leave_event(event)
-            return True
-
-        if event.type == pygame.WINDOWFOCUSGAINED:
-            self.window_manager.on_window_focus_gained_event(event)
-            return True
-
-        if event.type == pygame.WINDOWFOCUSLOST:
-            self.window_manager.on_window_focus_lost_event(event)
-            return True
-
-        if event.type == pygame.WINDOWENTER:
-            self.window_manager.on_window_enter_event(event)
-            return True
-
-        if event.type == pygame.WINDOWTAKEFOCUS:
-            self.window_manager.on_window_take_focus_event(event)
-            return True
-
-        return False
-
-    def process_window_event(self: Self, event: events.HashableEvent) -> None:  # noqa: PLR0912
-        """Process a window event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type == pygame.WINDOWSIZECHANGED:
-            # WINDOWSIZECHANGED x, y
-            self.window_manager.on_window_size_changed_event(event)
-            return True
-
-        if event.type == pygame.WINDOWRESTORED:
-            self.window_manager.on_window_restored_event(event)
-            return True
-
-        if event.type == pygame.WINDOWHITTEST:
-            self.window_manager.on_window_hit_test_event(event)
-            return True
-
-        if event.type == pygame.WINDOWHIDDEN:
-            # WINDOWHIDDEN x, y
-            self.window_manager.on_window_hidden_event(event)
-            return True
-
-        if event.type == pygame.WINDOWMINIMIZED:
-            # WINDOWMINIMIZED x, y
-            self.window_manager.on_window_minimized_event(event)
-            return True
-
-        if event.type == pygame.WINDOWMAXIMIZED:
-            # WINDOWMAXIMIZED x, y
-            self.window_manager.on_window_maximized_event(event)
-            return True
-
-        if event.type == pygame.WINDOWMOVED:
-            # WINDOWMOVED x, y
-            self.window_manager.on_window_moved_event(event)
-            return True
-
-        if event.type == pygame.WINDOWCLOSE:
-            # WINDOWCLOSE
-            self.window_manager.on_window_close_event(event)
-            return True
-
-        if event.type == pygame.WINDOWEXPOSED:
-            self.window_manager.on_window_exposed_event(event)
-            return True
-
-        if event.type == pygame.WINDOWFOCUSLOST:
-            # WINDOWFOCUSLOST
-            self.window_manager.on_window_focus_lost_event(event)
-            return True
-
-        if event.type == pygame.WINDOWFOCUSGAINED:
-            # WINDOWFOCUSGAINED
-            self.window_manager.on_window_focus_gained_event(event)
-            return True
-
-        if event.type == pygame.WINDOWRESIZED:
-            # WINDOWRESIZED x, y
-            self.window_manager.on_window_resized_event(event)
-            return True
-
-        if event.type == pygame.WINDOWLEAVE:
-            # WINDOWLEAVE
-            self.window_manager.on_window_leave_event(event)
-            return True
-
-        if event.type == pygame.WINDOWENTER:
-            # WINDOWENTER
-            self.window_manager.on_window_enter_event(event)
-            return True
-
-        if event.type == pygame.WINDOWSHOWN:
-            # WINDOWSHOWN
-            self.window_manager.on_window_shown_event(event)
-            return True
-
-        return False
-
-    def process_game_event(self: Self, event: events.HashableEvent) -> None:
-        """Process a game event.
-
-        Args:
-            event (events.HashableEvent): The event.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        # Game events are listed in the order they're most
-        # likely to occur in.
-        match event.type:
-            case events.FPSEVENT:
-                # FPSEVENT is pygame.USEREVENT + 1
-                self.game_manager.on_fps_event(event)
-                return True
-
-            case events.GAMEEVENT:
-                # GAMEEVENT is pygame.USEREVENT + 2
-                self.game_manager.on_game_event(event)
-                return True
-
-            case events.MENUEVENT:
-                # MENUEVENT is pygame.USEREVENT + 3
-                self.game_manager.on_menu_item_event(event)
-                return True
-
-            case pygame.ACTIVEEVENT:
-                # ACTIVEEVENT      gain, state
-                self.game_manager.on_active_event(event)
-                return True
-
-            case pygame.USEREVENT:
-                # USEREVENT        code
-                self.game_manager.on_user_event(event)
-                return True
-
-            case pygame.VIDEORESIZE:
-                # VIDEORESIZE      size, w, h
-                self.game_manager.on_video_resize_event(event)
-                return True
-
-            case pygame.VIDEOEXPOSE:
-                # VIDEOEXPOSE      none
-                self.game_manager.on_video_expose_event(event)
-                return True
-
-            case pygame.SYSWMEVENT:
-                # SYSWMEVENT
-                self.game_manager.on_sys_wm_event(event)
-                return True
-
-            case pygame.QUIT:
-                # QUIT             none
-                self.game_manager.on_quit_event(event)
-                return True
-
-        return False
-
     def process_unimplemented_event(self: Self, event: events.HashableEvent) -> None:
         """Process an unimplemented event.
 
@@ -1384,9 +1248,9 @@ class GameEngine(events.EventManager):
         Returns:
             None
         """
-        event: events.HashableEvent = event_data.copy()
+        event: dict = event_data.copy()
         event['subtype'] = event_subtype
-        pygame.event.post(events.HashableEvent(events.GAMEEVENT, event))
+        pygame.event.post(pygame.event.Event(events.GAMEEVENT, event))
         self.log.debug(f'Posted Event: {event}')
 
     def suppress_event(self: Self, *args: list, attr: str, **kwargs: dict) -> None:
@@ -1463,6 +1327,12 @@ class GameEngine(events.EventManager):
         if attr.startswith('on_') and attr.endswith('_event'):
             self.LAST_EVENT_MISS: str = attr
 
-            return self.missing_event
+            # Managers memoize the handlers they resolve, so the
+            # handler needs to remember which event it stands in for.
+            def missing_event(*args: list, **kwargs: dict) -> None:
+                self.LAST_EVENT_MISS = attr
+                return self.missing_event(*args, **kwargs)
+
+            return missing_event
 
         raise AttributeError(f"'{type(self)}' object has no attribute '{attr}'")
@@ -14,17 +14,22 @@ followed by a mouse button up event.
 from __future__ import annotations
 
 import abc
+import contextlib
 import functools
 import inspect
+import json
 import logging
+import os
 import re
 import sys
+import tempfile
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, NoReturn, Self
 
 import pygame
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from glitchygames.scenes import Scene
 
@@ -33,27 +38,45 @@ LOG: logging.Logger = logging.getLogger('game.events')
 LOG.addHandler(logging.NullHandler())
 
 
-def supported_events(like: str = '.*') -> list:
-    """Return a list of supported events.
+# Set GLITCHYGAMES_CACHE_DIR to persist the event table between runs
+EVENT_CACHE_DIR: str | None = os.environ.get('GLITCHYGAMES_CACHE_DIR')
 
-    This method is crucial for allowing the game engine
-    to support both older versions of pygame and newer
-    versions.  It allows us to enumerate supported pygame
-    events and initialize them dynamically.
 
-    This ensures that the game engine will work with
-    many versions of pygame.
-
-    We enumerate all pygame event IDs and then use the pygame.event.event_name()
-    method to get the event name.  We then use a regular expression to
-    match the event name against the like parameter.
+@functools.cache
+def event_table() -> dict[str, int]:
+    """Return every pygame event type, keyed by event name.
 
-    Args:
-        like: A regular expression to match against the event names.
+    Enumerating the events means calling pygame.event.event_name()
+    on every event ID, so this is only done once per process.  If
+    GLITCHYGAMES_CACHE_DIR is set, the table is also saved there,
+    keyed by the pygame and SDL versions, so later runs can skip
+    the enumeration entirely.  The cache is written to a temporary
+    file and renamed into place, so other processes never see it half
+    written.
 
     Returns:
-        A list of pygame events whose names match the regular expression.
+        A dict of event names to pygame event types.
     """
+    cache_path: Path | None = None
+
+    if EVENT_CACHE_DIR:
+        sdl_version: str = '.'.join(str(part) for part in pygame.get_sdl_version())
+        cache_path = (
+            Path(EVENT_CACHE_DIR) / f'events-pygame-{pygame.version.ver}-sdl-{sdl_version}.json'
+        )
+
+        with contextlib.suppress(OSError, ValueError):
+            table = json.loads(cache_path.read_text())
+
+            if (
+                table
+                and isinstance(table, dict)
+                and all(type(event_type) is int for event_type in table.values())
+            ):
+                return table
+
+            LOG.warning(f'Ignoring malformed event table cache {cache_path}')
+
     # Get a list of all of the events
     # by name, but ignore duplicates.
     event_names = (pygame.event.event_name(event_num) for event_num in range(pygame.NUMEVENTS))
@@ -83,19 +106,54 @@ def supported_events(like: str = '.*') -> list:
         'UNKNOWN': 'K_UNKNOWN',
     }
 
-    event_list = []
+    table: dict[str, int] = {}
 
-    for event_name in list(event_names):
+    for event_name in sorted(event_names):
         # If there's a patched event name, use it, otherwise use event_name
         #
         # This works around a pygame bug for CONTROLLERDEVICEREMAPPED
-        patched_event_name = patched_event_names.get(event_name.upper(), event_name)
-        LOG.info(f'Adding Event: {patched_event_name}')
+        patched_event_name = patched_event_names.get(event_name.upper(), event_name).upper()
+        table[patched_event_name] = getattr(pygame, patched_event_name)
+
+    LOG.debug(f'Supported Events: {sorted(table)}')
 
-        if re.match(like, patched_event_name.upper()):
-            event_list.append(getattr(pygame, patched_event_name.upper()))
+    if cache_path:
+        with contextlib.suppress(OSError):
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=cache_path.parent, prefix=f'{cache_path.name}.', delete=False
+            ) as cache_file:
+                json.dump(table, cache_file)
 
-    return event_list
+            Path(cache_file.name).replace(cache_path)
+
+    return table
+
+
+def supported_events(like: str = '.*') -> list:
+    """Return a list of supported events.
+
+    This method is crucial for allowing the game engine
+    to support both older versions of pygame and newer
+    versions.  It allows us to enumerate supported pygame
+    events and initialize them dynamically.
+
+    This ensures that the game engine will work with
+    many versions of pygame.
+
+    The event names come from event_table(), which enumerates
+    the pygame event IDs once.  We then use a regular expression
+    to match the event name against the like parameter.
+
+    Args:
+        like: A regular expression to match against the event names.
+
+    Returns:
+        A list of pygame events whose names match the regular expression.
+    """
+    return [
+        event_type for event_name, event_type in event_table().items() if re.match(like, event_name)
+    ]
 
 
 # Pygame USEREVENTs
@@ -131,6 +189,66 @@ GAME_EVENTS = list(
 GAME_EVENTS.extend([FPSEVENT, GAMEEVENT, MENUEVENT])
 
 
+def coalesce_events(raw_events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+    """Collapse redundant high frequency motion events.
+
+    Within each run of motion events, only the latest MOUSEMOTION,
+    and the latest JOYAXISMOTION and CONTROLLERAXISMOTION for each
+    device and axis, are kept.  The rel deltas of collapsed
+    MOUSEMOTION and JOYBALLMOTION events are accumulated so no
+    relative movement is lost.
+
+    Any other event ends the run, so motion is never reordered
+    relative to button presses, key presses, and so on.
+
+    Args:
+        raw_events: The pygame events pulled from the queue this frame.
+
+    Returns:
+        The coalesced list of pygame events.
+    """
+    coalesced_events: list[pygame.event.Event] = []
+
+    # Pending motion events for the current run, keyed by (type, device, axis)
+    pending: dict[tuple, pygame.event.Event] = {}
+    pending_rel: dict[tuple, tuple] = {}
+
+    def flush() -> None:
+        for key, event in pending.items():
+            rel: tuple | None = pending_rel.get(key)
+
+            if rel is not None and rel != tuple(event.rel):
+                event = pygame.event.Event(event.type, {**event.dict, 'rel': rel})  # noqa: PLW2901
+
+            coalesced_events.append(event)
+
+        pending.clear()
+        pending_rel.clear()
+
+    for event in raw_events:
+        if event.type == pygame.MOUSEMOTION:
+            key: tuple = (event.type,)
+        elif event.type == pygame.JOYBALLMOTION:
+            key = (event.type, getattr(event, 'instance_id', None), event.ball)
+        elif event.type in {pygame.JOYAXISMOTION, pygame.CONTROLLERAXISMOTION}:
+            key = (event.type, getattr(event, 'instance_id', None), event.axis)
+        else:
+            flush()
+            coalesced_events.append(event)
+            continue
+
+        if event.type in {pygame.MOUSEMOTION, pygame.JOYBALLMOTION}:
+            previous_rel: tuple = pending_rel.get(key, (0, 0))
+            pending_rel[key] = (previous_rel[0] + event.rel[0], previous_rel[1] + event.rel[1])
+
+        # Re-inserting keeps the run's first position, but updates the event
+        pending[key] = event
+
+    flush()
+
+    return coalesced_events
+
+
 def dump_cache_info(func: Callable, *args: list, **kwargs: dict) -> Callable[..., None]:  # noqa: ARG001
     """Dump the cache info for a function."""
 
@@ -260,6 +378,47 @@ class ResourceManager:
         super().__init__()
         self.proxies = []
 
+        # New proxies may change how handlers resolve anywhere in the chain
+        ResourceManager.invalidate_resolved_handlers()
+
+    @classmethod
+    def invalidate_resolved_handlers(cls: Any) -> None:
+        """Forget every memoized on_*_event handler.
+
+        Resolved handlers are cached on each manager by resolve_handler(),
+        and resolution can pass through several managers, so a change to
+        any manager's proxies invalidates the handlers of every manager.
+
+        Returns:
+            None
+        """
+        for instance in ResourceManager.__instances__.values():
+            for attr in instance.__dict__.pop('resolved_handlers', ()):
+                instance.__dict__.pop(attr, None)
+
+    def resolve_handler(self: Self, attr: str, handler: object) -> object:
+        """Memoize a resolved on_*_event handler.
+
+        The handler is stored as an instance attribute, so later
+        lookups find it directly instead of going through __getattr__()
+        and the proxy chain again.
+
+        Other attributes aren't memoized since they may be state
+        which changes on the proxy.
+
+        Args:
+            attr: The attribute that was resolved.
+            handler: The resolved attribute.
+
+        Returns:
+            The resolved attribute.
+        """
+        if attr.startswith('on_') and attr.endswith('_event') and callable(handler):
+            self.__dict__[attr] = handler
+            self.__dict__.setdefault('resolved_handlers', set()).add(attr)
+
+        return handler
+
     def __getattr__(self: Self, attr: str) -> Callable:
         """Get an attribute.
 
@@ -277,7 +436,7 @@ class ResourceManager:
         # Try each proxy in turn
         try:
             for proxy in self.proxies:
-                return getattr(proxy, attr)
+                return self.resolve_handler(attr, getattr(proxy, attr))
         except AttributeError:
             self.log.exception(f'No proxies for {type(self)}.{attr}')
             raise
@@ -285,8 +444,8 @@ class ResourceManager:
         raise AttributeError(f'No proxies for {type(self)}.{attr}')
 
 
-# Note, we can't subclass HashableEvent because it's a C type.
-class HashableEvent(dict):
+# Note, we can't subclass pygame.event.Event because it's a C type.
+class HashableEvent:
     """Hashable event class.
 
     Hashable events are cacheable, so we can mitigate some of the
@@ -297,92 +456,149 @@ class HashableEvent(dict):
     Games are welcome to use the built-in pygame event subsystem, but
     on_*_event callbacks will not be available in that case.
 
+    A HashableEvent is a small slotted view over a pygame.event.Event.
+    Attribute and item access go straight to the wrapped event, so
+    wrapping a raw event with from_event() doesn't copy its contents.
+
     This also allows us to insert metadata into the pygame events
     which allows us to extend them with additional information.
     """
 
-    def __init__(self: Self, type: pygame.event, *args: list, **attributes: dict) -> Self:  # noqa: A002
+    __slots__ = ('_hash', 'event')
+
+    def __init__(self: Self, type: int, *args: list, **attributes: dict) -> None:  # noqa: A002
         """Create a hashable event.
 
         Pygames events are not hashable by default.
 
         Args:
             type: The type of the event.
-            *args: The positional arguments.
+            *args: An optional dict of event attributes, like pygame.event.Event.
             **attributes: The keyword arguments.
         """
-        self.type = type
-        self.__dict__.update(attributes)
-        self.__hash = hash((self.type, tuple(self.__dict__.keys())))
+        object.__setattr__(self, 'event', pygame.event.Event(type, *args, **attributes))
+        object.__setattr__(self, '_hash', None)
+
+    @classmethod
+    def from_event(cls: type[Self], event: pygame.event.Event) -> Self:
+        """Wrap a pygame event without copying it.
+
+        Args:
+            event: The pygame event.
+
+        Returns:
+            The hashable event.
+        """
+        hashable_event = object.__new__(cls)
+        object.__setattr__(hashable_event, 'event', event)
+        object.__setattr__(hashable_event, '_hash', None)
+
+        return hashable_event
+
+    @property
+    def type(self: Self) -> int:
+        """Return the event type."""
+        return self.event.type
 
     @property
     def dict(self: Self) -> dict:
         """Return the dictionary representation of the object."""
-        return self.__dict__
+        return self.event.dict
+
+    def __getattr__(self: Self, attr: str) -> object:
+        """Get an event attribute from the wrapped event."""
+        return getattr(self.event, attr)
+
+    def __setattr__(self: Self, attr: str, value: object) -> None:
+        """Set an event attribute on the wrapped event."""
+        setattr(self.event, attr, value)
 
     def __setitem__(self: Self, key: str, item: object) -> None:
         """Set an item in the object."""
-        self.__dict__[key] = item
+        self.event.dict[key] = item
 
     def __getitem__(self: Self, key: str) -> object:
         """Get an item from the object."""
-        return self.__dict__[key]
+        return self.event.dict[key]
 
     def __len__(self: Self) -> int:
         """Return the length of the object."""
-        return len(self.__dict__)
+        return len(self.event.dict)
+
+    def __iter__(self: Self) -> Iterator[str]:
+        """Iterate over the keys of the object."""
+        return iter(self.event.dict)
+
+    def __contains__(self: Self, key: str) -> bool:
+        """Return True if the key is in the object."""
+        return key in self.event.dict
 
     def __delitem__(self: Self, key: str) -> NoReturn:
         """Delete an item from the object."""
-        del self.__dict__[key]
+        del self.event.dict[key]
 
     def clear(self: Self) -> None:
         """Clear the object."""
-        return self.__dict__.clear()
+        return self.event.dict.clear()
 
-    def copy(self: Self) -> Self:
-        """Shallow copy the object."""
-        return self.__dict__.copy()
+    def copy(self: Self) -> dict:
+        """Shallow copy the object's attributes."""
+        return self.event.dict.copy()
+
+    def get(self: Self, key: str, default: object = None) -> object:
+        """Return the item for key, or default."""
+        return self.event.dict.get(key, default)
 
     def has_key(self: Self, k: str) -> bool:
         """Return True if the key is in the object."""
-        return k in self.__dict__
+        return k in self.event.dict
 
     def update(self: Self, *args: list, **kwargs: dict) -> None:
         """Update the object."""
-        return self.__dict__.update(*args, **kwargs)
+        return self.event.dict.update(*args, **kwargs)
 
     def keys(self: Self) -> list:
         """Return the keys of the object."""
-        return self.__dict__.keys()
+        return self.event.dict.keys()
 
     def values(self: Self) -> list:
         """Return the values of the object."""
-        return self.__dict__.values()
+        return self.event.dict.values()
+
+    def items(self: Self) -> list:
+        """Return the items of the object."""
+        return self.event.dict.items()
 
     def __hash__(self: Self) -> int:
         """Return the hash of the object."""
-        return self.__hash
+        # Computed on first use, since most events are never hashed
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash((self.type, tuple(self.event.dict.keys()))))
 
-    def __eq__(self: Self, other: Self) -> bool:
+        return self._hash
+
+    def __eq__(self: Self, other: object) -> bool:
         """Return True if the objects are equal."""
-        return self.type == other.type and self.__dict__ == other.__dict__
+        if not isinstance(other, HashableEvent | pygame.event.EventType):
+            return NotImplemented
+
+        return self.type == other.type and self.event.dict == other.dict
 
-    def __ne__(self: Self, other: Self) -> bool:
+    def __ne__(self: Self, other: object) -> bool:
         """Return the opposite of __eq__."""
         return not self.__eq__(other)
 
     def __repr__(self: Self) -> str:
         """Return a string representation of the object."""
-        return f'{self.__class__.__name__}({self.__dict__})'
+        return f'{self.__class__.__name__}({self.event.dict})'
 
     def __str__(self: Self) -> str:
         """Return a string representation of the object."""
-        return f'{self.__class__.__name__}({self.__dict__})'
+        return f'{self.__class__.__name__}({self.event.dict})'
 
     def __copy__(self: Self) -> Self:
         """Shallow copy the object."""
-        return self.__class__(**self.__dict__)
+        return self.__class__(self.type, self.event.dict)
 
     def __deepcopy__(self: Self, memo: dict) -> Self:
         """Deep copy the object."""
@@ -390,12 +606,7 @@ class HashableEvent(dict):
 
     def __reduce__(self: Self) -> tuple:
         """Reduce the object to a picklable form."""
-        return (self.__class__, (), self.__dict__)
-
-    def __setstate__(self: Self, state: dict) -> None:
-        """Set the state of the object."""
-        self.__dict__.update(state)
-        self.__hash = hash((self.type, self.__dict__))
+        return (self.__class__, (self.type, self.event.dict))
 
 
 # We intentionally don't implement any methods here.
@@ -45,20 +45,10 @@ class KeyboardManager(ResourceManager):
             Returns:
                 None
             """
-            # The KEYUP and KEYDOWN events are
-            # different.  KEYDOWN contains an extra
-            # key in its dictionary (unicode), which
-            # KEYUP does not contain, so we'll make
-            # a copy of the dictionary, and then
-            # delete the key "unicode" so we can track
-            # both sets of events.
-            keyboard_key = event.dict.copy()
-            del keyboard_key['unicode']
-
-            # This makes it possible to use
-            # a dictionary as a key, which is
-            # normally not possible.
-            self.keys[tuple(sorted(frozenset(keyboard_key.items())))] = event
+            # KEYDOWN and KEYUP events for the same key share
+            # an identity, so the latest event for each key
+            # tells us whether it's currently down.
+            self.keys[self.key_identity(event)] = event
 
             self.game.on_key_down_event(event)
             self.on_key_chord_down_event(event)
@@ -72,14 +62,26 @@ class KeyboardManager(ResourceManager):
             Returns:
                 None
             """
-            # This makes it possible to use
-            # a dictionary as a key, which is
-            # normally not possible.
-            self.keys[tuple(sorted(frozenset(event.dict.items())))] = event
+            self.keys[self.key_identity(event)] = event
 
             self.game.on_key_up_event(event)
             self.on_key_chord_up_event(event)
 
+        @staticmethod
+        def key_identity(event: pygame.event.Event) -> tuple:
+            """Return the identity of the key behind a KEYDOWN or KEYUP event.
+
+            The event's unicode attribute differs between KEYDOWN and KEYUP,
+            so it isn't part of the identity.
+
+            Args:
+                event (pygame.event.Event): The event.
+
+            Returns:
+                tuple: The key, modifiers and scancode of the event.
+            """
+            return (event.key, event.mod, getattr(event, 'scancode', None))
+
         def on_key_chord_down_event(self: Self, event: pygame.event.Event) -> None:
             """Handle key chord down events.
 
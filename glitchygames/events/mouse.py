@@ -603,9 +603,8 @@ def collided_sprites(scene: object, event: pygame.event.Event, index: int | None
     Returns:
         list: The list of collided sprites.
     """
-    mouse = MousePointer(pos=event.pos)
-
-    sprites = pygame.sprite.spritecollide(sprite=mouse, group=scene.all_sprites, dokill=False)
+    # Hit-test through the scene's spatial index rather than the whole group
+    sprites = scene.sprites_at_position(pos=event.pos)
 
     if sprites:
         if index is None:
@@ -144,7 +144,7 @@ class TextSprite(Sprite):
                 Returns:
                     None
                 """
-                (self.image, self.rect) = self.font.render(string, WHITE)
+                (self.image, self.rect) = FontManager.render(self.font, string, WHITE)
                 # self.image
                 surface.blit(self.image, self.rect.center)
                 self.rect.center = surface.get_rect().center
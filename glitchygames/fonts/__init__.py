@@ -6,7 +6,14 @@ This is a simple font manager that can be used to load fonts.
 
 from __future__ import annotations
 
+import collections
+import contextlib
+import functools
+import json
 import logging
+import os
+import sys
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, Self
 
@@ -14,17 +21,342 @@ if TYPE_CHECKING:
     import argparse
 
 import pygame
+import pygame.freetype
 from glitchygames.events import FontEvents, ResourceManager
 
 log = logging.getLogger('game.fonts')
 log.addHandler(logging.NullHandler())
 
+# Set GLITCHYGAMES_CACHE_DIR to persist the system font index between runs
+FONT_CACHE_DIR: str | None = os.environ.get('GLITCHYGAMES_CACHE_DIR')
+
+
+@functools.cache
+def system_fonts() -> dict[str, dict[tuple[bool, bool], str]]:
+    """Return the system font index, keyed by simplified font name.
+
+    Each font maps (bold, italic) to the file of that style.  Finding
+    the system fonts runs fc-list or reads the registry, depending on
+    the platform, so this is only done once per process.  If
+    GLITCHYGAMES_CACHE_DIR is set, the index is also saved there, keyed
+    by the platform and pygame version; delete it to pick up newly
+    installed fonts.  A crash while saving can't leave a partial index,
+    since it's written next to the cache and then renamed over it.  An
+    empty index isn't saved, so fonts installed later are still found,
+    and a saved index that isn't font names to styles is removed.
+
+    Returns:
+        The fonts and pygame's aliases for common font categories.
+    """
+    cache_path: Path | None = None
+
+    if FONT_CACHE_DIR:
+        cache_path = Path(FONT_CACHE_DIR) / f'fonts-{sys.platform}-pygame-{pygame.version.ver}.json'
+
+        with contextlib.suppress(OSError, ValueError):
+            cached = json.loads(cache_path.read_text())
+
+            if is_font_index(cached):
+                return {
+                    name: {
+                        (style[0] == 'b', style[1] == 'i'): path for style, path in styles.items()
+                    }
+                    for name, styles in cached.items()
+                }
+
+            log.warning(f'Removing malformed font index cache {cache_path}')
+            cache_path.unlink()
+
+    pygame.sysfont.initsysfonts()
+
+    # Fonts take precedence over aliases, as in pygame.sysfont.SysFont()
+    fonts = {**pygame.sysfont.Sysalias, **pygame.sysfont.Sysfonts}
+
+    log.debug(f'Found {len(fonts)} system fonts')
+
+    if cache_path and fonts:
+        with contextlib.suppress(OSError):
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=cache_path.parent, prefix=f'{cache_path.name}.', delete=False
+            ) as cache_file:
+                json.dump(
+                    {
+                        name: {
+                            f'{"b" if bold else "-"}{"i" if italic else "-"}': path
+                            for (bold, italic), path in styles.items()
+                        }
+                        for name, styles in fonts.items()
+                    },
+                    cache_file,
+                )
+
+            Path(cache_file.name).replace(cache_path)
+
+    return fonts
+
+
+def is_font_index(index: object) -> bool:
+    """Return whether JSON loaded from a font index cache has the right shape.
+
+    Args:
+        index (object): The loaded JSON.
+
+    Returns:
+        bool: True for a non-empty dict of font names to dicts of two
+            character styles ('bi', 'b-', '-i' or '--') to font files.
+    """
+    return (
+        isinstance(index, dict)
+        and bool(index)
+        and all(
+            isinstance(styles, dict)
+            and all(
+                isinstance(style, str) and len(style) == 2 and isinstance(path, str)  # noqa: PLR2004
+                for style, path in styles.items()
+            )
+            for styles in index.values()
+        )
+    )
+
+
+def match_font(name: str | None, *, bold: bool = False, italic: bool = False) -> tuple:
+    """Find the file of a system font, like pygame.sysfont.SysFont() does.
+
+    Args:
+        name (str | None): The font name, or comma separated names to try in order.
+        bold (bool): Whether to look for the bold style.
+        italic (bool): Whether to look for the italic style.
+
+    Returns:
+        tuple: The font file (None for pygame's default font), and whether
+            bold and italic have to be faked because there's no such style.
+    """
+    fonts = system_fonts()
+    font_file = None
+    got_bold = got_italic = False
+
+    for single_name in (name or '').split(','):
+        styles = fonts.get(''.join(char.lower() for char in single_name if char.isalnum()))
+
+        if not styles:
+            continue
+
+        plain_file = styles.get((False, False))
+        font_file = styles.get((bold, italic))
+
+        if not (font_file or plain_file):
+            # Use whatever style there is
+            ((style_bold, style_italic), font_file) = next(iter(styles.items()))
+            got_bold = bold and style_bold
+            got_italic = italic and style_italic
+        elif not font_file:
+            font_file = plain_file
+        elif plain_file != font_file:
+            (got_bold, got_italic) = (bold, italic)
+
+        if font_file:
+            break
+
+    return (font_file, bold and not got_bold, italic and not got_italic)
+
+
+class TextRenderCache:
+    """A least recently used cache of rendered text.
+
+    Entries are keyed by the font, size, text, color, antialiasing and
+    style they were rendered with, so HUD and menu text that doesn't
+    change isn't re-rasterized every frame.  Cached surfaces are shared
+    by everyone rendering the same text; blit them, don't draw on them.
+
+    The cache is capped by the total size of its surfaces in bytes.
+    """
+
+    def __init__(self: Self, max_bytes: int = 8 * 1024 * 1024) -> None:
+        """Initialize the text render cache.
+
+        Args:
+            max_bytes (int): The total surface size to keep cached, in bytes.
+
+        Returns:
+            None
+        """
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # (font, size, text, color, antialias, style) -> rendered text, least recently used first
+        self.entries: collections.OrderedDict = collections.OrderedDict()
+
+    @staticmethod
+    def key(
+        font: pygame.font.Font | pygame.freetype.Font,
+        text: str,
+        color: tuple,
+        *,
+        antialias: bool = True,
+        size: float = 0,
+        style: int = pygame.freetype.STYLE_DEFAULT,
+    ) -> tuple:
+        """Return the cache key for rendering text.
+
+        The font's current size, antialiasing and style are used where
+        the font takes them from its attributes rather than arguments.
+
+        Args:
+            font (pygame.font.Font | pygame.freetype.Font): The font.
+            text (str): The text.
+            color (tuple): The text color.
+            antialias (bool): Whether to antialias pygame.font text.
+            size (float): The freetype size, or 0 for the font's.
+            style (int): The freetype style, or STYLE_DEFAULT for the font's.
+
+        Returns:
+            tuple: The font, size, text, color, antialiasing and style.
+        """
+        # Colors aren't hashable
+        color = tuple(pygame.Color(color))
+
+        if isinstance(font, pygame.freetype.Font):
+            if style == pygame.freetype.STYLE_DEFAULT:
+                style = font.style
+
+            return (font, size or font.size, text, color, font.antialiased, style)
+
+        return (
+            font,
+            font.get_height(),
+            text,
+            color,
+            bool(antialias),
+            (font.bold, font.italic, font.underline, font.strikethrough),
+        )
+
+    def render(
+        self: Self,
+        font: pygame.font.Font | pygame.freetype.Font,
+        text: str,
+        color: tuple,
+        *,
+        antialias: bool = True,
+        size: float = 0,
+        style: int = pygame.freetype.STYLE_DEFAULT,
+    ) -> pygame.Surface | tuple[pygame.Surface, pygame.Rect]:
+        """Render text, or return it from the cache.
+
+        Args:
+            font (pygame.font.Font | pygame.freetype.Font): The font.
+            text (str): The text.
+            color (tuple): The text color.
+            antialias (bool): Whether to antialias pygame.font text.
+            size (float): The freetype size, or 0 for the font's.
+            style (int): The freetype style, or STYLE_DEFAULT for the font's.
+
+        Returns:
+            pygame.Surface | tuple[pygame.Surface, pygame.Rect]: What the font's
+                render() returns: the surface, or for freetype fonts the surface
+                and a new copy of its rect.
+        """
+        key = self.key(font, text, color, antialias=antialias, size=size, style=style)
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        else:
+            self.misses += 1
+
+            if isinstance(font, pygame.freetype.Font):
+                entry = font.render(text, key[3], style=style, size=size)
+            else:
+                entry = font.render(text, antialias, key[3])
+
+            self.put(key, entry)
+
+        if isinstance(entry, tuple):
+            (image, rect) = entry
+            return (image, rect.copy())
+
+        return entry
+
+    def put(self: Self, key: tuple, entry: pygame.Surface | tuple) -> None:
+        """Cache rendered text, evicting the least recently used over the cap.
+
+        Text bigger than the whole cache isn't cached.
+
+        Args:
+            key (tuple): The key from TextRenderCache.key().
+            entry (pygame.Surface | tuple): The rendered surface, or surface and rect.
+
+        Returns:
+            None
+        """
+        entry_bytes = self.image_bytes(entry)
+
+        if entry_bytes > self.max_bytes:
+            return
+
+        self.entries[key] = entry
+        self.bytes += entry_bytes
+
+        while self.bytes > self.max_bytes:
+            (_, evicted) = self.entries.popitem(last=False)
+            self.bytes -= self.image_bytes(evicted)
+            self.evictions += 1
+
+    def clear(self: Self) -> None:
+        """Remove every entry from the cache.
+
+        Returns:
+            None
+        """
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self: Self) -> dict[str, float]:
+        """Return the cache counters.
+
+        Returns:
+            dict[str, float]: Hits, misses, hit rate, evictions, entries and bytes.
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+        }
+
+    @staticmethod
+    def image_bytes(entry: pygame.Surface | tuple) -> int:
+        """Return the size of rendered text's pixel data.
+
+        Args:
+            entry (pygame.Surface | tuple): The rendered surface, or surface and rect.
+
+        Returns:
+            int: The size in bytes.
+        """
+        image = entry[0] if isinstance(entry, tuple) else entry
+
+        return image.get_pitch() * image.get_height()
+
 
 class FontManager(ResourceManager):
     """A font manager."""
 
     OPTIONS: ClassVar = {}
-    RENDER_CACHE: ClassVar = {}
+
+    # Rendered text, see FontManager.render()
+    RENDER_CACHE: ClassVar = TextRenderCache()
+
+    # Loaded fonts, keyed by (name, size, bold, italic, dpi)
+    FONT_CACHE: ClassVar = {}
 
     class FontProxy(FontEvents, ResourceManager):
         """A font proxy."""
@@ -138,6 +470,10 @@ class FontManager(ResourceManager):
 
         bitstream_vera is a permissively licensed font that can be used with your game.
 
+        Fonts are loaded once and cached in FONT_CACHE, so the font returned
+        is shared by everyone asking for the same one.  Pass a size or style
+        to render() rather than changing the font's attributes.
+
         Args:
             font_config (dict | None): The font configuration.
 
@@ -147,18 +483,79 @@ class FontManager(ResourceManager):
         if not font_config:
             font_config = FontManager.OPTIONS
 
-        # try:
-        log.info(f'Loading Font: {font_config["font_name"]}')
-        log.info(f'Font Size: {font_config["font_size"]}')
+        key = (
+            font_config['font_name'],
+            font_config['font_size'],
+            bool(font_config.get('font_bold', False)),
+            bool(font_config.get('font_italic', False)),
+            font_config.get('font_dpi') or pygame.freetype.get_default_resolution(),
+        )
+        font = cls.FONT_CACHE.get(key)
+
+        if font is None:
+            (name, size, bold, italic, dpi) = key
+            font = cls.FONT_CACHE[key] = cls.load_font(
+                name, size, bold=bold, italic=italic, dpi=dpi
+            )
+
+        return font
+
+    @classmethod
+    def render(
+        cls,
+        font: pygame.font.Font | pygame.freetype.Font,
+        text: str,
+        color: tuple,
+        *,
+        antialias: bool = True,
+        size: float = 0,
+        style: int = pygame.freetype.STYLE_DEFAULT,
+    ) -> pygame.Surface | tuple[pygame.Surface, pygame.Rect]:
+        """Render text through RENDER_CACHE.
+
+        See TextRenderCache.render().
+        """
+        return cls.RENDER_CACHE.render(
+            font, text, color, antialias=antialias, size=size, style=style
+        )
+
+    @classmethod
+    def load_font(
+        cls,
+        name: str,
+        size: int,
+        *,
+        bold: bool = False,
+        italic: bool = False,
+        dpi: int | None = None,
+    ) -> pygame.freetype.Font:
+        """Load a font, falling back to bitstream_vera if it can't be.
+
+        Args:
+            name (str): The system font name.
+            size (int): The font size, in points.
+            bold (bool): Whether the font is bold.
+            italic (bool): Whether the font is italic.
+            dpi (int | None): The resolution to render at, or None for
+                pygame.freetype's default.
+
+        Returns:
+            pygame.freetype.Font
+        """
+        if dpi is None:
+            dpi = pygame.freetype.get_default_resolution()
+
+        log.debug(f'Loading Font: {name} {size}pt bold={bold} italic={italic} dpi={dpi}')
 
         try:
-            return pygame.freetype.SysFont(
-                name=font_config['font_name'], size=font_config['font_size']
-            )
+            (font_file, fake_bold, fake_italic) = match_font(name, bold=bold, italic=italic)
+            font = pygame.freetype.Font(font_file, size=size, resolution=dpi)
+            font.strong = fake_bold
+            font.oblique = fake_italic
         except (TypeError, FileNotFoundError):
             # Note: Not sure why but pygame.freetype.SysFont doesn't
             # seem to work with pyinstaller packaged games.
-            log.info('Loading Font: Built-In')
+            log.info(f'Loading Font: Built-In, {name} is unavailable')
 
             # BUG: pygame's documentation claims that passing None
             # as the font name will load the default font.  However,
@@ -173,4 +570,6 @@ class FontManager(ResourceManager):
             # File "pygame/freetype.py", line 73, in constructor
             # TypeError: not a file object
             font_path = Path(__file__).parent / 'fonts' / 'bitstream_vera' / 'Vera.ttf'
-            return pygame.freetype.Font(file=font_path, size=12)
+            return pygame.freetype.Font(file=font_path, size=12, resolution=dpi)
+        else:
+            return font
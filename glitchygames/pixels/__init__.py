@@ -1,18 +1,111 @@
 #!/usr/bin/env python3
-"""Pixel data handling."""
+"""Pixel data handling.
+
+Raw pixel data is any object supporting the buffer protocol (bytes,
+bytearray, mmap, pygame.image.tobytes() output, ...) holding tightly
+packed pixels.  pixel_view() indexes it in place; the tuple generators
+are the slow path, for code that needs one Python object per pixel.
+"""
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import mmap
+import operator
+import sys
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Any, Self
 
 import pygame
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pixel_view() falls back to memoryview
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 LOG = logging.getLogger('game.pixels')
 LOG.addHandler(logging.NullHandler())
 
 
+def pixel_view(pixel_data: Any, size: tuple[int, int] | None = None, channels: int = 3) -> Any:
+    """Return a view of raw pixel data without copying it.
+
+    The view is a NumPy array if NumPy is available, or a memoryview
+    otherwise, shaped (height, width, channels), or (pixels, channels)
+    if no size is given.  Either can be indexed with view[y, x, channel];
+    writes go straight through to pixel_data if it is writable.
+
+    Args:
+        pixel_data: The raw pixel data, any object supporting the buffer protocol.
+        size: The (width, height) of the image, if known.
+        channels: The bytes per pixel, 3 for RGB or 4 for RGBA.
+
+    Returns:
+        A numpy.ndarray or memoryview of the pixels.
+
+    Raises:
+        ValueError: The pixel data isn't a whole number of pixels of that size.
+    """
+    data = memoryview(pixel_data).cast('B')
+
+    if size is None:
+        if data.nbytes % channels:
+            raise ValueError(f'Pixel data length ({data.nbytes}) is not divisible by {channels}')
+
+        shape = (data.nbytes // channels, channels)
+    else:
+        (width, height) = size
+        if data.nbytes != width * height * channels:
+            raise ValueError(
+                f'Pixel data length ({data.nbytes}) is not {width}x{height}x{channels}'
+            )
+
+        shape = (height, width, channels)
+
+    if np is not None:
+        return np.frombuffer(data, dtype=np.uint8).reshape(shape)
+
+    return data.cast('B', shape)
+
+
+def packed_pixels(pixel_data: Any) -> Any:
+    """Pack RGB pixel data into one 32 bit int per pixel.
+
+    Each int is the bytes R, G, B, 0 read in native byte order, so
+    value.to_bytes(4, sys.byteorder)[:3] gives the pixel back.  Packed
+    pixels hash and compare as single values, which makes finding the
+    distinct colors of an image one bulk operation.
+
+    Args:
+        pixel_data: Raw RGB pixel data, any object supporting the buffer protocol.
+
+    Returns:
+        A numpy.ndarray of uint32 if NumPy is available, otherwise a list of ints.
+
+    Raises:
+        ValueError: The pixel data isn't a whole number of RGB pixels.
+    """
+    data = memoryview(pixel_data).cast('B')
+
+    if data.nbytes % 3:
+        raise ValueError(f'Pixel data length ({data.nbytes}) is not divisible by 3')
+
+    packed = bytearray(data.nbytes // 3 * 4)
+
+    for channel in range(3):
+        packed[channel::4] = data[channel::3]
+
+    if np is not None:
+        return np.frombuffer(packed, dtype=np.uint32)
+
+    return memoryview(packed).cast('I').tolist()
+
+
 def indexed_rgb_triplet_generator(pixel_data: iter) -> iter[tuple[int, int, int]]:
     """Yield (R, G, B) pixel tuples from a buffer of pixel tuples."""
     try:
@@ -22,151 +115,329 @@ def indexed_rgb_triplet_generator(pixel_data: iter) -> iter[tuple[int, int, int]
         pass
 
 
-def rgb_555_triplet_generator(pixel_data: iter) -> iter[tuple[int, int, int]]:
-    """Yield (R, G, B) pixel tuples for 555 formated color data."""
-    try:
-        # Construct RGB triplets.
-        for packed_rgb_triplet in pixel_data:
-            # struct unpacks as a 1 element tuple.
-            rgb_data = bin(packed_rgb_triplet[0])
+# 5 and 6 bit channels expanded to 8 bits, filling the low bits when non-zero
+EXPAND_5_BITS = bytes((value << 3) + 7 if value else 0 for value in range(32))
+EXPAND_6_BITS = bytes((value << 2) + 3 if value else 0 for value in range(64))
+
+# Where each channel lives in a 16 bit pixel: (high byte mask, high byte shift,
+# low byte mask, low byte shift, expansion); channel = (high & mask) << shift
+# | (low & mask) >> shift.  555 pixels are RRRRRGGGGGBBBBBA.
+PACKED_FORMATS = {
+    '565': (
+        (0xF8, -3, 0x00, 0, EXPAND_5_BITS),
+        (0x07, 3, 0xE0, 5, EXPAND_6_BITS),
+        (0x00, 0, 0x1F, 0, EXPAND_5_BITS),
+    ),
+    '555': (
+        (0xF8, -3, 0x00, 0, EXPAND_5_BITS),
+        (0x07, 2, 0xC0, 6, EXPAND_5_BITS),
+        (0x00, 0, 0x3E, 1, EXPAND_5_BITS),
+    ),
+}
+
+
+@functools.cache
+def shifted_table(mask: int, shift: int) -> bytes:
+    """Return a bytes.translate() table of (byte & mask) shifted left by shift."""
+    return bytes(
+        (value & mask) << shift if shift >= 0 else (value & mask) >> -shift
+        for value in range(256)
+    )
 
-            # binary conversions start with 0b, so chop that off.
-            rgb_data = rgb_data[2:]
 
-            # Pad the data out.
-            pad_bits = 16 - len(rgb_data)
-            pad_data = '0' * pad_bits
+def decode_packed_rgb(pixel_data: Any, pixel_format: str, byteorder: str = 'little') -> bytes:
+    """Decode 16 bit packed pixels to RGB.
 
-            rgb_data = pad_data + rgb_data
+    Each channel is looked up from the high and low byte planes of the
+    pixels with bytes.translate(), and the two halves are combined with
+    a single big integer OR, so there is no Python level loop over the
+    pixels.  With NumPy, a 65,536 entry lookup table is used instead.
 
-            LOG.info(f'Padded {pad_bits} bits (now {rgb_data})')
+    Args:
+        pixel_data: The 16 bit pixels, any object supporting the buffer protocol.
+        pixel_format: '565' or '555'.
+        byteorder: The byte order of the pixels, 'little' or 'big'.
 
-            # red is 5 bits
-            red = int(rgb_data[0:5] + '000', 2)
+    Returns:
+        The RGB pixels, 3 bytes each.
 
-            if red:
-                red += 7
+    Raises:
+        ValueError: The pixel data isn't a whole number of 16 bit pixels.
+    """
+    data = memoryview(pixel_data).cast('B')
 
-            # green is 6 bits
-            green = int(rgb_data[5:10] + '000', 2)
+    if data.nbytes % 2:
+        raise ValueError(f'Pixel data length ({data.nbytes}) is not divisible by 2')
 
-            if green:
-                green += 7
+    channels = PACKED_FORMATS[pixel_format]
 
-            # blue is 5 bits
-            blue = int(rgb_data[10:15] + '000', 2)
+    if np is not None:
+        return packed_rgb_table(pixel_format)[
+            np.frombuffer(data, dtype='<u2' if byteorder == 'little' else '>u2')
+        ].tobytes()
 
-            # last bit is ignored or used for alpha.
+    (low, high) = (bytes(data[0::2]), bytes(data[1::2]))
+    if byteorder != 'little':
+        (low, high) = (high, low)
 
-            if blue:
-                blue += 7
+    count = len(low)
+    rgb = bytearray(count * 3)
 
-            LOG.info(f'Packed RGB: {rgb_data}')
-            LOG.info(f'Red: {red}')
-            LOG.info(f'Green: {green}')
-            LOG.info(f'Blue: {blue}')
+    for channel, (high_mask, high_shift, low_mask, low_shift, expand) in enumerate(channels):
+        value = int.from_bytes(high.translate(shifted_table(high_mask, high_shift)), 'big')
+        value |= int.from_bytes(low.translate(shifted_table(low_mask, -low_shift)), 'big')
+        rgb[channel::3] = value.to_bytes(count, 'big').translate(expand.ljust(256, b'\0'))
 
-            yield tuple(red, green, blue)
-    except StopIteration:
-        pass
+    return bytes(rgb)
 
 
-def rgb_565_triplet_generator(pixel_data: iter) -> iter[tuple[int, int, int]]:
-    """Yield (R, G, B) tuples for 565 formatted color data."""
-    try:
-        # Construct RGB triplets.
-        for packed_rgb_triplet in pixel_data:
-            # struct unpacks as a 1 element tuple.
-            rgb_data = bin(packed_rgb_triplet[0])
+@functools.cache
+def packed_rgb_table(pixel_format: str) -> Any:
+    """Return the (65536, 3) NumPy RGB lookup table for a 16 bit pixel format."""
+    values = np.arange(65536, dtype=np.uint16)
+    (high, low) = (values >> 8, values & 0xFF)
+    table = np.empty((65536, 3), dtype=np.uint8)
 
-            # binary conversions start with 0b, so chop that off.
-            rgb_data = rgb_data[2:]
+    for channel, (high_mask, high_shift, low_mask, low_shift, expand) in enumerate(
+        PACKED_FORMATS[pixel_format]
+    ):
+        index = (
+            np.left_shift(high & high_mask, high_shift)
+            if high_shift >= 0
+            else np.right_shift(high & high_mask, -high_shift)
+        ) | np.right_shift(low & low_mask, low_shift)
+        table[:, channel] = np.frombuffer(expand, dtype=np.uint8)[index]
 
-            # Pad the data out.
-            pad_bits = 16 - len(rgb_data)
-            pad_data = '0' * pad_bits
+    return table
 
-            rgb_data = pad_data + rgb_data
 
-            LOG.info(f'Padded {pad_bits} bits (now {rgb_data})')
+def image_from_packed_rgb(
+    pixel_data: Any, width: int, height: int, pixel_format: str = '565', byteorder: str = 'little'
+) -> pygame.Surface:
+    """Produce a pygame.image object from 16 bit packed pixel data.
 
-            # red is 5 bits
-            red = int(rgb_data[0:5] + '000', 2)
+    Args:
+        pixel_data: The 16 bit pixels, any object supporting the buffer protocol.
+        width: The width of the image.
+        height: The height of the image.
+        pixel_format: '565' or '555'.
+        byteorder: The byte order of the pixels, 'little' or 'big'.
 
-            if red:
-                red += 7
+    Returns:
+        The image.
 
-            # green is 6 bits
-            green = int(rgb_data[5:11] + '00', 2)
+    Raises:
+        ValueError: The pixel data isn't width x height 16 bit pixels.
+    """
+    if memoryview(pixel_data).nbytes != width * height * 2:
+        raise ValueError(f'Pixel data length is not {width}x{height} 16 bit pixels')
 
-            if green:
-                green += 3
+    rgb = bytearray(decode_packed_rgb(pixel_data, pixel_format, byteorder))
 
-            # blue is 5 bits
-            blue = int(rgb_data[11:] + '000', 2)
+    return pygame.image.frombuffer(rgb, (width, height), 'RGB')
 
-            if blue:
-                blue += 7
 
-            LOG.info(f'Packed RGB: {rgb_data}')
-            LOG.info(f'Red: {red}')
-            LOG.info(f'Green: {green}')
-            LOG.info(f'Blue: {blue}')
+def rgb_555_triplet_generator(pixel_data: iter) -> iter[tuple[int, int, int]]:
+    """Yield (R, G, B) pixel tuples for 555 formated color data.
 
-            yield tuple(red, green, blue)
-    except StopIteration:
-        pass
+    pixel_data yields 1 tuples of 16 bit ints, as struct.iter_unpack()
+    does.  The last bit of each pixel is ignored or used for alpha.
+    This is the slow path; see decode_packed_rgb().
+    """
+    for (packed_rgb_triplet,) in pixel_data:
+        yield (
+            EXPAND_5_BITS[packed_rgb_triplet >> 11],
+            EXPAND_5_BITS[(packed_rgb_triplet >> 6) & 0x1F],
+            EXPAND_5_BITS[(packed_rgb_triplet >> 1) & 0x1F],
+        )
+
+
+def rgb_565_triplet_generator(pixel_data: iter) -> iter[tuple[int, int, int]]:
+    """Yield (R, G, B) tuples for 565 formatted color data.
+
+    pixel_data yields 1 tuples of 16 bit ints, as struct.iter_unpack()
+    does.  This is the slow path; see decode_packed_rgb().
+    """
+    for (packed_rgb_triplet,) in pixel_data:
+        yield (
+            EXPAND_5_BITS[packed_rgb_triplet >> 11],
+            EXPAND_6_BITS[(packed_rgb_triplet >> 5) & 0x3F],
+            EXPAND_5_BITS[packed_rgb_triplet & 0x1F],
+        )
 
 
 def rgb_triplet_generator(pixel_data: bytes) -> Iterator[tuple[int, int, int]]:
     """Generate RGB triplets from pixel data.
 
+    This allocates a tuple per pixel; use pixel_view() to read pixels
+    in place.
+
     Args:
-        pixel_data: Raw pixel data as bytes
+        pixel_data: Raw pixel data, any object supporting the buffer protocol
 
     Yields:
         Tuples of (r,g,b) values
     """
+    data = memoryview(pixel_data).cast('B')
+
     # Validate input
-    if not pixel_data:
-        raise ValueError("Empty pixel data")
-
-    if len(pixel_data) % 3 != 0:
-        raise ValueError(f"Pixel data length ({len(pixel_data)}) is not divisible by 3")
-
-    # Convert bytes to integers
-    pixels = [int(b) for b in pixel_data]
-
-    # Yield RGB triplets
-    for i in range(0, len(pixels), 3):
-        try:
-            r = pixels[i]
-            g = pixels[i+1]
-            b = pixels[i+2]
-            yield (r, g, b)
-        except IndexError as e:
-            raise ValueError(f"Not enough data for RGB triplet at index {i}") from e
-
-
-def image_from_pixels(pixels: list, width: int, height: int) -> pygame.Surface:
-    """Produce a pygame.image object for the specified [(R, G, B), ...] pixel data."""
-    image = pygame.Surface((width, height))
-    y = 0
-    x = 0
-    for pixel in pixels:
-        image.fill(pixel, ((x, y), (1, 1)))
-
-        if (x + 1) % width == 0:
-            x = 0
-            y += 1
-        else:
-            x += 1
+    if not data:
+        raise ValueError('Empty pixel data')
+
+    if data.nbytes % 3 != 0:
+        raise ValueError(f'Pixel data length ({data.nbytes}) is not divisible by 3')
+
+    # Group the bytes three at a time without indexing them one by one
+    channels = iter(data)
+    yield from zip(channels, channels, channels, strict=True)
+
+
+# Bytes per pixel of RGB and RGBA pixel data
+RGB_CHANNELS = 3
+RGBA_CHANNELS = 4
+
+# The (R, G, B) of a pixel tuple or pygame.Color
+rgb_channels = operator.itemgetter(0, 1, 2)
+
+
+def image_from_pixels(
+    pixels: Any, width: int, height: int, *, alpha: bool = False, pixel_format: str = 'RGB'
+) -> pygame.Surface:
+    """Produce a pygame.image object for the specified pixel data.
+
+    The pixels are packed into one buffer and the image is made from it
+    in one call.  Missing trailing pixels are black; extra pixels are
+    ignored.
+
+    Args:
+        pixels: A list of (R, G, B) or (R, G, B, A) tuples or pygame.Colors,
+            which may be mixed, or raw pixel data in pixel_format (any object
+            supporting the buffer protocol).
+        width: The width of the image.
+        height: The height of the image.
+        alpha: Whether the image has per pixel alpha.  Pixels without an
+            alpha channel are opaque; without alpha, pixels' alpha is dropped.
+        pixel_format: The layout of raw pixel data, 'RGB' or 'RGBA'.
+
+    Returns:
+        The image.
+
+    Raises:
+        ValueError: The pixel format isn't 'RGB' or 'RGBA'.
+    """
+    count = width * height
+
+    if isinstance(pixels, (list, tuple)):
+        pixels = pixels[:count]
+        channels = RGBA_CHANNELS if alpha else RGB_CHANNELS
+
+        # Only normalize pixels with a different number of channels, it's
+        # much slower than joining them as they are
+        if set(map(len, pixels)) - {channels}:
+            if alpha:
+                pixels = (
+                    pixel if len(pixel) == RGBA_CHANNELS else (*rgb_channels(pixel), 255)
+                    for pixel in pixels
+                )
+            else:
+                pixels = map(rgb_channels, pixels)
+
+        data = bytes(itertools.chain.from_iterable(pixels))
+    elif pixel_format in ('RGB', 'RGBA'):
+        channels = PIXEL_SIZES[pixel_format]
+        data = memoryview(pixels).cast('B')
+    else:
+        raise ValueError(f'Unsupported pixel format: {pixel_format}')
+
+    data = bytearray(data[: count * channels]).ljust(count * channels, b'\0')
+
+    if alpha and channels == RGB_CHANNELS:
+        rgba = bytearray(b'\xff' * (count * RGBA_CHANNELS))
+        for channel in range(RGB_CHANNELS):
+            rgba[channel::RGBA_CHANNELS] = data[channel::RGB_CHANNELS]
+        data = rgba
+    elif not alpha and channels == RGBA_CHANNELS:
+        del data[RGB_CHANNELS::RGBA_CHANNELS]
+
+    if not count:
+        return pygame.Surface((width, height), pygame.SRCALPHA if alpha else 0)
+
+    return pygame.image.frombuffer(data, (width, height), 'RGBA' if alpha else 'RGB')
+
+
+def indexed_pixels(pixel_data: Any, colors: list) -> bytes:
+    """Map RGB pixel data onto the indexes of a palette's colors.
+
+    Args:
+        pixel_data: Raw RGB pixel data, any object supporting the buffer protocol.
+        colors: The palette, up to 256 (R, G, B) colors or pygame.Colors.
+
+    Returns:
+        One palette index byte per pixel.
+
+    Raises:
+        ValueError: The palette is too big, or a pixel's color isn't in it.
+    """
+    if len(colors) > 256:  # noqa: PLR2004
+        raise ValueError(f'Too many palette entries ({len(colors)}, max 256)')
+
+    palette_indexes = {}
+    for index, color in enumerate(colors):
+        # The first of any duplicate entries wins
+        palette_indexes.setdefault(int.from_bytes(bytes(color[:3]) + b'\0', sys.byteorder), index)
+
+    packed = packed_pixels(pixel_data)
+
+    if np is not None:
+        (image_colors, inverse) = np.unique(packed, return_inverse=True)
+        missing = set(image_colors.tolist()).difference(palette_indexes)
+    else:
+        missing = set(packed).difference(palette_indexes)
+
+    if missing:
+        missing = sorted(tuple(color.to_bytes(4, sys.byteorder)[:3]) for color in missing)
+        raise ValueError(f'Colors missing from the palette: {missing[:8]}')
+
+    if np is not None:
+        lut = np.array([palette_indexes[color] for color in image_colors.tolist()])
+        return lut.astype(np.uint8)[inverse].tobytes()
+
+    return bytes(map(palette_indexes.__getitem__, packed))
+
+
+def image_from_indexed(pixel_data: Any, width: int, height: int, colors: list) -> pygame.Surface:
+    """Produce an 8 bit pygame.image object from palette indexes.
+
+    Args:
+        pixel_data: One palette index byte per pixel, any object supporting the buffer protocol.
+        width: The width of the image.
+        height: The height of the image.
+        colors: The palette, up to 256 (R, G, B) colors or pygame.Colors.
+
+    Returns:
+        The image.
+
+    Raises:
+        ValueError: The pixel data isn't width x height indexes.
+    """
+    if memoryview(pixel_data).nbytes != width * height:
+        raise ValueError(f'Pixel data length is not {width}x{height} 8 bit pixels')
+
+    if not width or not height:
+        image = pygame.Surface((width, height), depth=8)
+    else:
+        image = pygame.image.frombuffer(bytearray(pixel_data), (width, height), 'P')
+
+    image.set_palette([tuple(color[:3]) for color in colors])
 
     return image
 
 
-def pixels_from_data(pixel_data: list) -> list:
-    """Expand raw pixel data into [(R, G, B), ...] triplets."""
+def pixels_from_data(pixel_data: bytes) -> list:
+    """Expand raw pixel data into [(R, G, B), ...] triplets.
+
+    This is the slow path; use pixel_view() to read pixels in place.
+    """
     pixels = rgb_triplet_generator(
         pixel_data=pixel_data,
     )
@@ -178,8 +449,183 @@ def pixels_from_data(pixel_data: list) -> list:
 
 
 def pixels_from_path(path: str) -> list:
-    """Expand raw pixel data from file into [(R, G, B), ...] triplets."""
+    """Expand raw pixel data from file into [(R, G, B), ...] triplets.
+
+    This reads the whole file; use PixelFile to slice large files.
+    """
     with Path.open(path, 'rb') as fh:
         pixel_data = fh.read()
 
     return pixels_from_data(pixel_data=pixel_data)
+
+
+# Pixel format -> bytes per pixel
+PIXEL_SIZES = {'RGB': RGB_CHANNELS, 'RGBA': RGBA_CHANNELS, '565': 2, '555': 2}
+
+
+class PixelFile:
+    """A raw pixel file, memory mapped read only.
+
+    Rows and tiles are cut out of the mapping as they are asked for, so
+    only the pages of the file they cover are ever read, and no Python
+    object is made per pixel.
+
+        with PixelFile('sheet.raw', width=1024, pixel_format='565') as sheet:
+            sprite = sheet.tile_image((32, 64, 32, 32))
+    """
+
+    def __init__(
+        self: Self,
+        path: str,
+        width: int,
+        height: int | None = None,
+        pixel_format: str = 'RGB',
+        offset: int = 0,
+        byteorder: str = 'little',
+    ) -> None:
+        """Map a raw pixel file.
+
+        Args:
+            path: The raw pixel file.
+            width: The width of the image, in pixels.
+            height: The height of the image, or None for as many whole rows as the file holds.
+            pixel_format: 'RGB', 'RGBA', or '565' or '555' 16 bit pixels.
+            offset: The bytes of header before the first row.
+            byteorder: The byte order of 16 bit pixels, 'little' or 'big'.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: The pixel format isn't supported, or the file is too short.
+        """
+        if pixel_format not in PIXEL_SIZES:
+            raise ValueError(f'Unsupported pixel format: {pixel_format}')
+
+        self.pixel_format = pixel_format
+        self.byteorder = byteorder
+        self.pixel_size = PIXEL_SIZES[pixel_format]
+        self.stride = width * self.pixel_size
+        self.offset = offset
+
+        with Path(path).open('rb') as fh:
+            size = Path(path).stat().st_size
+
+            if height is None:
+                height = (size - offset) // self.stride if self.stride else 0
+
+            if not width or not height or size < offset + self.stride * height:
+                raise ValueError(f"{path} doesn't hold {width}x{height} {pixel_format} pixels")
+
+            self.mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.width = width
+        self.height = height
+        self.buffer = memoryview(self.mmap)[offset : offset + self.stride * height]
+
+    def close(self: Self) -> None:
+        """Unmap the file.
+
+        Views returned by buffer and rows() must be released first.
+        """
+        self.buffer.release()
+        self.mmap.close()
+
+    def __enter__(self: Self) -> Self:
+        """Return the pixel file."""
+        return self
+
+    def __exit__(self: Self, *args: object) -> None:
+        """Unmap the file."""
+        self.close()
+
+    def rows(self: Self, start: int, stop: int | None = None) -> memoryview:
+        """Return a read only view of a range of rows.
+
+        Args:
+            start: The first row.
+            stop: The row after the last, or None for the end of the image.
+
+        Returns:
+            The rows' raw pixel data.
+        """
+        (start, stop, _) = slice(start, stop).indices(self.height)
+
+        return self.buffer[start * self.stride : max(start, stop) * self.stride]
+
+    def tile(self: Self, rect: Any) -> bytes:
+        """Copy the raw pixel data of a rectangle out of the file.
+
+        Args:
+            rect: The (x, y, width, height) of the tile, or a pygame.Rect.
+
+        Returns:
+            The tile's raw pixel data, row after row.
+
+        Raises:
+            ValueError: The tile isn't inside the image.
+        """
+        (x, y, width, height) = rect
+
+        if x < 0 or y < 0 or x + width > self.width or y + height > self.height:
+            raise ValueError(f'Tile {tuple(rect)} is outside the {self.width}x{self.height} image')
+
+        if width == self.width:
+            return bytes(self.rows(y, y + height))
+
+        start = y * self.stride + x * self.pixel_size
+        length = width * self.pixel_size
+
+        return b''.join(
+            self.buffer[row : row + length]
+            for row in range(start, start + height * self.stride, self.stride)
+        )
+
+    def image(self: Self, pixel_data: bytes, width: int, height: int) -> pygame.Surface:
+        """Produce a pygame.image object from pixel data in the file's format.
+
+        Args:
+            pixel_data: The raw pixel data.
+            width: The width of the image.
+            height: The height of the image.
+
+        Returns:
+            The image.
+        """
+        if self.pixel_format in PACKED_FORMATS:
+            return image_from_packed_rgb(
+                pixel_data, width, height, pixel_format=self.pixel_format, byteorder=self.byteorder
+            )
+
+        alpha = self.pixel_format == 'RGBA'
+
+        return image_from_pixels(
+            pixel_data, width, height, alpha=alpha, pixel_format=self.pixel_format
+        )
+
+    def rows_image(self: Self, start: int, stop: int | None = None) -> pygame.Surface:
+        """Produce a pygame.image object from a range of rows.
+
+        Args:
+            start: The first row.
+            stop: The row after the last, or None for the end of the image.
+
+        Returns:
+            The image.
+        """
+        pixel_data = self.rows(start, stop)
+
+        return self.image(pixel_data, self.width, pixel_data.nbytes // self.stride)
+
+    def tile_image(self: Self, rect: Any) -> pygame.Surface:
+        """Produce a pygame.image object from a rectangle of the file.
+
+        Args:
+            rect: The (x, y, width, height) of the tile, or a pygame.Rect.
+
+        Returns:
+            The image.
+        """
+        (_, _, width, height) = rect
+
+        return self.image(self.tile(rect), width, height)
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import collections
 import logging
 import time
 from typing import TYPE_CHECKING, ClassVar, Self
@@ -10,11 +11,11 @@ from typing import TYPE_CHECKING, ClassVar, Self
 import pygame
 from glitchygames import events
 from glitchygames.color import BLACK
-from glitchygames.events.mouse import MousePointer
 from glitchygames.interfaces import SceneInterface, SpriteInterface
+from glitchygames.sprites import RootSprite
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 LOG = logging.getLogger('game.scenes')
 LOG.addHandler(logging.NullHandler())
@@ -30,6 +31,16 @@ class SceneManager(SceneInterface, events.EventManager):
     log: ClassVar = LOG
     OPTIONS: ClassVar = {}
 
+    # The timed phases of a single pass through the scene loop
+    PHASES: ClassVar = (
+        'dt_tick',
+        'process_events',
+        'update',
+        'render',
+        'display_update',
+        'switch_to_scene',
+    )
+
     def __init__(self: Self) -> None:
         """Initialize the scene manager.
 
@@ -43,6 +54,8 @@ class SceneManager(SceneInterface, events.EventManager):
         self.update_type = 'update'
         self.fps_refresh_rate = 1000
         self.target_fps = 0
+        self.tick_rate = 0
+        self.max_ticks_per_frame = 5
         self.dt = 0
         self.timer = 0
         self._game_engine = None
@@ -51,6 +64,21 @@ class SceneManager(SceneInterface, events.EventManager):
         self.previous_scene = self.active_scene
         self.quit_requested = False
 
+        # Benchmark mode runs a fixed number of frames uncapped and then quits
+        self.benchmark_frames = 0
+
+        # Per-phase timings, in seconds, for the most recent frames.
+        #
+        # Each entry has a key for every phase, plus 'frame' for the whole frame.
+        self.frame_timing: dict[str, float] = self.new_frame_timing()
+        self.frame_timings: collections.deque[dict[str, float]] = collections.deque(maxlen=300)
+
+        # Running per-phase totals and maximums since the last FPSEVENT, so
+        # the event doesn't depend on how many frames the ring holds
+        self.interval_frames: int = 0
+        self.interval_totals: dict[str, float] = self.new_frame_timing()
+        self.interval_maxes: dict[str, float] = self.new_frame_timing()
+
         self.clock = pygame.time.Clock()
 
     @property
@@ -70,9 +98,18 @@ class SceneManager(SceneInterface, events.EventManager):
             self.update_type = self.OPTIONS['update_type']
             self.fps_refresh_rate = self.OPTIONS['fps_refresh_rate']
             self.target_fps = self.OPTIONS.get('target_fps', 60)
+            self.tick_rate = self.OPTIONS.get('tick_rate', 0)
+            self.max_ticks_per_frame = self.OPTIONS.get('max_ticks_per_frame', 5)
+            self.benchmark_frames = self.OPTIONS.get('benchmark', 0)
+
+            # Benchmarks report on every frame, so make room for all of them
+            self.frame_timings = collections.deque(
+                maxlen=self.benchmark_frames or self.OPTIONS.get('frame_timing_history', 300)
+            )
             self.log.info(f'Screen update type: {self.update_type}')
             self.log.info(f'FPS Refresh Rate: {self.fps_refresh_rate}')
             self.log.info(f'Target FPS: {self.target_fps}')
+            self.log.info(f'Tick Rate: {self.tick_rate}')
 
     # This enables collided_sprites in sprites.py, since SceneManager is
     # not a scene, but is the entry point for event proxies.
@@ -88,6 +125,20 @@ class SceneManager(SceneInterface, events.EventManager):
 
         return None
 
+    def sprites_at_position(self: Self, pos: tuple) -> list[pygame.sprite.Sprite]:
+        """Return the active scene's sprites at a given position.
+
+        Args:
+            pos (tuple): The position to check.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites at the given position, in draw order.
+        """
+        if self.active_scene:
+            return self.active_scene.sprites_at_position(pos=pos)
+
+        return []
+
     def switch_to_scene(self: Self, next_scene: Scene) -> None:
         """Switch to the next scene.
 
@@ -128,6 +179,9 @@ class SceneManager(SceneInterface, events.EventManager):
 
             self.active_scene = next_scene
 
+            # Handlers resolved through the previous scene are stale now
+            self.invalidate_resolved_handlers()
+
             if self.active_scene:
                 self.active_scene.dt = self.dt
                 self.active_scene.timer = self.timer
@@ -150,6 +204,10 @@ class SceneManager(SceneInterface, events.EventManager):
                 if self.target_fps > 0 and self.active_scene.target_fps == 0:
                     self.active_scene.target_fps = self.target_fps
 
+                # Same for the simulation tick rate; 0 means one update per rendered frame
+                if self.tick_rate > 0 and self.active_scene.tick_rate == 0:
+                    self.active_scene.tick_rate = self.tick_rate
+
                 self.log.info(
                     f'Rendering Scene "{self.active_scene.NAME}({type(self.active_scene)})"'
                     f' at {self.active_scene.target_fps} FPS'
@@ -166,6 +224,7 @@ class SceneManager(SceneInterface, events.EventManager):
 
                 # Per-scene FPS configurability
                 self.target_fps = self.active_scene.target_fps
+                self.tick_rate = self.active_scene.tick_rate
 
     def play(self: Self) -> None:
         """Play the game."""
@@ -174,50 +233,248 @@ class SceneManager(SceneInterface, events.EventManager):
     def start(self: Self) -> None:
         """Start the scene manager.
 
+        If a tick rate is configured, the scene is simulated in fixed
+        steps of 1 / tick_rate seconds, decoupled from the render rate.
+
         Returns:
             None
         """
         previous_time: float = time.perf_counter()
         previous_fps_time: float = previous_time
+        previous_tick_time: float = previous_time
         current_time: float = previous_time
+        accumulator: float = 0.0
 
         while self.active_scene is not None and self.quit_requested is False:
-            self.clock.tick(self.target_fps)
+            frame_start: float = time.perf_counter()
+            self.frame_timing = self.new_frame_timing()
+
+            # Benchmarks measure how fast we can go, so never cap the framerate
+            self.clock.tick(0 if self.benchmark_frames else self.target_fps)
 
             now: float = time.perf_counter()
             self.dt: float = (now - previous_time) * 10.0
             previous_time = current_time
 
-            self.active_scene.dt_tick(self.dt)
+            if self.tick_rate > 0:
+                accumulator = self.fixed_update(accumulator=accumulator + now - previous_tick_time)
+            else:
+                accumulator = 0.0
+                self.active_scene.interpolation = 1.0
 
-            self.game_engine.process_events()
+                self.time_phase('dt_tick', self.active_scene.dt_tick, self.dt)
 
-            self.active_scene.update()
+                self.time_phase('process_events', self.game_engine.process_events)
 
-            self.active_scene.render(self.screen)
+                self.time_phase('update', self.active_scene.update)
 
-            if self.update_type == 'update':
-                pygame.display.update(self.active_scene.rects)
-            elif self.update_type == 'flip':
-                pygame.display.flip()
+            previous_tick_time = now
+
+            # The next hit-test re-bins the sprites that moved this frame
+            self.time_phase('update', self.active_scene.invalidate_sprite_index)
+
+            self.time_phase('render', self.active_scene.render, self.screen)
+
+            self.time_phase('display_update', self.update_display)
 
             if (current_time - previous_fps_time) * 1000 >= self.OPTIONS['fps_refresh_rate']:
                 pygame.event.post(
-                    pygame.event.Event(events.FPSEVENT, {'fps': self.clock.get_fps()})
+                    pygame.event.Event(
+                        events.FPSEVENT,
+                        {
+                            'fps': self.clock.get_fps(),
+                            'frame_timings': self.interval_timing_summary(),
+                        },
+                    )
                 )
 
                 previous_fps_time = current_time
+                self.reset_interval_timings()
 
-            self.switch_to_scene(self.active_scene.next_scene)
+            self.time_phase('switch_to_scene', self.switch_to_scene, self.active_scene.next_scene)
 
             current_time = time.perf_counter()
 
+            self.frame_timing['frame'] = current_time - frame_start
+            self.frame_timings.append(self.frame_timing)
+            self.accumulate_frame_timing(self.frame_timing)
+
+            if self.benchmark_frames and len(self.frame_timings) >= self.benchmark_frames:
+                self.log.info(f'Benchmark complete after {len(self.frame_timings)} frames.')
+                self.quit_requested = True
+
         self.log.info(
             f'Game Quitting: Active Scene: {self.active_scene}, '
             f'Quit Requested: {self.quit_requested}'
         )
         return self.terminate()
 
+    def fixed_update(self: Self, accumulator: float) -> float:
+        """Run the fixed timestep simulation steps for one rendered frame.
+
+        Events are processed once, then the active scene is stepped
+        once for every full tick in the accumulator.  The number of
+        steps is clamped to max_ticks_per_frame so a slow frame can't
+        snowball into ever longer frames (the "spiral of death");
+        any time beyond the clamp is dropped and the simulation slows
+        down instead.
+
+        The leftover fraction of a tick is stored on the active scene
+        as scene.interpolation (0.0 - 1.0) so render() can blend
+        between the previous and current simulation state.
+
+        Args:
+            accumulator (float): The unsimulated time in seconds.
+
+        Returns:
+            float: The unsimulated time left over after stepping.
+        """
+        step: float = 1.0 / self.tick_rate
+        accumulator = min(accumulator, step * self.max_ticks_per_frame)
+
+        # dt is expressed in the same units as the variable timestep loop
+        self.dt = step * 10.0
+
+        self.time_phase('process_events', self.game_engine.process_events)
+
+        while accumulator >= step and self.active_scene.next_scene is self.active_scene:
+            self.time_phase('dt_tick', self.active_scene.dt_tick, self.dt)
+            self.time_phase('update', self.active_scene.update)
+            accumulator -= step
+
+        self.active_scene.interpolation = accumulator / step
+
+        return accumulator
+
+    def update_display(self: Self) -> None:
+        """Push the active scene's changes to the display.
+
+        Returns:
+            None
+        """
+        if self.update_type == 'update':
+            pygame.display.update(self.active_scene.rects)
+        elif self.update_type == 'flip':
+            pygame.display.flip()
+
+    def time_phase(self: Self, phase: str, func: Callable, *args: object) -> object:
+        """Call func(*args) and add the time it took to the phase's total.
+
+        Args:
+            phase (str): One of SceneManager.PHASES.
+            func (Callable): The function to call.
+            *args: The positional arguments for func.
+
+        Returns:
+            object: The return value of func.
+        """
+        start: float = time.perf_counter()
+        result = func(*args)
+        self.frame_timing[phase] += time.perf_counter() - start
+
+        return result
+
+    def new_frame_timing(self: Self) -> dict[str, float]:
+        """Return an empty timing record for a single frame.
+
+        Returns:
+            dict[str, float]: Zeroed timings keyed by phase, plus 'frame'.
+        """
+        return dict.fromkeys((*self.PHASES, 'frame'), 0.0)
+
+    def accumulate_frame_timing(self: Self, timing: dict[str, float]) -> None:
+        """Add a frame's timings to the totals for the next FPSEVENT.
+
+        Args:
+            timing (dict[str, float]): The frame's timings, from new_frame_timing().
+
+        Returns:
+            None
+        """
+        totals: dict[str, float] = self.interval_totals
+        maxes: dict[str, float] = self.interval_maxes
+
+        for phase, seconds in timing.items():
+            totals[phase] += seconds
+            maxes[phase] = max(maxes[phase], seconds)
+
+        self.interval_frames += 1
+
+    def reset_interval_timings(self: Self) -> None:
+        """Start a new FPSEVENT interval.
+
+        Returns:
+            None
+        """
+        self.interval_frames = 0
+        self.interval_totals = self.new_frame_timing()
+        self.interval_maxes = self.new_frame_timing()
+
+    def interval_timing_summary(self: Self) -> dict[str, dict[str, float]]:
+        """Aggregate the timings of every frame since the last FPSEVENT.
+
+        This is attached to every FPSEVENT as event.frame_timings.  Unlike
+        frame_timing_summary(), it covers the whole interval no matter how
+        many frames the timing ring keeps.
+
+        Returns:
+            dict[str, dict[str, float]]: For each phase and 'frame', the
+            'mean', 'max' and 'total' time in seconds.  An empty dict if
+            no frames have been recorded.
+        """
+        if not self.interval_frames:
+            return {}
+
+        return {
+            phase: {
+                'mean': total / self.interval_frames,
+                'max': self.interval_maxes[phase],
+                'total': total,
+            }
+            for phase, total in self.interval_totals.items()
+        }
+
+    def recent_frame_timings(self: Self, frames: int | None = None) -> list[dict[str, float]]:
+        """Return the timing records for the most recent frames.
+
+        Args:
+            frames (int | None): How many frames to return (default: all recorded frames).
+
+        Returns:
+            list[dict[str, float]]: Per-phase timings in seconds, oldest first.
+        """
+        timings: list[dict[str, float]] = list(self.frame_timings)
+
+        if frames is not None:
+            timings = timings[-frames:] if frames > 0 else []
+
+        return timings
+
+    def frame_timing_summary(self: Self, frames: int | None = None) -> dict[str, dict[str, float]]:
+        """Aggregate the timings of the most recent frames in the timing ring.
+
+        Args:
+            frames (int | None): How many frames to aggregate (default: all recorded frames).
+
+        Returns:
+            dict[str, dict[str, float]]: For each phase and 'frame', the
+            'mean', 'max' and 'total' time in seconds.  An empty dict if
+            no frames have been recorded.
+        """
+        timings: list[dict[str, float]] = self.recent_frame_timings(frames=frames)
+
+        if not timings:
+            return {}
+
+        summary: dict[str, dict[str, float]] = {}
+
+        for phase in (*self.PHASES, 'frame'):
+            samples: list[float] = [timing[phase] for timing in timings]
+            total: float = sum(samples)
+            summary[phase] = {'mean': total / len(samples), 'max': max(samples), 'total': total}
+
+        return summary
+
     def stop(self: Self) -> None:
         """Stop the game."""
         return self.terminate()
@@ -323,17 +580,228 @@ class SceneManager(SceneInterface, events.EventManager):
             Callable: The callable object.
         """
         # Attempt to proxy the call to the active scene.
+        #
+        # The result is memoized until the next scene switch.
         if attr.startswith('on_') and attr.endswith('_event'):
             try:
                 # Pass it to the active scene for handling
-                return getattr(self.active_scene, attr)
+                return self.resolve_handler(attr, getattr(self.active_scene, attr))
             except AttributeError:
                 # Pass it to the game engine for suppression
-                return getattr(self.game_engine, attr)
+                return self.resolve_handler(attr, getattr(self.game_engine, attr))
         else:
             raise AttributeError(f"'{type(self)}' object has no attribute '{attr}'")
 
 
+class SpriteIndex:
+    """A uniform grid spatial index over a scene's sprites.
+
+    Each sprite is binned into every cell its rect overlaps, so point
+    and rect queries only have to test the sprites in a few cells
+    instead of the whole sprite group.
+
+    pygame rects are mutated in place, so the index can't observe
+    sprites moving.  move() compares a sprite's rect against the one
+    it was binned with and re-bins it if it changed; refresh() does
+    that for a whole group and also picks up additions and removals.
+    Scenes call them lazily, before the first hit-test after a frame
+    touched any sprites.  Code that moves a sprite and needs to
+    hit-test it again within the same frame can call move(sprite) to
+    re-bin it right away.
+    """
+
+    def __init__(self: Self, cell_size: int = 64) -> None:
+        """Initialize the sprite index.
+
+        Args:
+            cell_size (int): The width and height of a grid cell in pixels.
+
+        Returns:
+            None
+        """
+        self.cell_size = cell_size
+        self.group = None
+
+        # (column, row) -> sprites overlapping that cell
+        self.cells: dict[tuple[int, int], set] = collections.defaultdict(set)
+
+        # sprite -> the rect it was binned with, and the cells it's in
+        self.rects: dict[pygame.sprite.Sprite, tuple[int, int, int, int]] = {}
+        self.sprite_cells: dict[pygame.sprite.Sprite, tuple[tuple[int, int], ...]] = {}
+
+        # sprite -> position in the group's draw order (bottom layer first)
+        self.order: dict[pygame.sprite.Sprite, int] = {}
+
+        # The group's sprites as of the last refresh(), in draw order
+        self.sprites: list[pygame.sprite.Sprite] = []
+
+    def cells_for(self: Self, rect: tuple[int, int, int, int]) -> tuple[tuple[int, int], ...]:
+        """Return the grid cells a rect overlaps.
+
+        Args:
+            rect (tuple[int, int, int, int]): The rect as (x, y, width, height).
+
+        Returns:
+            tuple[tuple[int, int], ...]: The (column, row) of every overlapped cell.
+        """
+        x, y, width, height = rect
+
+        # Empty rects can't collide with anything
+        if width <= 0 or height <= 0:
+            return ()
+
+        size = self.cell_size
+
+        return tuple(
+            (column, row)
+            for column in range(x // size, (x + width - 1) // size + 1)
+            for row in range(y // size, (y + height - 1) // size + 1)
+        )
+
+    def move(self: Self, sprite: pygame.sprite.Sprite) -> None:
+        """Re-bin a sprite if its rect changed since it was indexed.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to re-bin.
+
+        Returns:
+            None
+        """
+        rect = tuple(sprite.rect)
+
+        if self.rects.get(sprite) == rect:
+            return
+
+        self.discard(sprite)
+
+        self.rects[sprite] = rect
+        self.sprite_cells[sprite] = self.cells_for(rect)
+
+        for cell in self.sprite_cells[sprite]:
+            self.cells[cell].add(sprite)
+
+    def discard(self: Self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a sprite from the grid.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to remove.
+
+        Returns:
+            None
+        """
+        self.rects.pop(sprite, None)
+
+        for cell in self.sprite_cells.pop(sprite, ()):
+            sprites = self.cells[cell]
+            sprites.discard(sprite)
+
+            if not sprites:
+                del self.cells[cell]
+
+    def refresh(self: Self, group: pygame.sprite.AbstractGroup) -> None:
+        """Bring the index up to date with a sprite group.
+
+        Sprites that were added to the group are binned, sprites that
+        were removed are dropped, and sprites that moved are re-binned.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group to index.
+
+        Returns:
+            None
+        """
+        if group is not self.group:
+            self.clear()
+            self.group = group
+
+        # LayeredUpdates.sprites() is in draw order, bottom layer first
+        sprites = self.sprites = group.sprites()
+        self.order = {sprite: position for position, sprite in enumerate(sprites)}
+
+        for sprite in [sprite for sprite in self.rects if sprite not in self.order]:
+            self.discard(sprite)
+
+        for sprite in sprites:
+            self.move(sprite)
+
+    def matches(self: Self, group: pygame.sprite.AbstractGroup) -> bool:
+        """Return whether the index has the group's sprites, in its draw order.
+
+        This catches sprites being killed and added in the same frame, and
+        layer changes, which a length check can't.  It doesn't check rects;
+        move() does that.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group to check.
+
+        Returns:
+            bool: True if refresh() would find no sprites added, removed or reordered.
+        """
+        return group is self.group and group.sprites() == self.sprites
+
+    def clear(self: Self) -> None:
+        """Remove every sprite from the index.
+
+        Returns:
+            None
+        """
+        self.group = None
+        self.cells.clear()
+        self.rects.clear()
+        self.sprite_cells.clear()
+        self.order.clear()
+        self.sprites = []
+
+    def sprites_at_point(self: Self, pos: tuple[int, int]) -> list[pygame.sprite.Sprite]:
+        """Return the sprites under a point, in draw order.
+
+        Args:
+            pos (tuple[int, int]): The point to check.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites under the point.
+        """
+        x, y = pos
+        candidates = self.cells.get((int(x) // self.cell_size, int(y) // self.cell_size), ())
+
+        return self.in_draw_order(
+            sprite for sprite in candidates if sprite.rect.collidepoint(x, y)
+        )
+
+    def sprites_in_rect(self: Self, rect: pygame.Rect | tuple) -> list[pygame.sprite.Sprite]:
+        """Return the sprites overlapping a rect, in draw order.
+
+        Args:
+            rect (pygame.Rect | tuple): The rect to check.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites overlapping the rect.
+        """
+        rect = pygame.Rect(rect)
+        candidates = set()
+
+        for cell in self.cells_for(tuple(rect)):
+            candidates.update(self.cells.get(cell, ()))
+
+        return self.in_draw_order(
+            sprite for sprite in candidates if sprite.rect.colliderect(rect)
+        )
+
+    def in_draw_order(self: Self, sprites: Iterable) -> list[pygame.sprite.Sprite]:
+        """Sort sprites into the order their group draws them in.
+
+        Args:
+            sprites (Iterable): The sprites to sort.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sorted sprites.
+        """
+        # Sprites moved in before the next refresh() draw on top
+        top = len(self.order)
+
+        return sorted(sprites, key=lambda sprite: self.order.get(sprite, top))
+
+
 class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
     """Scene object base class.
 
@@ -344,6 +812,7 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
     FPS = 0
     NAME = 'Unnamed Scene'
     VERSION = '0.0'
+    SPRITE_INDEX_CELL_SIZE = 64
 
     def __init__(
         self: Self, options: dict | None = None, groups: pygame.sprite.LayeredDirty | None = None
@@ -377,9 +846,18 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         # new scenes to care about the SceneManager when being
         # instantiated.
         self.target_fps = 0
+        self.tick_rate = 0
         self.fps = 0
         self.dt = 0
         self.dt_timer = 0
+
+        # Fraction of a simulation tick not yet simulated when render() is called.
+        #
+        # This is always 1.0 unless the scene runs at a fixed tick rate.
+        self.interpolation = 1.0
+
+        # Updated by on_fps_event() with SceneManager.interval_timing_summary()
+        self.frame_timings = {}
         self.dirty = 1
         self.options = options
         self.scene_manager = SceneManager()
@@ -394,6 +872,30 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         # http://n0nick.github.io/blog/2012/06/03/quick-dirty-using-pygames-dirtysprite-layered/
         self.all_sprites = groups
 
+        # Spatial index over all_sprites for sprites_at_position()
+        self.sprite_index = SpriteIndex(cell_size=self.SPRITE_INDEX_CELL_SIZE)
+
+        # Sprites which get update() called every frame, dirty or not.
+        #
+        # Other sprites are only updated on frames where they were marked dirty.
+        self.update_sprites = set()
+
+        # Sprites in all_sprites which aren't RootSprites, like plain
+        # pygame DirtySprites.  They don't report being dirtied, so their
+        # dirty flag is checked every frame.  Rebuilt when all_sprites'
+        # members change.
+        self.plain_sprites: list[pygame.sprite.Sprite] = []
+        self.plain_sprites_members: list[pygame.sprite.Sprite] = []
+
+        # Sprites only move while they're being updated, so the spatial index
+        # is brought up to date lazily by the next hit-test: the sprites
+        # update() touched since then are re-binned, or every sprite when
+        # sprite_index_stale is set.  Scenes which override update() without
+        # calling super() don't record what they touched and always reindex.
+        self.touched_sprites = set()
+        self.sprites_tracked = False
+        self.sprite_index_stale = True
+
         # Initial screen state.
 
         self.screen = pygame.display.get_surface()
@@ -478,18 +980,110 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         Returns:
             None
         """
+        active_sprites = self.active_sprites()
+
         # Tweak to enable compound sprites to manage their own subsprites dirty states
-        #
-        # Ideally we'd just make dirty a property with a setter and getter on each
-        # sprite object, but that doesn't work for some reason.
-        [sprite.update_nested_sprites() for sprite in self.all_sprites]
-        [sprite.update() for sprite in self.all_sprites if sprite.dirty]
+        [
+            sprite.update_nested_sprites()
+            for sprite in active_sprites
+            if hasattr(sprite, 'update_nested_sprites')
+        ]
+
+        # Nested sprites dirtied by their parents get updated this frame too
+        nested_sprites = set(self.active_sprites()).difference(active_sprites)
+
+        if nested_sprites:
+            active_sprites = self.sprite_index.in_draw_order({*active_sprites, *nested_sprites})
+
+        [
+            sprite.update()
+            for sprite in active_sprites
+            if sprite.dirty or sprite in self.update_sprites
+        ]
+
+        self.touched_sprites.update(active_sprites)
+        self.sprites_tracked = True
 
         # Make all of the new scene's sprites dirty to force a redraw
         if self.dirty:
             for sprite in self.all_sprites:
                 sprite.dirty = 1 if not sprite.dirty else sprite.dirty
 
+            self.sprite_index_stale = True
+            self.dirty = 0
+
+    def active_sprites(self: Self) -> list[pygame.sprite.Sprite]:
+        """Return the sprites which need updating this frame, in draw order.
+
+        These are the sprites registered with register_update(), plus
+        every sprite in all_sprites which was marked dirty since the
+        last frame.  Sprites with dirty == 2 are dirty on every frame.
+        Sprites which aren't RootSprites are included whenever their
+        dirty flag is set.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites to update.
+        """
+        active_sprites = set()
+        dirty_sprites = RootSprite.dirty_sprites(self.all_sprites)
+
+        for sprite in list(dirty_sprites):
+            # kill() doesn't tell the sprite which groups it left
+            if sprite in self.all_sprites:
+                active_sprites.add(sprite)
+
+            # dirty == 2 sprites stay in the set since they're always dirty
+            if sprite.dirty != 2 or sprite not in self.all_sprites:  # noqa: PLR2004
+                dirty_sprites.discard(sprite)
+
+        active_sprites.update(
+            sprite for sprite in self.update_sprites if sprite in self.all_sprites
+        )
+        active_sprites.update(sprite for sprite in self.non_root_sprites() if sprite.dirty)
+
+        return self.sprite_index.in_draw_order(active_sprites)
+
+    def non_root_sprites(self: Self) -> list[pygame.sprite.Sprite]:
+        """Return the sprites in all_sprites which aren't RootSprites.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites, in draw order.
+        """
+        members = self.all_sprites.sprites()
+
+        # Comparing by identity is cheap next to checking the type of every sprite
+        if members != self.plain_sprites_members:
+            self.plain_sprites_members = members
+
+            # Not isinstance(), since the events ABC hooks fail on plain pygame sprites
+            self.plain_sprites = [
+                sprite for sprite in members if RootSprite not in type(sprite).__mro__
+            ]
+
+        return self.plain_sprites
+
+    def register_update(self: Self, sprite: pygame.sprite.Sprite) -> None:
+        """Call a sprite's update() every frame, even when it isn't dirty.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to update.
+
+        Returns:
+            None
+        """
+        self.update_sprites.add(sprite)
+
+    def unregister_update(self: Self, sprite: pygame.sprite.Sprite) -> None:
+        """Stop calling a sprite's update() every frame.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite to stop updating.
+
+        Returns:
+            None
+        """
+        self.update_sprites.discard(sprite)
+
     def render(self: Self, screen: pygame.Surface) -> None:
         """Render the active scene.
 
@@ -510,9 +1104,62 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         Returns:
             list[pygame.sprite.Sprite] | None: The sprites at the given position.
         """
-        mouse = MousePointer(pos=pos)
+        self.index_sprites()
+
+        return self.sprite_index.sprites_at_point(pos)
+
+    def sprites_in_rect(self: Self, rect: pygame.Rect | tuple) -> list[pygame.sprite.Sprite]:
+        """Return the sprites overlapping a rect.
+
+        Args:
+            rect (pygame.Rect | tuple): The rect to check.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites overlapping the rect, in draw order.
+        """
+        self.index_sprites()
+
+        return self.sprite_index.sprites_in_rect(rect)
+
+    def invalidate_sprite_index(self: Self) -> None:
+        """Mark the spatial index for a full rebuild if update() wasn't tracked.
 
-        return pygame.sprite.spritecollide(sprite=mouse, group=self.all_sprites, dokill=False)
+        Called by the scene manager once per frame after update().  This
+        doesn't touch the index itself; index_sprites() catches it up on the
+        next hit-test, so frames without one cost nothing.
+
+        Returns:
+            None
+        """
+        if not self.sprites_tracked:
+            self.sprite_index_stale = True
+
+        self.sprites_tracked = False
+
+    def index_sprites(self: Self) -> None:
+        """Bring the spatial index up to date with all_sprites.
+
+        Only the sprites update() touched since the last call are re-binned.
+        The whole group is re-indexed when all_sprites was replaced (scenes
+        may do that at any time, e.g. in setup()), when sprites were added,
+        removed or moved between layers, or when the scene's update() didn't
+        record what it touched.
+
+        Returns:
+            None
+        """
+        index = self.sprite_index
+
+        if self.sprite_index_stale or not index.matches(self.all_sprites):
+            index.refresh(self.all_sprites)
+        else:
+            # Bins the touched sprites that aren't indexed yet, too
+            for sprite in self.touched_sprites:
+                if sprite in index.order:
+                    index.move(sprite)
+
+        self.touched_sprites.clear()
+        self.sprite_index_stale = False
 
     # def on_active_event(self: Self, event: events.HashableEvent) -> None:
     #     """Handle active events.
@@ -1561,6 +2208,9 @@ class Scene(SceneInterface, SpriteInterface, events.AllEventStubs):
         self.log.info(f'Scene "{self.NAME}" ({type(self)}) FPS: {event.fps}')
         self.fps = event.fps
 
+        # Per-phase timings aggregated since the last FPS event
+        self.frame_timings = getattr(event, 'frame_timings', {})
+
     def load_resources(self: Self) -> None:
         """Load the scene's resources.
 
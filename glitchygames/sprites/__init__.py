@@ -8,6 +8,9 @@ import logging
 
 import collections
 import configparser
+import itertools
+import sys
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Self, cast
 
@@ -17,8 +20,15 @@ import pygame.gfxdraw
 import pygame.locals
 import yaml
 from glitchygames.color import BLACK, WHITE
+from glitchygames.color.palette import ColorPalette
 from glitchygames.fonts import FontManager
-from glitchygames.pixels import image_from_pixels, pixels_from_data
+from glitchygames.pixels import image_from_indexed, indexed_pixels, packed_pixels
+from glitchygames.sprites import binary
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; inflate() falls back to bytes.translate()
+    np = None
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -48,6 +58,13 @@ if not LOG.handlers:
 class RootSprite(MouseEvents, SpriteInterface, pygame.sprite.DirtySprite):
     """A root sprite class.  All Glitchy Games sprites inherit from this class."""
 
+    # Sprite group -> the sprites in it that were marked dirty since the
+    # group's scene last updated them.
+    #
+    # Scene.update() only visits its own group's dirty sprites instead of all
+    # of its sprites, so scenes never see each other's sprites.
+    DIRTY_SPRITES: ClassVar = weakref.WeakKeyDictionary()
+
     def __init__(self: Self, groups: pygame.sprite.LayeredDirty | None = None) -> None:
         """Initialize a RootSprite.
 
@@ -64,6 +81,60 @@ class RootSprite(MouseEvents, SpriteInterface, pygame.sprite.DirtySprite):
         self.rect = pygame.Rect(0, 0, 0, 0)
         self.image = None
 
+    @classmethod
+    def dirty_sprites(cls: Any, group: pygame.sprite.AbstractGroup) -> weakref.WeakSet:
+        """Return the sprites in a group which were marked dirty.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The sprite group.
+
+        Returns:
+            weakref.WeakSet: The group's dirty sprites.
+        """
+        return RootSprite.DIRTY_SPRITES.setdefault(group, weakref.WeakSet())
+
+    def add_internal(self: Self, group: pygame.sprite.AbstractGroup) -> None:
+        """Add the sprite to a group, carrying its dirty state over.
+
+        Args:
+            group (pygame.sprite.AbstractGroup): The group the sprite was added to.
+
+        Returns:
+            None
+        """
+        super().add_internal(group)
+
+        if self._dirty:
+            RootSprite.dirty_sprites(group).add(self)
+
+    @property
+    def dirty(self: Self) -> int:
+        """Return the sprite's dirty flag.
+
+        Returns:
+            int: 0 for clean, 1 for redraw once, 2 for redraw every frame.
+        """
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self: Self, new_dirty: int) -> None:
+        """Set the sprite's dirty flag.
+
+        Args:
+            new_dirty (int): 0 for clean, 1 for redraw once, 2 for redraw every frame.
+
+        Returns:
+            None
+        """
+        self._dirty = new_dirty
+
+        # DirtySprite.__init__() sets dirty before the sprite has joined any
+        # groups, so read pygame's group set directly; add_internal() records
+        # the sprite in each group as it's added
+        if new_dirty:
+            for group in self.__dict__.get('_Sprite__g', ()):
+                RootSprite.dirty_sprites(group).add(self)
+
 
 class Sprite(RootSprite):
     """A convenience class for handling all of the common sprite behaviors."""
@@ -921,10 +992,200 @@ class Sprite(RootSprite):
         return f'{type(self)} "{self.name}" ({self!r})'
 
 
+class SpriteAssetCache:
+    """A least recently used cache of the images loaded from sprite files.
+
+    Entries are keyed by the resolved path of the file plus its mtime
+    and size, so editing a file on disk invalidates its entry.  Sprites
+    get their own copy of a cached image unless they opt into sharing
+    it, see BitmappySprite's share_image argument.
+
+    The cache is capped by the total size of its surfaces in bytes.
+    """
+
+    def __init__(self: Self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initialize the sprite asset cache.
+
+        Args:
+            max_bytes (int): The total surface size to keep cached, in bytes.
+
+        Returns:
+            None
+        """
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # (path, mtime, size) -> (image, name), least recently used first
+        self.entries: collections.OrderedDict = collections.OrderedDict()
+
+    @staticmethod
+    def key(filename: str) -> tuple[str, int, int]:
+        """Return the cache key for a sprite file.
+
+        Args:
+            filename (str): The sprite file.
+
+        Returns:
+            tuple[str, int, int]: The resolved path, mtime in nanoseconds and size.
+
+        Raises:
+            FileNotFoundError: The file doesn't exist.
+        """
+        path = Path(filename).resolve()
+        stat = path.stat()
+
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def get(self: Self, key: tuple[str, int, int]) -> tuple[pygame.Surface, str] | None:
+        """Return the cached image and name for a key.
+
+        Args:
+            key (tuple[str, int, int]): The key from SpriteAssetCache.key().
+
+        Returns:
+            tuple[pygame.Surface, str] | None: The image and name, or None on a miss.
+        """
+        entry = self.entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+
+        return entry
+
+    def put(
+        self: Self, key: tuple[str, int, int], image: pygame.Surface, name: str
+    ) -> pygame.Surface:
+        """Cache an image, evicting the least recently used ones over the cap.
+
+        The image is converted to the display's pixel format first, if
+        there is a display and it isn't in that format already, see
+        display_image().
+
+        Args:
+            key (tuple[str, int, int]): The key from SpriteAssetCache.key().
+            image (pygame.Surface): The image loaded from the file.
+            name (str): The sprite name loaded from the file.
+
+        Returns:
+            pygame.Surface: The cached image.
+        """
+        image = self.display_image(image)
+
+        # Older versions of the same file are never going to be hit again
+        for stale_key in [stale_key for stale_key in self.entries if stale_key[0] == key[0]]:
+            self.discard(stale_key)
+
+        self.entries[key] = (image, name)
+        self.bytes += self.image_bytes(image)
+
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            self.discard(next(iter(self.entries)))
+            self.evictions += 1
+
+        return image
+
+    def discard(self: Self, key: tuple[str, int, int]) -> None:
+        """Remove an entry from the cache.
+
+        Args:
+            key (tuple[str, int, int]): The key from SpriteAssetCache.key().
+
+        Returns:
+            None
+        """
+        image, _ = self.entries.pop(key)
+        self.bytes -= self.image_bytes(image)
+
+    def clear(self: Self) -> None:
+        """Remove every entry from the cache.
+
+        Returns:
+            None
+        """
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self: Self) -> dict[str, int]:
+        """Return the cache counters.
+
+        Returns:
+            dict[str, int]: Hits, misses, evictions, entries and bytes.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+        }
+
+    @staticmethod
+    def display_image(image: pygame.Surface) -> pygame.Surface:
+        """Return an image in the display's pixel format.
+
+        Converting copies the pixels, so images which already match the
+        display are returned as they are, and so are 8 bit images, which
+        would lose their palette.  That keeps memory mapped binary
+        sprites mapped when their pixel layout matches; RGB and RGBA
+        binary sprites are stored in RGB byte order, which doesn't match
+        the usual 32 bit BGRA display, so they're still copied once.
+
+        Args:
+            image (pygame.Surface): The image to convert.
+
+        Returns:
+            pygame.Surface: The image, or a converted copy of it.
+        """
+        display = pygame.display.get_surface()
+
+        # Indexed images would lose their palette, see BitmappySprite.set_palette()
+        if display is None or image.get_bitsize() == 8:  # noqa: PLR2004
+            return image
+
+        matches_display = (
+            image.get_bitsize() == display.get_bitsize()
+            and image.get_masks()[:3] == display.get_masks()[:3]
+        )
+
+        # Keep per pixel alpha, convert() would drop it
+        if image.get_flags() & pygame.SRCALPHA:
+            return image if matches_display else image.convert_alpha()
+
+        return image if matches_display else image.convert()
+
+    @staticmethod
+    def image_bytes(image: pygame.Surface) -> int:
+        """Return the size of a surface's pixel data.
+
+        Args:
+            image (pygame.Surface): The surface.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return image.get_pitch() * image.get_height()
+
+
 class BitmappySprite(Sprite):
     """A sprite that loads from a Bitmappy config file."""
 
     DEBUG = False
+
+    # Images loaded from sprite files, copied (or shared) by every sprite using the same file
+    ASSET_CACHE: ClassVar = SpriteAssetCache()
+
+    # A glitchygames.sprites.atlas.TextureAtlas to take sprite images from, if any
+    ATLAS: ClassVar = None
+
+    # Plain images decode() loads with pygame instead of parsing
+    IMAGE_EXTENSIONS: ClassVar = ('.png', '.bmp', '.gif', '.tga')
     DEFAULT_SURFACE_W = 42
     DEFAULT_SURFACE_H = 42
     DEFAULT_SURFACE = pygame.Surface((DEFAULT_SURFACE_W, DEFAULT_SURFACE_H))
@@ -943,6 +1204,9 @@ class BitmappySprite(Sprite):
         focusable: bool = False,
         parent: object = None,
         groups: pygame.sprite.LayeredDirty | None = None,
+        palette: ColorPalette | list | None = None,
+        *,
+        share_image: bool = False,
     ) -> None:
         """Subclass to load sprite files.
 
@@ -956,6 +1220,11 @@ class BitmappySprite(Sprite):
             focusable: optional, whether or not the sprite can receive focus.
             parent: optional, the parent of the sprite.
             groups: optional, the sprite groups to add the sprite to.
+            palette: optional, a ColorPalette (or list of colors) to make the
+                sprite's image an 8 bit indexed surface with, see set_palette().
+            share_image: optional, use the image cached for filename as is instead
+                of a copy of it.  Only for sprites that never draw on their image;
+                own_image() copies it before the first change.
 
         Returns:
             None
@@ -968,6 +1237,10 @@ class BitmappySprite(Sprite):
         )
         self.filename = filename
         self.focusable = focusable
+
+        # The image this sprite shares with ASSET_CACHE until own_image() copies it
+        self.share_image = share_image
+        self.shared_image = None
         # self.width = width
         # self.height = height
 
@@ -984,6 +1257,9 @@ class BitmappySprite(Sprite):
         else:
             raise pygame.error(f"Can't create Surface(({self.width}, {self.height})).")
 
+        if palette is not None:
+            self.set_palette(palette)
+
         self.rect = self.image.get_rect()
         self.parent = parent
         self.rect.x = x
@@ -991,66 +1267,40 @@ class BitmappySprite(Sprite):
         self.proxies = [self.parent]
 
     def load(self: Self, filename: str) -> tuple[pygame.Surface, pygame.Rect, str]:
-        """Load a sprite from a Bitmappy config file."""
-        self.log.debug(f"=== Starting load from {filename} ===")
+        """Load a sprite from a Bitmappy config, YAML or binary sprite file, or an image.
 
-        config = configparser.RawConfigParser(
-            dict_type=collections.OrderedDict,
-            empty_lines_in_values=True,
-            strict=True
-        )
+        The file is decoded by decode().  Files are only decoded once
+        while they're in ASSET_CACHE.  The returned image is a copy of
+        the cached one, or the cached one itself if the sprite was
+        created with share_image=True.
 
-        # Read the raw file content first
-        with open(filename, 'r') as f:
-            raw_content = f.read()
-        self.log.debug(f"Raw file content ({len(raw_content)} bytes):\n{raw_content}")
+        If ATLAS is set and has the file packed, the image comes from
+        the atlas instead, and the file isn't read at all.
+        """
+        if self.ATLAS is not None and (packed := self.ATLAS.find(filename)) is not None:
+            (image, name) = packed
+            self.log.debug(f'Loaded {filename} from the texture atlas')
+            image = self.cached_image(image)
+
+            return (image, image.get_rect(), name)
+
+        key = self.ASSET_CACHE.key(filename)
+        cached = self.ASSET_CACHE.get(key)
 
-        # Try parsing with configparser
-        config.read_string(raw_content)
-        self.log.debug(f"ConfigParser sections: {config.sections()}")
+        if cached is not None:
+            (image, name) = cached
+            self.log.debug(f'Loaded {filename} from the sprite asset cache')
+            image = self.cached_image(image)
+
+            return (image, image.get_rect(), name)
 
         try:
-            name = config.get(section='sprite', option='name')
-            self.log.debug(f"Sprite name: {name}")
+            (image, name) = self.decode(filename)
+            self.log.debug(f'Decoded {filename}: {image.get_size()}')
 
-            # Get raw pixel data with explicit raw=True to preserve newlines
-            pixel_text = config.get(section='sprite', option='pixels', raw=True)
-            self.log.debug(f"Raw pixel text ({len(pixel_text)} bytes):\n{pixel_text}")
-
-            # Split into rows and process each row
-            rows = []
-            for i, row in enumerate(pixel_text.split('\n')):
-                row = row.strip()
-                if row:  # Only add non-empty rows
-                    rows.append(row)
-                    self.log.debug(f"Row {i}: '{row}' (len={len(row)})")
-
-            self.log.debug(f"Total rows processed: {len(rows)}")
-
-            # Calculate dimensions
-            width = len(rows[0]) if rows else 0
-            height = len(rows)
-            self.log.debug(f"Calculated dimensions: {width}x{height}")
-
-            # Get color definitions with detailed logging
-            color_map = {}
-            for section in config.sections():
-                if len(section) == 1:  # Color sections are single characters
-                    red = config.getint(section=section, option='red')
-                    green = config.getint(section=section, option='green')
-                    blue = config.getint(section=section, option='blue')
-                    color_map[section] = (red, green, blue)
-                    self.log.debug(f"Color map entry: '{section}' -> RGB({red}, {green}, {blue})")
-
-            self.log.debug(f"Total colors in map: {len(color_map)}")
-
-            # Create image and rect
-            self.log.debug("Creating image and rect...")
-            (image, rect) = self.inflate(width=width, height=height, pixels=rows, color_map=color_map)
-            self.log.debug(f"Created image size: {image.get_size()}")
-            self.log.debug(f"Created rect: {rect}")
-
-            return (image, rect, name)
+            image = self.cached_image(self.ASSET_CACHE.put(key, image, name))
+
+            return (image, image.get_rect(), name)
 
         except Exception as e:
             self.log.error(f"Error in load: {e}")
@@ -1058,40 +1308,572 @@ class BitmappySprite(Sprite):
             self.log.error(traceback.format_exc())
             raise
 
+    @classmethod
+    def decode(cls: Any, filename: str, *, strict: bool = False) -> tuple[pygame.Surface, str]:
+        """Decode a sprite file into an image, without caching it.
+
+        This is the one place sprite files are turned into images, for
+        load(), texture atlases and the bitmappy batch tools alike.
+        Binary sprites are memory mapped, Bitmappy config and YAML
+        sprites are parsed and inflated, and IMAGE_EXTENSIONS files are
+        loaded with pygame, named after the file.
+
+        Args:
+            filename: the sprite file.
+            strict: whether to reject Bitmappy sprites whose rows aren't
+                all the same width, rather than padding or clipping them.
+
+        Returns:
+            A tuple containing the sprite's image and name.
+
+        Raises:
+            ValueError: strict is set and the rows are different widths.
+        """
+        path = Path(filename)
+
+        if path.suffix.lower() in cls.IMAGE_EXTENSIONS:
+            return (pygame.image.load(filename), path.stem)
+
+        if binary.is_binary_sprite(filename):
+            return binary.read_sprite(filename)
+
+        (name, rows, color_map) = cls.parse(filename)
+
+        widths = {len(row) for row in rows}
+
+        if strict and len(widths) > 1:
+            raise ValueError(f'Rows are not all the same width: {sorted(widths)}')
+
+        (width, height) = cls.grid_size(rows, color_map)
+        (image, _) = cls.inflate(width=width, height=height, pixels=rows, color_map=color_map)
+
+        return (image, name)
+
+    @classmethod
+    def parse(cls: Any, filename: str) -> tuple[str, list[str], dict]:
+        """Parse a Bitmappy INI (.cfg, .ini) or YAML (.yml, .yaml) sprite file.
+
+        Args:
+            filename: the sprite file.
+
+        Returns:
+            A tuple containing the sprite's name, pixel rows and color map.
+        """
+        cls.log.debug(f"=== Starting load from {filename} ===")
+
+        # Read the raw file content first
+        with open(filename, 'r') as f:
+            raw_content = f.read()
+        cls.log.debug(f"Raw file content ({len(raw_content)} bytes):\n{raw_content}")
+
+        color_map = {}
+
+        if Path(filename).suffix.lower() in ('.yml', '.yaml'):
+            config = yaml.safe_load(raw_content)
+
+            name = config['sprite']['name']
+            pixel_text = config['sprite']['pixels']
+
+            for char, color in config['colors'].items():
+                color_map[str(char)] = (color['red'], color['green'], color['blue'])
+        else:
+            config = configparser.RawConfigParser(
+                dict_type=collections.OrderedDict,
+                empty_lines_in_values=True,
+                strict=True
+            )
+
+            # Try parsing with configparser
+            config.read_string(raw_content)
+            cls.log.debug(f"ConfigParser sections: {config.sections()}")
+
+            name = config.get(section='sprite', option='name')
+
+            # Get raw pixel data with explicit raw=True to preserve newlines
+            pixel_text = config.get(section='sprite', option='pixels', raw=True)
+
+            color_map = cls.ini_color_map(config)
+
+        cls.log.debug(f"Sprite name: {name}")
+        cls.log.debug(f"Raw pixel text ({len(pixel_text)} bytes):\n{pixel_text}")
+
+        # Split into rows and process each row
+        rows = []
+        for i, row in enumerate(pixel_text.split('\n')):
+            row = row.strip()
+            if row:  # Only add non-empty rows
+                rows.append(row)
+                cls.log.debug(f"Row {i}: '{row}' (len={len(row)})")
+
+        cls.log.debug(f"Total rows processed: {len(rows)}")
+        cls.log.debug(f"Total colors in map: {len(color_map)}")
+
+        return (name, rows, color_map)
+
+    def cached_image(self: Self, image: pygame.Surface) -> pygame.Surface:
+        """Return the image for this sprite to use from ASSET_CACHE or ATLAS.
+
+        Args:
+            image (pygame.Surface): The cached image or atlas subsurface.
+
+        Returns:
+            pygame.Surface: A copy of the image, or the image itself if the
+                sprite shares it.
+        """
+        if not self.share_image:
+            return image.copy()
+
+        self.shared_image = image
+
+        return image
+
+    def own_image(self: Self) -> pygame.Surface:
+        """Return the sprite's image, copying it first if it's shared.
+
+        Sprites created with share_image=True use the image cached for
+        their file directly, so code that might draw on such a sprite
+        should call this instead of using self.image, before drawing on
+        it, filling it or changing its colorkey.
+
+        Returns:
+            pygame.Surface: An image only this sprite uses.
+        """
+        if self.image is self.shared_image:
+            self.image = self.image.copy()
+            self.shared_image = None
+
+        return self.image
+
+    @staticmethod
+    def palette_colors(palette: ColorPalette | list) -> list[tuple[int, int, int]]:
+        """Return the surface palette of a ColorPalette or list of colors."""
+        if isinstance(palette, ColorPalette):
+            return palette.surface_palette()
+
+        return [tuple(color[:3]) for color in palette[:256]]
+
+    @classmethod
+    def index_image(
+        cls: Any,
+        image: pygame.Surface,
+        palette: ColorPalette | list,
+        nearest: bool = False,
+        dither: str | None = None,
+    ) -> pygame.Surface:
+        """Convert an image to an 8 bit surface indexing a palette.
+
+        An indexed image takes a byte per pixel instead of three or four,
+        and is recolored by changing its palette instead of its pixels.
+        The image's colorkey becomes the index of its color, so it stays
+        transparent through palette swaps.
+
+        Args:
+            image: the image to convert.
+            palette: the ColorPalette or list of colors to index.
+            nearest: whether to map colors that aren't in the palette to the
+                nearest ones, see ColorPalette.quantize().
+            dither: how to dither nearest colors, see ColorPalette.nearest_indexes().
+
+        Returns:
+            The 8 bit image.
+
+        Raises:
+            ValueError: The image has colors that aren't in the palette, and
+                nearest is False.
+        """
+        colorkey = image.get_colorkey()
+        key_index = None
+
+        if nearest:
+            if not isinstance(palette, ColorPalette):
+                palette = ColorPalette(colors=cls.palette_colors(palette))
+
+            indexed = palette.quantize(image, dither=dither)
+
+            if colorkey is not None:
+                key_index = palette.nearest_index(colorkey)
+        else:
+            colors = cls.palette_colors(palette)
+            (width, height) = image.get_size()
+            indexes = indexed_pixels(pygame.image.tobytes(image, 'RGB'), colors)
+            indexed = image_from_indexed(indexes, width, height, colors)
+
+            # A colorkey no pixel uses may not be in the palette, there's nothing to key then
+            if colorkey is not None and tuple(colorkey[:3]) in colors:
+                key_index = colors.index(tuple(colorkey[:3]))
+
+        if key_index is not None:
+            indexed.set_colorkey(key_index)
+
+        return indexed
+
+    def set_palette(self: Self, palette: ColorPalette | list) -> None:
+        """Set the palette of the sprite's image.
+
+        The first time, the image is converted to an 8 bit surface indexing
+        the palette, so its colors must all be in it.  After that, the
+        palette replaces the image's colors entry for entry (a palette
+        swap), without touching its pixels.
+
+        Args:
+            palette: the ColorPalette or list of colors.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: The image has colors that aren't in the palette.
+        """
+        if self.image.get_bitsize() != 8:  # noqa: PLR2004
+            self.image = self.index_image(self.image, palette)
+            self.shared_image = None
+        else:
+            self.own_image().set_palette(self.palette_colors(palette))
+
+        self.dirty = 1 if not self.dirty else self.dirty
+
+    def cycle_palette(self: Self, start: int = 0, stop: int = 256, step: int = 1) -> None:
+        """Rotate a range of the indexed image's palette entries.
+
+        Each call moves the colors of entries start to stop - 1 along by
+        step entries, for color cycling animations (water, fire, ...).
+
+        Args:
+            start: the first palette entry to rotate.
+            stop: the entry after the last to rotate.
+            step: how many entries to rotate by.
+
+        Returns:
+            None
+
+        Raises:
+            pygame.error: The image isn't indexed, see set_palette().
+        """
+        image = self.own_image()
+        colors = list(image.get_palette())
+        span = colors[start:stop]
+
+        if span:
+            step %= len(span)
+            colors[start:stop] = span[-step:] + span[:-step]
+            image.set_palette(colors)
+
+        self.dirty = 1 if not self.dirty else self.dirty
+
     @classmethod
     def inflate(
         cls: Any, width: int, height: int, pixels: list, color_map: dict
     ) -> tuple[pygame.Surface, pygame.Rect]:
         """Inflate a sprite from a list of pixels.
 
+        The character grid is translated through the color map in bulk
+        into a single RGB buffer, which becomes the sprite's image.
+
+        Color map keys can be more than one character wide (see
+        color_keys()), in which case each row has width keys of that
+        many characters.
+
         Args:
             width: the width of the sprite.
             height: the height of the sprite.
-            pixels: the list of pixels.
+            pixels: the list of pixels, one string of color map keys per row.
             color_map: the color map.
 
         Returns:
             A tuple containing the sprite's image and rect.
 
         Raises:
-            None
+            KeyError: A pixel isn't in the color map.
         """
-        image = pygame.Surface((width, height))
-        image.convert()
+        if not width or not height:
+            image = pygame.Surface((width, height))
+            return (image, image.get_rect())
+
+        key_width = cls.color_key_width(color_map)
+        row_width = width * key_width
+
+        # Rows are clipped or padded to the sprite width; padding stays black
+        # like the blank surface the rows used to be drawn onto.
+        grid = ''.join(row[:row_width].ljust(row_width, '\0') for row in pixels[:height])
+        grid = grid.ljust(row_width * height, '\0')
 
-        raw_pixels = []
-        for y, row in enumerate(pixels):
-            for x, pixel in enumerate(row):
-                color = color_map[pixel]
-                raw_pixels.append(color)
-                pygame.draw.rect(image, color, (x, y, 1, 1))
+        colors = {'\0' * key_width: (0, 0, 0), **color_map}
+        buffer = cls.rgb_buffer(grid, colors, key_width)
+
+        image = pygame.image.frombuffer(buffer, (width, height), 'RGB')
 
         return (image, image.get_rect())
 
+    @classmethod
+    def rgb_buffer(cls: Any, grid: str, colors: dict, key_width: int) -> bytearray:
+        """Translate a grid of color map keys into packed RGB bytes.
+
+        Args:
+            grid: the pixels' color map keys, row after row.
+            colors: the color map, including the padding key.
+            key_width: the number of characters in each key.
+
+        Returns:
+            The R, G, B bytes of every pixel.
+
+        Raises:
+            KeyError: A pixel isn't in the color map.
+        """
+        if key_width == 1 and all(ord(key) < 256 for key in colors):  # noqa: PLR2004
+            return cls.translated_rgb_buffer(grid, colors)
+
+        if key_width > 1:
+            keys = [grid[offset : offset + key_width] for offset in range(0, len(grid), key_width)]
+        else:
+            keys = grid
+
+        unknown_pixels = set(keys).difference(colors)
+
+        if unknown_pixels:
+            raise KeyError(f'Pixels missing from the color map: {sorted(unknown_pixels)}')
+
+        rgb_bytes = {key: bytes(color[:3]) for key, color in colors.items()}
+
+        return bytearray(b''.join(map(rgb_bytes.__getitem__, keys)))
+
+    @staticmethod
+    def translated_rgb_buffer(grid: str, colors: dict) -> bytearray:
+        """Translate a grid of single byte color map keys into packed RGB bytes.
+
+        The grid is encoded to one byte per pixel and mapped through a
+        256 entry lookup table, with NumPy if it's available.
+
+        Args:
+            grid: the pixels' color map keys, row after row.
+            colors: the color map, with single character keys below chr(256).
+
+        Returns:
+            The R, G, B bytes of every pixel.
+
+        Raises:
+            KeyError: A pixel isn't in the color map.
+        """
+        try:
+            indexes = grid.encode('latin-1')
+        except UnicodeEncodeError:
+            # Only pixels missing from the color map can fail to encode
+            indexes = b''
+
+        unknown_pixels = indexes.translate(None, ''.join(colors).encode('latin-1'))
+
+        if unknown_pixels or not indexes:
+            unknown_pixels = set(grid).difference(colors)
+            raise KeyError(f'Pixels missing from the color map: {sorted(unknown_pixels)}')
+
+        if np is not None:
+            lut = np.zeros((256, 3), dtype=np.uint8)
+
+            for key, color in colors.items():
+                lut[ord(key)] = color[:3]
+
+            return bytearray(lut[np.frombuffer(indexes, dtype=np.uint8)].tobytes())
+
+        # One 256 entry lookup table per channel, then interleave the planes
+        buffer = bytearray(len(indexes) * 3)
+
+        for channel in range(3):
+            table = bytearray(256)
+
+            for key, color in colors.items():
+                table[ord(key)] = color[channel]
+
+            buffer[channel::3] = indexes.translate(table)
+
+        return buffer
+
+    @staticmethod
+    def color_key_width(color_map: dict) -> int:
+        """Return the number of characters in each of a color map's keys.
+
+        Args:
+            color_map: the color map.
+
+        Returns:
+            The key width, 1 for an empty color map.
+
+        Raises:
+            ValueError: The keys aren't all the same width.
+        """
+        widths = {len(key) for key in color_map}
+
+        if len(widths) > 1:
+            raise ValueError(f'Color map keys have different widths: {sorted(widths)}')
+
+        return widths.pop() if widths else 1
+
+    @classmethod
+    def ini_color_map(cls: Any, config: configparser.RawConfigParser) -> dict:
+        """Return the color map defined by an INI sprite's color sections.
+
+        Color sections have red, green and blue options, and keys of the
+        same width.  Any other section, like [sprite] or [metadata], is
+        skipped, as are color sections whose key is a different width
+        than most of them.
+
+        Args:
+            config: the parsed INI sprite.
+
+        Returns:
+            The color map.
+        """
+        color_sections = [
+            section
+            for section in config.sections()
+            if section != 'sprite'
+            and all(config.has_option(section, option) for option in ('red', 'green', 'blue'))
+        ]
+
+        if not color_sections:
+            return {}
+
+        # The most common key width, or the narrowest of equally common ones
+        widths = collections.Counter(len(section) for section in color_sections)
+        key_width = min(widths, key=lambda width: (-widths[width], width))
+
+        color_map = {}
+
+        for section in color_sections:
+            if len(section) != key_width:
+                cls.log.warning(f'Skipping [{section}], color keys are {key_width} characters')
+                continue
+
+            red = config.getint(section=section, option='red')
+            green = config.getint(section=section, option='green')
+            blue = config.getint(section=section, option='blue')
+            color_map[section] = (red, green, blue)
+            cls.log.debug(f"Color map entry: '{section}' -> RGB({red}, {green}, {blue})")
+
+        return color_map
+
+    @classmethod
+    def grid_size(cls: Any, rows: list[str], color_map: dict) -> tuple[int, int]:
+        """Return the width and height in pixels of parsed pixel rows.
+
+        Args:
+            rows: the pixel rows, as returned by parse().
+            color_map: the color map, as returned by parse().
+
+        Returns:
+            The width and height of the sprite.
+        """
+        if not rows:
+            return (0, 0)
+
+        return (len(rows[0]) // cls.color_key_width(color_map), len(rows))
+
+    @classmethod
+    def color_keys(cls: Any, count: int, key_width: int | None = None) -> list[str]:
+        """Return color map keys for a number of colors.
+
+        Keys are made of SPRITE_CHARS, so one character keys cover as
+        many colors as there are distinct SPRITE_CHARS, two character
+        keys cover its square, and so on.
+
+        Args:
+            count: the number of keys.
+            key_width: the characters per key, or None for the fewest that fit.
+
+        Returns:
+            The keys.
+
+        Raises:
+            ValueError: There are more colors than keys of that width.
+        """
+        # SPRITE_CHARS repeats 'X' and 'O'
+        chars = ''.join(dict.fromkeys(cls.SPRITE_CHARS))
+
+        if key_width is None:
+            key_width = 1
+            while len(chars) ** key_width < count:
+                key_width += 1
+
+        if count > len(chars) ** key_width:
+            raise ValueError(
+                f'Too many colors ({count}, max {len(chars) ** key_width} '
+                f'with {key_width} character keys)'
+            )
+
+        keys = itertools.product(chars, repeat=key_width)
+
+        return [''.join(key) for key in itertools.islice(keys, count)]
+
+    @classmethod
+    def encode(
+        cls: Any, pixels: bytes | list, width: int, height: int, key_width: int | None = None
+    ) -> tuple[list[str], dict]:
+        """Encode pixels as rows of color map keys.
+
+        The colors and each pixel's key are found with bulk operations
+        rather than a Python loop over the pixels: RGB bytes are packed
+        into one int per pixel (see glitchygames.pixels.packed_pixels()),
+        while lists of pixel tuples are hashed as they are.  Colors are
+        keyed in the order they first appear.
+
+        Args:
+            pixels: RGB bytes, 3 per pixel, or a list of (R, G, B) tuples, row by row.
+            width: the width of the sprite.
+            height: the height of the sprite.
+            key_width: the characters per color key, or None for the fewest that fit.
+
+        Returns:
+            A tuple containing the pixel rows and the color map.
+        """
+        if not width or not height:
+            return ([], {})
+
+        if isinstance(pixels, list):
+            colors = list(dict.fromkeys(pixels))
+            keys = cls.color_keys(len(colors), key_width)
+            grid = ''.join(map(dict(zip(colors, keys, strict=True)).__getitem__, pixels))
+            colors = [tuple(color[:3]) for color in colors]
+        else:
+            packed = packed_pixels(pixels)
+
+            if np is not None:
+                (packed_colors, first_seen, inverse) = np.unique(
+                    packed, return_index=True, return_inverse=True
+                )
+
+                order = np.argsort(first_seen)
+                ranks = np.empty_like(order)
+                ranks[order] = np.arange(len(order))
+
+                packed_colors = packed_colors[order].tolist()
+                keys = cls.color_keys(len(packed_colors), key_width)
+                lut = np.array([key.encode('ascii') for key in keys])
+                grid = lut[ranks[inverse.ravel()]].tobytes().decode('ascii')
+            else:
+                packed_colors = list(dict.fromkeys(packed))
+                keys = cls.color_keys(len(packed_colors), key_width)
+                grid = ''.join(map(dict(zip(packed_colors, keys, strict=True)).__getitem__, packed))
+
+            colors = [tuple(color.to_bytes(4, sys.byteorder)[:3]) for color in packed_colors]
+
+        row_width = width * len(keys[0])
+        rows = [grid[offset : offset + row_width] for offset in range(0, len(grid), row_width)]
+
+        return (rows, dict(zip(keys, colors, strict=True)))
+
     def save(self: Self, filename: str, format: str = 'ini') -> None:
-        """Save a sprite to a file."""
+        """Save a sprite to a file.
+
+        format is 'ini', 'yaml' or 'binary' (see glitchygames.sprites.binary).
+        """
         try:
             self.log.debug(f"Starting save in {format} format to {filename}")
+
+            if format == 'binary':
+                binary.write_sprite(
+                    filename, str(self.name or 'unnamed'), *binary.encode_surface(self.image)
+                )
+                self.log.debug(f"Successfully saved to {filename}")
+                return
+
             config = self.deflate(format=format)
             self.log.debug(f"Got config from deflate: {config}")
 
@@ -1124,36 +1906,26 @@ class BitmappySprite(Sprite):
             self.log.error(f"Config state: {config if 'config' in locals() else 'Not created'}")
             raise
 
-    def deflate(self: Self, format: str = 'yaml') -> dict | configparser.ConfigParser:
-        """Deflate a sprite to a configuration format."""
+    def deflate(
+        self: Self, format: str = 'yaml', key_width: int | None = None
+    ) -> dict | configparser.RawConfigParser:
+        """Deflate a sprite to a configuration format.
+
+        Sprites with a pixels list (like the Bitmappy canvas) are deflated
+        from it, other sprites from their image.  See encode().
+        """
         try:
             self.log.debug(f"Starting deflate for {self.name} in {format} format")
 
-            # Get unique colors from the pixels list
-            unique_colors = set(self.pixels)
-            self.log.debug(f"Found {len(unique_colors)} unique colors")
-
-            # Create color to character mapping
-            color_map = {}
-            next_char = 0
-            printable_chars = '''
-                ()[]{},./@$+_0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ
-            '''.strip()
-
-            for color in unique_colors:
-                if next_char >= len(printable_chars):
-                    raise ValueError(f"Too many colors (max {len(printable_chars)})")
-                color_map[color] = printable_chars[next_char]
-                next_char += 1
-
-            # Process pixels row by row
-            pixel_rows = []
-            for y in range(self.pixels_tall):
-                row = ''
-                for x in range(self.pixels_across):
-                    pixel_color = self.pixels[y * self.pixels_across + x]
-                    row += color_map[pixel_color]
-                pixel_rows.append(row)
+            if getattr(self, 'pixels', None) is not None:
+                (width, height) = (self.pixels_across, self.pixels_tall)
+                pixels = list(self.pixels)
+            else:
+                (width, height) = self.image.get_size()
+                pixels = pygame.image.tobytes(self.image, 'RGB')
+
+            (pixel_rows, color_map) = self.encode(pixels, width, height, key_width=key_width)
+            self.log.debug(f"Found {len(color_map)} unique colors")
 
             if format == 'yaml':
                 pixels_str = '\n'.join(pixel_rows)
@@ -1168,17 +1940,18 @@ class BitmappySprite(Sprite):
                             'green': color[1],
                             'blue': color[2]
                         }
-                        for color, char in color_map.items()
+                        for char, color in color_map.items()
                     }
                 }
             else:  # ini format
-                config = configparser.ConfigParser()
+                # Raw, since '%' is a color key
+                config = configparser.RawConfigParser(dict_type=collections.OrderedDict)
                 config.add_section('sprite')
                 config.set('sprite', 'name', self.name or 'unnamed')
                 config.set('sprite', 'pixels', '\n'.join(pixel_rows))
 
                 # Add a section for each color
-                for color, char in color_map.items():
+                for char, color in color_map.items():
                     config.add_section(char)
                     config.set(char, 'red', str(color[0]))
                     config.set(char, 'green', str(color[1]))
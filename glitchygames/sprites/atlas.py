@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""GlitchyGames texture atlas module.
+
+atlas: Packs sprite images into a few large surfaces.
+
+A TextureAtlas packs sprite images onto shelves of one or more page
+surfaces and keeps an index of where each one landed.  Read-only
+sprites (BitmappySprite(..., share_image=True)) get pygame subsurface
+views into the pages instead of surfaces of their own, so hundreds of
+small sprites share a handful of allocations; other sprites get a copy.
+
+Sprites are keyed by their path relative to the directory that was
+packed, and the atlas records each file's mtime and size.  find() only
+returns an image for the same file, unchanged since it was packed;
+anything else falls back to loading the file normally.
+
+A saved atlas is an index (JSON) next to its pages, which are stored
+as binary sprites so they are memory mapped when the atlas is loaded.
+The root is relative to the index file:
+
+    {
+        "version": 2,
+        "root": "../sprites",
+        "pages": ["sprites-0.ggs", ...],
+        "sprites": {
+            "raspberry.cfg": {
+                "page": 0, "rect": [x, y, w, h], "name": "raspberry",
+                "mtime": 1700000000000000000, "size": 1234
+            },
+            ...
+        }
+    }
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+import pygame
+from glitchygames.sprites import BitmappySprite, binary
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+LOG = logging.getLogger('game.sprites.atlas')
+LOG.addHandler(logging.NullHandler())
+
+VERSION = 2
+
+# The sprite files from_directory() packs
+SPRITE_EXTENSIONS = ('.cfg', '.ini', '.yml', '.yaml', binary.EXTENSION)
+IMAGE_EXTENSIONS = BitmappySprite.IMAGE_EXTENSIONS
+
+
+def load_image(filename: str) -> tuple[pygame.Surface, str]:
+    """Load a sprite file or image for packing.
+
+    Args:
+        filename (str): A Bitmappy config, YAML or binary sprite file, or an image.
+
+    Returns:
+        tuple[pygame.Surface, str]: The image and its sprite name.
+    """
+    return BitmappySprite.decode(filename)
+
+
+def pack(
+    sizes: dict[str, tuple[int, int]], max_size: int = 1024, padding: int = 1
+) -> tuple[dict[str, tuple[int, pygame.Rect]], list[tuple[int, int]]]:
+    """Pack rectangles onto shelves of one or more pages.
+
+    Rectangles are placed tallest first, left to right along a shelf,
+    and a new shelf is opened below the last one when none of the
+    existing shelves has room.  A new page is opened when the current
+    page is full.
+
+    Args:
+        sizes (dict[str, tuple[int, int]]): The width and height of each rectangle.
+        max_size (int): The maximum width and height of a page.
+        padding (int): The gap to leave between rectangles.
+
+    Returns:
+        tuple[dict[str, tuple[int, pygame.Rect]], list[tuple[int, int]]]: The page
+            and rect of each rectangle, and the size of each page.
+
+    Raises:
+        ValueError: A rectangle doesn't fit on a page.
+    """
+    placements = {}
+
+    # Each page is a list of [y, height, next x] shelves
+    pages: list[list[list[int]]] = []
+    page_sizes: list[list[int]] = []
+
+    for key in sorted(sizes, key=lambda key: (sizes[key][1], sizes[key][0]), reverse=True):
+        (width, height) = sizes[key]
+
+        if width > max_size or height > max_size:
+            raise ValueError(f'{key} ({width}x{height}) is larger than a {max_size} page')
+
+        for number, shelves in enumerate(pages):
+            shelf = next(
+                (
+                    shelf
+                    for shelf in shelves
+                    if height <= shelf[1] and shelf[2] + width <= max_size
+                ),
+                None,
+            )
+
+            if shelf is None:
+                y = shelves[-1][0] + shelves[-1][1] + padding
+                if y + height > max_size:
+                    continue
+
+                shelf = [y, height, 0]
+                shelves.append(shelf)
+
+            page = number
+            break
+        else:
+            page = len(pages)
+            shelf = [0, height, 0]
+            pages.append([shelf])
+            page_sizes.append([0, 0])
+
+        placements[key] = (page, pygame.Rect(shelf[2], shelf[0], width, height))
+        shelf[2] += width + padding
+
+        page_sizes[page][0] = max(page_sizes[page][0], shelf[2] - padding)
+        page_sizes[page][1] = max(page_sizes[page][1], shelf[0] + shelf[1])
+
+    return (placements, [tuple(page_size) for page_size in page_sizes])
+
+
+class TextureAtlas:
+    """Sprite images packed into one or more page surfaces.
+
+    Sprites are looked up by key, which is the path of the file they
+    were packed from relative to root, in POSIX form.  Looked up images
+    are subsurfaces of the pages; copy them before drawing on them.
+    """
+
+    def __init__(
+        self: Self,
+        pages: list[pygame.Surface],
+        sprites: dict[str, tuple[int, pygame.Rect, str]],
+        root: Path | None = None,
+        sources: dict[str, tuple[int, int]] | None = None,
+    ) -> None:
+        """Initialize the texture atlas.
+
+        Args:
+            pages (list[pygame.Surface]): The page surfaces.
+            sprites (dict[str, tuple[int, pygame.Rect, str]]): The page, rect and
+                sprite name of each key.
+            root (Path | None): The directory the keys are relative to, if the
+                sprites were packed from files.
+            sources (dict[str, tuple[int, int]] | None): The mtime in nanoseconds
+                and size of the file each key was packed from.
+
+        Returns:
+            None
+        """
+        self.pages = pages
+        self.sprites = sprites
+        self.root = root
+        self.sources = sources if sources is not None else {}
+        self.views: dict[str, pygame.Surface] = {}
+
+    @classmethod
+    def build(
+        cls: Any,
+        images: dict[str, tuple[pygame.Surface, str]],
+        max_size: int = 1024,
+        padding: int = 1,
+        root: Path | None = None,
+        sources: dict[str, tuple[int, int]] | None = None,
+    ) -> TextureAtlas:
+        """Pack images into a new atlas.
+
+        Args:
+            images (dict[str, tuple[pygame.Surface, str]]): The image and sprite
+                name of each key.
+            max_size (int): The maximum width and height of a page.
+            padding (int): The gap to leave between images.
+            root (Path | None): The directory the keys are relative to, if the
+                images were loaded from files.
+            sources (dict[str, tuple[int, int]] | None): The mtime in nanoseconds
+                and size of the file each key was loaded from.
+
+        Returns:
+            TextureAtlas: The atlas.
+        """
+        (placements, page_sizes) = pack(
+            {key: image.get_size() for key, (image, _) in images.items()},
+            max_size=max_size,
+            padding=padding,
+        )
+
+        # Keep per pixel alpha if any of the images have it
+        alpha = any(image.get_flags() & pygame.SRCALPHA for (image, _) in images.values())
+        pages = [
+            pygame.Surface(page_size, pygame.SRCALPHA if alpha else 0, 32)
+            for page_size in page_sizes
+        ]
+
+        for key, (page, rect) in placements.items():
+            pages[page].blit(images[key][0], rect)
+
+        LOG.debug(f'Packed {len(images)} images onto {len(pages)} pages: {page_sizes}')
+
+        return cls(
+            pages=pages,
+            sprites={key: (page, rect, images[key][1]) for key, (page, rect) in placements.items()},
+            root=root,
+            sources=sources,
+        )
+
+    @staticmethod
+    def source(path: Path) -> tuple[int, int]:
+        """Return the mtime and size the atlas records for a file.
+
+        Args:
+            path (Path): The file.
+
+        Returns:
+            tuple[int, int]: The mtime in nanoseconds and the size.
+
+        Raises:
+            FileNotFoundError: The file doesn't exist.
+        """
+        stat = path.stat()
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @classmethod
+    def from_files(
+        cls: Any,
+        filenames: Iterable[str],
+        max_size: int = 1024,
+        padding: int = 1,
+        root: str | None = None,
+    ) -> TextureAtlas:
+        """Pack sprite files and images into a new atlas.
+
+        Args:
+            filenames (Iterable[str]): The files to pack.
+            max_size (int): The maximum width and height of a page.
+            padding (int): The gap to leave between images.
+            root (str | None): The directory to key the files relative to.
+                Defaults to the closest directory containing all of them.
+
+        Returns:
+            TextureAtlas: The atlas.
+
+        Raises:
+            ValueError: A file isn't inside root.
+        """
+        paths = [Path(filename).resolve() for filename in filenames]
+
+        if root is not None:
+            root_path = Path(root).resolve()
+        elif paths:
+            root_path = Path(os.path.commonpath([path.parent for path in paths]))
+        else:
+            root_path = None
+
+        images = {}
+        sources = {}
+
+        for path in paths:
+            key = path.relative_to(root_path).as_posix()
+            images[key] = load_image(str(path))
+            sources[key] = cls.source(path)
+
+        return cls.build(
+            images, max_size=max_size, padding=padding, root=root_path, sources=sources
+        )
+
+    @classmethod
+    def from_directory(
+        cls: Any, directory: str, max_size: int = 1024, padding: int = 1
+    ) -> TextureAtlas:
+        """Pack every sprite file and image in a directory into a new atlas.
+
+        Args:
+            directory (str): The directory to pack.
+            max_size (int): The maximum width and height of a page.
+            padding (int): The gap to leave between images.
+
+        Returns:
+            TextureAtlas: The atlas.
+        """
+        filenames = sorted(
+            path
+            for path in Path(directory).iterdir()
+            if path.suffix.lower() in SPRITE_EXTENSIONS + IMAGE_EXTENSIONS
+        )
+
+        return cls.from_files(filenames, max_size=max_size, padding=padding, root=directory)
+
+    @classmethod
+    def load(cls: Any, filename: str) -> TextureAtlas:
+        """Load a saved atlas.
+
+        Args:
+            filename (str): The atlas index file.
+
+        Returns:
+            TextureAtlas: The atlas.
+
+        Raises:
+            ValueError: The index isn't a supported atlas version.
+        """
+        path = Path(filename)
+        index = json.loads(path.read_text())
+
+        if index.get('version') != VERSION:
+            raise ValueError(f'{filename}: Unsupported atlas version {index.get("version")}')
+
+        pages = [binary.read_sprite(str(path.parent / page))[0] for page in index['pages']]
+        root = index.get('root')
+
+        return cls(
+            pages=pages,
+            sprites={
+                key: (sprite['page'], pygame.Rect(sprite['rect']), sprite['name'])
+                for key, sprite in index['sprites'].items()
+            },
+            root=(path.parent / root).resolve() if root is not None else None,
+            sources={
+                key: (sprite['mtime'], sprite['size'])
+                for key, sprite in index['sprites'].items()
+                if 'mtime' in sprite
+            },
+        )
+
+    def save(self: Self, filename: str) -> None:
+        """Save the atlas index and its pages.
+
+        The pages are written next to the index as binary sprites.
+
+        Args:
+            filename (str): The atlas index file.
+
+        Returns:
+            None
+        """
+        path = Path(filename)
+        pages = []
+
+        for number, page in enumerate(self.pages):
+            page_filename = f'{path.stem}-{number}{binary.EXTENSION}'
+            binary.write_sprite(
+                str(path.parent / page_filename), page_filename, *binary.encode_surface(page)
+            )
+            pages.append(page_filename)
+
+        sprites = {}
+
+        for key, (page, rect, name) in self.sprites.items():
+            sprites[key] = {'page': page, 'rect': list(rect), 'name': name}
+
+            if key in self.sources:
+                (sprites[key]['mtime'], sprites[key]['size']) = self.sources[key]
+
+        index = {
+            'version': VERSION,
+            'root': (
+                os.path.relpath(self.root, path.parent.resolve()) if self.root is not None else None
+            ),
+            'pages': pages,
+            'sprites': sprites,
+        }
+
+        path.write_text(json.dumps(index, indent=4))
+
+    def __contains__(self: Self, key: str) -> bool:
+        """Return whether a sprite is in the atlas."""
+        return key in self.sprites
+
+    def __len__(self: Self) -> int:
+        """Return the number of sprites in the atlas."""
+        return len(self.sprites)
+
+    def image(self: Self, key: str) -> pygame.Surface:
+        """Return a sprite's image as a subsurface of its page.
+
+        Args:
+            key (str): The sprite's key.
+
+        Returns:
+            pygame.Surface: The sprite's image.
+
+        Raises:
+            KeyError: The sprite isn't in the atlas.
+        """
+        view = self.views.get(key)
+
+        if view is None:
+            (page, rect, _) = self.sprites[key]
+            view = self.views[key] = self.pages[page].subsurface(rect)
+
+        return view
+
+    def find(self: Self, filename: str) -> tuple[pygame.Surface, str] | None:
+        """Look up the sprite packed from a file.
+
+        The file has to be the one that was packed, at the same path
+        relative to root, and unchanged since: same mtime and size.
+
+        Args:
+            filename (str): The sprite file.
+
+        Returns:
+            tuple[pygame.Surface, str] | None: The sprite's image and name, or
+                None if the file wasn't packed or changed since.
+        """
+        if self.root is None:
+            return None
+
+        path = Path(filename).resolve()
+
+        if not path.is_relative_to(self.root):
+            return None
+
+        key = path.relative_to(self.root).as_posix()
+
+        if key not in self.sprites:
+            return None
+
+        try:
+            source = self.source(path)
+        except FileNotFoundError:
+            return None
+
+        if source != self.sources.get(key):
+            LOG.debug(f'{filename} changed since it was packed, not using the atlas')
+            return None
+
+        return (self.image(key), self.sprites[key][2])
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""GlitchyGames binary sprite module.
+
+binary: Reads and writes the compact binary sprite container.
+
+A binary sprite file is a fixed size little endian header, followed by
+the sprite name (UTF-8), the palette (RGB triplets, indexed sprites only)
+and the pixel rows, tightly packed:
+
+    magic         8s   b'GGSPRITE'
+    version       B    1
+    pixel format  B    0 = indexed (1 byte per pixel), 1 = RGB, 2 = RGBA
+    palette size  H    number of palette entries (0 - 256)
+    width         I
+    height        I
+    name length   H
+    reserved      H
+
+The pixel rows are mapped straight into a surface with mmap and
+pygame.image.frombuffer(), so reading a sprite does no parsing or
+copying.  BitmappySprite.load() only copies the pixels if they have to
+be converted to the display's pixel format.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+from pathlib import Path
+
+import pygame
+from glitchygames.pixels import np, packed_pixels
+
+LOG = logging.getLogger('game.sprites.binary')
+LOG.addHandler(logging.NullHandler())
+
+MAGIC = b'GGSPRITE'
+VERSION = 1
+EXTENSION = '.ggs'
+
+HEADER = struct.Struct('<8sBBHIIHH')
+
+# Pixel format code -> pygame.image.frombuffer() format
+PIXEL_FORMATS = {0: 'P', 1: 'RGB', 2: 'RGBA'}
+PIXEL_FORMAT_CODES = {pixel_format: code for code, pixel_format in PIXEL_FORMATS.items()}
+BYTES_PER_PIXEL = {'P': 1, 'RGB': 3, 'RGBA': 4}
+
+MAX_PALETTE_SIZE = 256
+
+# Permissions of newly written sprite files
+NEW_FILE_MODE = 0o644
+
+
+def is_binary_sprite(filename: str) -> bool:
+    """Return whether a file is a binary sprite.
+
+    Args:
+        filename (str): The file to check.
+
+    Returns:
+        bool: True if the file starts with the binary sprite magic.
+
+    Raises:
+        FileNotFoundError: The file doesn't exist.
+    """
+    with Path(filename).open('rb') as sprite_file:
+        return sprite_file.read(len(MAGIC)) == MAGIC
+
+
+def read_sprite(filename: str) -> tuple[pygame.Surface, str]:
+    """Load a binary sprite.
+
+    The file is mapped copy-on-write, so the returned surface can be
+    drawn on without modifying the file.
+
+    Args:
+        filename (str): The binary sprite file.
+
+    Returns:
+        tuple[pygame.Surface, str]: The sprite's image and name.
+
+    Raises:
+        ValueError: The file isn't a valid binary sprite.
+    """
+    with Path(filename).open('rb') as sprite_file:
+        data = mmap.mmap(sprite_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    if len(data) < HEADER.size:
+        raise ValueError(f'{filename}: Truncated binary sprite header')
+
+    (magic, version, format_code, palette_size, width, height, name_length, _) = (
+        HEADER.unpack_from(data)
+    )
+
+    if magic != MAGIC:
+        raise ValueError(f'{filename}: Not a binary sprite')
+
+    if version != VERSION:
+        raise ValueError(f'{filename}: Unsupported binary sprite version {version}')
+
+    if format_code not in PIXEL_FORMATS:
+        raise ValueError(f'{filename}: Unknown pixel format {format_code}')
+
+    pixel_format = PIXEL_FORMATS[format_code]
+
+    offset = HEADER.size
+    name = data[offset : offset + name_length].decode('utf-8')
+    offset += name_length
+
+    palette = [
+        tuple(data[entry : entry + 3]) for entry in range(offset, offset + palette_size * 3, 3)
+    ]
+    offset += palette_size * 3
+
+    pixels_size = width * height * BYTES_PER_PIXEL[pixel_format]
+
+    if len(data) < offset + pixels_size:
+        raise ValueError(f'{filename}: Truncated binary sprite pixels')
+
+    if not width or not height:
+        return (pygame.Surface((width, height)), name)
+
+    image = pygame.image.frombuffer(
+        memoryview(data)[offset : offset + pixels_size], (width, height), pixel_format
+    )
+
+    if pixel_format == 'P':
+        image.set_palette(palette)
+
+    LOG.debug(f'Mapped {width}x{height} {pixel_format} binary sprite {name} from {filename}')
+
+    return (image, name)
+
+
+def write_sprite(
+    filename: str,
+    name: str,
+    size: tuple[int, int],
+    pixel_format: str,
+    pixels: bytes,
+    palette: list | None = None,
+) -> None:
+    """Save a binary sprite.
+
+    Args:
+        filename (str): The binary sprite file.
+        name (str): The sprite name.
+        size (tuple[int, int]): The width and height in pixels.
+        pixel_format (str): 'P' for indexed pixels, 'RGB' or 'RGBA'.
+        pixels (bytes): The pixel rows, tightly packed.
+        palette (list | None): The RGB palette for indexed pixels.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: The pixels, format or palette don't match.
+    """
+    if palette is None:
+        palette = []
+
+    (width, height) = size
+
+    if pixel_format not in PIXEL_FORMAT_CODES:
+        raise ValueError(f'Unknown pixel format {pixel_format}')
+
+    if len(pixels) != width * height * BYTES_PER_PIXEL[pixel_format]:
+        raise ValueError(f'{len(pixels)} bytes of pixels for a {width}x{height} {pixel_format}')
+
+    if len(palette) > MAX_PALETTE_SIZE:
+        raise ValueError(f'Too many palette entries ({len(palette)}, max {MAX_PALETTE_SIZE})')
+
+    encoded_name = (name or '').encode('utf-8')
+
+    path = Path(filename)
+
+    # read_sprite() may still have the old file mapped behind a surface,
+    # and truncating it would fault that surface's next access.  Write a
+    # new file next to it and rename it over the old one instead.
+    sprite_file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+        dir=path.parent, prefix=f'{path.name}.', delete=False
+    )
+
+    try:
+        with sprite_file:
+            sprite_file.write(
+                HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    PIXEL_FORMAT_CODES[pixel_format],
+                    len(palette),
+                    width,
+                    height,
+                    len(encoded_name),
+                    0,
+                )
+            )
+            sprite_file.write(encoded_name)
+            sprite_file.write(b''.join(bytes(color[:3]) for color in palette))
+            sprite_file.write(pixels)
+
+        # Temporary files are private, so keep the permissions of the file being replaced
+        if path.exists():
+            shutil.copymode(path, sprite_file.name)
+        else:
+            Path(sprite_file.name).chmod(NEW_FILE_MODE)
+
+        Path(sprite_file.name).replace(path)
+    except BaseException:
+        Path(sprite_file.name).unlink(missing_ok=True)
+        raise
+
+def encode_surface(image: pygame.Surface) -> tuple[tuple[int, int], str, bytes, list]:
+    """Encode a surface's pixels for write_sprite().
+
+    Surfaces with per pixel alpha are stored as RGBA.  8 bit surfaces
+    keep their own indexes and palette.  Otherwise, images with up to
+    256 colors are stored as indexed pixels, and anything else as RGB.
+
+    Args:
+        image (pygame.Surface): The surface to encode.
+
+    Returns:
+        tuple[tuple[int, int], str, bytes, list]: The size, pixel format,
+            pixels and palette.
+    """
+    size = image.get_size()
+
+    if image.get_flags() & pygame.SRCALPHA:
+        return (size, 'RGBA', pygame.image.tobytes(image, 'RGBA'), [])
+
+    if image.get_bitsize() == 8:  # noqa: PLR2004
+        return (size, 'P', pygame.image.tobytes(image, 'P'), image.get_palette())
+
+    rgb_pixels = pygame.image.tobytes(image, 'RGB')
+    packed = packed_pixels(rgb_pixels)
+
+    if np is not None:
+        (colors, indexes) = np.unique(packed, return_inverse=True)
+        colors = colors.tolist()
+    else:
+        colors = sorted(set(packed))
+
+    if len(colors) > MAX_PALETTE_SIZE:
+        return (size, 'RGB', rgb_pixels, [])
+
+    if np is not None:
+        indexes = indexes.astype(np.uint8).tobytes()
+    else:
+        palette_indexes = {color: index for index, color in enumerate(colors)}
+        indexes = bytes(map(palette_indexes.__getitem__, packed))
+
+    palette = [tuple(color.to_bytes(4, sys.byteorder)[:3]) for color in colors]
+
+    return (size, 'P', indexes, palette)
@@ -4,8 +4,9 @@
 # ruff: noqa: FBT001 FBT002
 from __future__ import annotations
 
-import logging
+import collections
 import configparser
+import logging
 from pathlib import Path
 import sys
 from typing import TYPE_CHECKING, ClassVar, Self
@@ -22,7 +23,8 @@ from glitchygames.engine import GameEngine
 from glitchygames.events.mouse import MousePointer
 from glitchygames.pixels import image_from_pixels, pixels_from_data
 from glitchygames.scenes import Scene
-from glitchygames.sprites import BitmappySprite
+from glitchygames.sprites import BitmappySprite, binary
+from glitchygames.tools import sprite_batch
 from glitchygames.ui import ColorWellSprite, InputDialog, MenuBar, MenuItem, SliderSprite
 import yaml  # Add to imports at top
 
@@ -788,8 +790,14 @@ class CanvasSprite(BitmappySprite):
 
             # Determine file format from extension
             ext = Path(filename).suffix.lower()
-            if ext not in ('.yml', '.yaml', '.ini'):
-                self.log.error(f"Unsupported file format: {ext}. Use .yml, .yaml, or .ini")
+            if ext not in ('.yml', '.yaml', '.ini', binary.EXTENSION):
+                self.log.error(
+                    f"Unsupported file format: {ext}. Use .yml, .yaml, .ini or {binary.EXTENSION}"
+                )
+                return
+
+            if ext == binary.EXTENSION:
+                self.load_binary_file(filename)
                 return
 
             # Read the raw file content
@@ -820,22 +828,15 @@ class CanvasSprite(BitmappySprite):
                 config.read_string(content)
 
                 # Get color definitions from INI format
-                color_map = {}
-                for section in config.sections():
-                    if len(section) == 1:  # Color sections are single characters
-                        color_map[section] = (
-                            config.getint(section, 'red'),
-                            config.getint(section, 'green'),
-                            config.getint(section, 'blue')
-                        )
+                color_map = self.ini_color_map(config)
                 pixel_text = config.get('sprite', 'pixels', raw=True)
 
             # Process pixel data
             rows = [row.strip() for row in pixel_text.splitlines() if row.strip()]
 
             # Validate dimensions
-            width = len(rows[0])
-            height = len(rows)
+            key_width = self.color_key_width(color_map)
+            (width, height) = self.grid_size(rows, color_map)
             if width != self.pixels_across or height != self.pixels_tall:
                 raise ValueError(
                     f"Image dimensions {width}x{height} don't match canvas "
@@ -844,7 +845,8 @@ class CanvasSprite(BitmappySprite):
 
             # Update canvas pixels
             for y, row in enumerate(rows):
-                for x, char in enumerate(row):
+                for x in range(width):
+                    char = row[x * key_width:(x + 1) * key_width]
                     if char in color_map:
                         pixel_num = y * self.pixels_across + x
                         self.pixels[pixel_num] = color_map[char]
@@ -863,6 +865,34 @@ class CanvasSprite(BitmappySprite):
             self.log.error(f"Error loading file: {e}")
             raise
 
+    def load_binary_file(self, filename: str) -> None:
+        """Load the canvas from a binary sprite file.
+
+        Args:
+            filename (str): The binary sprite file.
+        """
+        (image, name) = binary.read_sprite(filename)
+        self.log.info(f"Loading binary sprite {name} from {filename}")
+
+        width, height = image.get_size()
+        if width != self.pixels_across or height != self.pixels_tall:
+            raise ValueError(
+                f"Image dimensions {width}x{height} don't match canvas "
+                f"{self.pixels_across}x{self.pixels_tall}"
+            )
+
+        self.pixels[:] = pixels_from_data(pygame.image.tobytes(image, 'RGB'))
+        self.dirty_pixels = [True] * len(self.pixels)
+
+        # Force redraw
+        self.dirty = 1
+        self.force_redraw()
+
+        # Update miniview if it exists
+        if hasattr(self, 'mini_view'):
+            self.mini_view.dirty = 1
+            self.mini_view.force_redraw()
+
     def on_new_file_event(self, event: pygame.event.Event, trigger: object = None) -> None:
         """Handle new file event.
 
@@ -884,24 +914,39 @@ class CanvasSprite(BitmappySprite):
 
         Args:
             filename (str): The filename to save to
-            format (str, optional): Format to save in ('yaml' or 'ini').
+            format (str, optional): Format to save in ('yaml', 'ini' or 'binary').
                                   If None, determined by file extension.
         """
+        file_format = format
+
         try:
             # Determine format from extension if not specified
-            if format is None:
+            if file_format is None:
                 ext = Path(filename).suffix.lower()
                 if ext in ('.yml', '.yaml'):
-                    format = 'yaml'
+                    file_format = 'yaml'
                 elif ext == '.ini':
-                    format = 'ini'
+                    file_format = 'ini'
+                elif ext == binary.EXTENSION:
+                    file_format = 'binary'
                 else:
-                    raise ValueError(f"Unsupported file format: {ext}. Use .yml, .yaml, or .ini")
+                    raise ValueError(
+                        f'Unsupported file format: {ext}. '
+                        f'Use .yml, .yaml, .ini or {binary.EXTENSION}'
+                    )
+
+            if file_format == 'binary':
+                image = image_from_pixels(self.pixels, self.pixels_across, self.pixels_tall)
+                binary.write_sprite(
+                    filename, str(self.name or 'unnamed'), *binary.encode_surface(image)
+                )
+                self.log.info(f'Saved sprite to {filename} in {file_format} format')
+                return
 
             # Get the sprite data
             pixel_data = self.deflate()
 
-            if format == 'yaml':
+            if file_format == 'yaml':
                 # Convert to YAML format
                 yaml_data = {
                     'colors': {},
@@ -923,8 +968,9 @@ class CanvasSprite(BitmappySprite):
                 with open(filename, 'w') as f:
                     yaml.dump(yaml_data, f, sort_keys=False, default_flow_style=False)
 
-            elif format == 'ini':
-                config = configparser.ConfigParser(
+            elif file_format == 'ini':
+                # Raw, since '%' is a color key
+                config = configparser.RawConfigParser(
                     dict_type=collections.OrderedDict,
                     empty_lines_in_values=True,
                     strict=True
@@ -949,54 +995,30 @@ class CanvasSprite(BitmappySprite):
                     config.write(f)
 
             else:
-                raise ValueError(f"Unsupported format: {format}. Must be 'yaml' or 'ini'")
+                raise ValueError(f"Unsupported format: {file_format}. Must be 'yaml' or 'ini'")
 
-            self.log.info(f"Saved sprite to {filename} in {format} format")
+            self.log.info(f'Saved sprite to {filename} in {file_format} format')
 
         except Exception as e:
             self.log.error(f"Error saving file: {e}")
             raise
 
     def deflate(self) -> dict:
-        """Deflate sprite data to dictionary format."""
+        """Deflate sprite data to dictionary format.
+
+        Colors get multi-character keys when there are more of them
+        than BitmappySprite.SPRITE_CHARS, see BitmappySprite.encode().
+        """
         try:
             self.log.debug(f"Starting deflate for {self.name}")
-            self.log.debug(f"Image dimensions: {self.image.get_size()}")
-
-            config = configparser.ConfigParser(
-                dict_type=collections.OrderedDict, empty_lines_in_values=True, strict=True
-            )
-
-            # Get the raw pixel data and log its size
-            pixel_string = pygame.image.tostring(self.image, 'RGB')
-            self.log.debug(f"Raw pixel string length: {len(pixel_string)}")
-
-            # Log the first few bytes of pixel data
-            self.log.debug(f"First 12 bytes of pixel data: {list(pixel_string[:12])}")
-
-            # Create the generator and log initial state
-            raw_pixels = rgb_triplet_generator(pixel_data=pixel_string)
-            self.log.debug("Created RGB triplet generator")
 
-            # Try to get the first triplet
-            try:
-                first_triplet = next(raw_pixels)
-                self.log.debug(f"First RGB triplet: {first_triplet}")
-                # Reset generator
-                raw_pixels = rgb_triplet_generator(pixel_data=pixel_string)
-            except StopIteration:
-                self.log.error("Generator empty on first triplet!")
-                raise
+            (rows, color_map) = self.encode(self.pixels, self.pixels_across, self.pixels_tall)
+            self.log.debug(f"Found {len(color_map)} unique colors")
 
-            # Now proceed with the rest of deflate
-            raw_pixels = list(raw_pixels)
-            self.log.debug(f"Converted {len(raw_pixels)} RGB triplets to list")
-
-            # Continue with original deflate code...
-            colors = set(raw_pixels)
-            self.log.debug(f"Found {len(colors)} unique colors")
-
-            return config
+            return {
+                'sprite': {'name': self.name or 'unnamed', 'pixels': '\n'.join(rows)},
+                'colors': color_map,
+            }
 
         except Exception as e:
             self.log.error(f"Error in deflate: {e}")
@@ -1701,49 +1723,8 @@ class BitmapEditorScene(Scene):
                     sprite.on_mouse_leave_window_event(event)
 
     def deflate(self: Self) -> dict:
-        """Deflate a sprite to a Bitmappy config file."""
-        try:
-            self.log.debug(f"Starting deflate for {self.name}")
-            self.log.debug(f"Image dimensions: {self.image.get_size()}")
-
-            config = configparser.ConfigParser(
-                dict_type=collections.OrderedDict, empty_lines_in_values=True, strict=True
-            )
-
-            # Get the raw pixel data and log its size
-            pixel_string = pygame.image.tostring(self.image, 'RGB')
-            self.log.debug(f"Raw pixel string length: {len(pixel_string)}")
-
-            # Log the first few bytes of pixel data
-            self.log.debug(f"First 12 bytes of pixel data: {list(pixel_string[:12])}")
-
-            # Create the generator and log initial state
-            raw_pixels = rgb_triplet_generator(pixel_data=pixel_string)
-            self.log.debug("Created RGB triplet generator")
-
-            # Try to get the first triplet
-            try:
-                first_triplet = next(raw_pixels)
-                self.log.debug(f"First RGB triplet: {first_triplet}")
-                # Reset generator
-                raw_pixels = rgb_triplet_generator(pixel_data=pixel_string)
-            except StopIteration:
-                self.log.error("Generator empty on first triplet!")
-                raise
-
-            # Now proceed with the rest of deflate
-            raw_pixels = list(raw_pixels)
-            self.log.debug(f"Converted {len(raw_pixels)} RGB triplets to list")
-
-            # Continue with original deflate code...
-            colors = set(raw_pixels)
-            self.log.debug(f"Found {len(colors)} unique colors")
-
-            return config
-
-        except Exception as e:
-            self.log.error(f"Error in deflate: {e}")
-            raise
+        """Deflate the canvas to a Bitmappy config dictionary."""
+        return self.canvas.deflate()
 
 
 def main() -> None:
@@ -1758,6 +1739,10 @@ def main() -> None:
     Raises:
         None
     """
+    # Batch subcommands run headless, without the editor
+    if len(sys.argv) > 1 and sys.argv[1] in sprite_batch.COMMANDS:
+        sys.exit(sprite_batch.main(sys.argv[1:]))
+
     icon_path = Path(__file__).parent / 'resources' / 'bitmappy.png'
 
     GameEngine(
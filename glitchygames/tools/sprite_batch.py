@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""Bitmappy batch sprite conversion.
+
+sprite_batch: Converts, validates and re-encodes sprite files in bulk.
+
+This backs the non-interactive bitmappy subcommands:
+
+    bitmappy convert [-f FORMAT] [-o OUTPUT] [-j JOBS] PATH [PATH ...]
+    bitmappy validate [-j JOBS] PATH [PATH ...]
+
+Directories are searched recursively for sprite files.  Files are
+decoded and encoded in a pool of worker processes, without opening a
+window or starting a GameEngine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import concurrent.futures
+import configparser
+import logging
+import os
+from pathlib import Path
+
+import pygame
+import yaml
+from glitchygames.pixels import image_from_packed_rgb
+from glitchygames.sprites import BitmappySprite, binary
+
+LOG = logging.getLogger('game.tools.sprite_batch')
+LOG.addHandler(logging.NullHandler())
+
+COMMANDS = ('convert', 'validate')
+
+# Output format -> file extension
+FORMATS = {'ini': '.cfg', 'yaml': '.yaml', 'png': '.png', 'binary': binary.EXTENSION}
+
+TEXT_EXTENSIONS = ('.cfg', '.ini', '.yml', '.yaml')
+IMAGE_EXTENSIONS = BitmappySprite.IMAGE_EXTENSIONS
+RAW_EXTENSIONS = ('.raw', '.565')
+EXTENSIONS = TEXT_EXTENSIONS + IMAGE_EXTENSIONS + RAW_EXTENSIONS + (binary.EXTENSION,)
+
+
+def sprite_size(value: str) -> tuple[int, int]:
+    """Parse a WIDTHxHEIGHT command line option.
+
+    Args:
+        value (str): The option's value.
+
+    Returns:
+        tuple[int, int]: The width and height.
+
+    Raises:
+        argparse.ArgumentTypeError: The value isn't two integers of at least 1.
+    """
+    try:
+        (width, height) = (int(dimension) for dimension in value.lower().split('x'))
+    except ValueError:
+        (width, height) = (0, 0)
+
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError(f'{value!r} is not a WIDTHxHEIGHT of at least 1x1')
+
+    return (width, height)
+
+
+def decode_raw_565(filename: str, size: tuple[int, int]) -> pygame.Surface:
+    """Decode a legacy raw sprite of little endian RGB 565 pixels.
+
+    Args:
+        filename (str): The raw sprite file.
+        size (tuple[int, int]): The width and height of the sprite.
+
+    Returns:
+        pygame.Surface: The sprite's image.
+
+    Raises:
+        ValueError: The file isn't the size of a sprite of that many pixels.
+    """
+    (width, height) = size
+
+    return image_from_packed_rgb(Path(filename).read_bytes(), width, height, pixel_format='565')
+
+
+def decode(filename: str, raw_size: tuple[int, int] = (32, 32)) -> tuple[pygame.Surface, str]:
+    """Decode a sprite file of any supported format.
+
+    Args:
+        filename (str): The sprite file.
+        raw_size (tuple[int, int]): The width and height of raw sprites.
+
+    Returns:
+        tuple[pygame.Surface, str]: The sprite's image and name.
+
+    Raises:
+        ValueError: The file isn't a valid sprite.
+    """
+    path = Path(filename)
+
+    if path.suffix.lower() in RAW_EXTENSIONS:
+        return (decode_raw_565(filename, raw_size), path.stem)
+
+    return BitmappySprite.decode(filename, strict=True)
+
+
+def encode(image: pygame.Surface, key_width: int | None = None) -> tuple[list[str], dict]:
+    """Encode an image as Bitmappy pixel rows and a color map.
+
+    Args:
+        image (pygame.Surface): The image to encode.
+        key_width (int | None): The characters per color key, or None for the fewest that fit.
+
+    Returns:
+        tuple[list[str], dict]: The pixel rows and the color map.
+    """
+    return BitmappySprite.encode(
+        pygame.image.tobytes(image, 'RGB'), *image.get_size(), key_width=key_width
+    )
+
+
+def write(
+    image: pygame.Surface,
+    name: str,
+    filename: str,
+    sprite_format: str,
+    key_width: int | None = None,
+) -> None:
+    """Write an image as a sprite file.
+
+    Args:
+        image (pygame.Surface): The sprite's image.
+        name (str): The sprite's name.
+        filename (str): The file to write.
+        sprite_format (str): One of FORMATS.
+        key_width (int | None): The characters per color key of text formats,
+            or None for the fewest that fit.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: The format isn't supported.
+    """
+    if sprite_format == 'binary':
+        binary.write_sprite(filename, name, *binary.encode_surface(image))
+    elif sprite_format == 'png':
+        pygame.image.save(image, filename)
+    elif sprite_format == 'yaml':
+        (rows, color_map) = encode(image, key_width=key_width)
+        config = {
+            'sprite': {'name': name, 'pixels': '\n'.join(rows)},
+            'colors': {
+                key: {'red': red, 'green': green, 'blue': blue}
+                for key, (red, green, blue) in color_map.items()
+            },
+        }
+
+        with Path(filename).open('w') as yaml_file:
+            yaml.safe_dump(config, yaml_file, default_flow_style=False, sort_keys=False)
+    elif sprite_format == 'ini':
+        (rows, color_map) = encode(image, key_width=key_width)
+        config = configparser.RawConfigParser(dict_type=collections.OrderedDict)
+        config['sprite'] = {'name': name, 'pixels': '\n'.join(rows)}
+
+        for key, (red, green, blue) in color_map.items():
+            config[key] = {'red': str(red), 'green': str(green), 'blue': str(blue)}
+
+        with Path(filename).open('w') as ini_file:
+            config.write(ini_file)
+    else:
+        raise ValueError(f'Unsupported format: {sprite_format}')
+
+
+def process(
+    source: str,
+    destination: str | None,
+    sprite_format: str | None,
+    raw_size: tuple[int, int],
+    key_width: int | None = None,
+) -> tuple[str, str | None, str | None]:
+    """Validate, and optionally convert, one sprite file.
+
+    This runs in a worker process.
+
+    Args:
+        source (str): The sprite file.
+        destination (str | None): The file to write, or None to only validate.
+        sprite_format (str | None): The format to write.
+        raw_size (tuple[int, int]): The width and height of raw sprites.
+        key_width (int | None): The characters per color key of text formats.
+
+    Returns:
+        tuple[str, str | None, str | None]: The source, the destination and
+            the error message, which is None if the file was processed.
+    """
+    try:
+        (image, name) = decode(source, raw_size=raw_size)
+
+        if destination is not None:
+            Path(destination).parent.mkdir(parents=True, exist_ok=True)
+            write(image, name or Path(source).stem, destination, sprite_format, key_width=key_width)
+    except Exception as e:  # noqa: BLE001
+        return (source, destination, f'{type(e).__name__}: {e}')
+
+    return (source, destination, None)
+
+
+def find_sprites(paths: list[Path]) -> list[tuple[Path, Path]]:
+    """Find the sprite files to process.
+
+    Args:
+        paths (list[Path]): Sprite files, and directories to search recursively.
+
+    Returns:
+        list[tuple[Path, Path]]: Each sprite file and the path it was
+            found relative to.
+    """
+    sprites = []
+
+    for path in paths:
+        if path.is_dir():
+            sprites.extend(
+                (sprite, path)
+                for sprite in sorted(path.rglob('*'))
+                if sprite.suffix.lower() in EXTENSIONS and sprite.is_file()
+            )
+        else:
+            sprites.append((path, path.parent))
+
+    return sprites
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run a batch command.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Returns:
+        int: The number of files that failed.
+    """
+    raw_size = args.raw_size
+    sprite_format = getattr(args, 'format', None)
+    output = getattr(args, 'output', None)
+    key_width = getattr(args, 'key_width', 0) or None
+
+    jobs = []
+    failures = 0
+
+    # Resolved destination -> the source converted to it
+    destinations = {}
+
+    for (source, root) in find_sprites(args.paths):
+        destination = None
+
+        if args.command == 'convert':
+            destination = (output / source.relative_to(root) if output else source).with_suffix(
+                FORMATS[sprite_format]
+            )
+
+            # e.g. converting an INI sprite to INI in place, or foo.cfg and foo.yaml to YAML
+            resolved = destination.resolve()
+            error = None
+
+            if resolved == source.resolve():
+                error = f'{destination} would overwrite the source, use -o'
+            elif resolved in destinations:
+                error = f'{destination} is also the destination of {destinations[resolved]}'
+
+            if error is not None:
+                failures += 1
+                print(f'{source}: {error}')  # noqa: T201
+                continue
+
+            destinations[resolved] = source
+            destination = str(destination)
+
+        jobs.append((str(source), destination, sprite_format, raw_size, key_width))
+
+    refused = failures
+
+    # The sprite loader logs every file it parses at DEBUG
+    logging.getLogger('game.sprites').setLevel(logging.WARNING)
+
+    workers = args.jobs or os.cpu_count() or 1
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        # Hand out files in chunks so thousands of small sprites aren't one round trip each
+        results = ()
+        if jobs:
+            results = executor.map(
+                process, *zip(*jobs, strict=True), chunksize=max(1, len(jobs) // (workers * 4))
+            )
+
+        for (source, destination, error) in results:
+            if error is not None:
+                failures += 1
+                print(f'{source}: {error}')  # noqa: T201
+            elif args.verbose:
+                result = 'ok' if destination is None else f'-> {destination}'
+                print(f'{source} {result}')  # noqa: T201
+
+    print(f'{args.command}: {len(jobs) + refused - failures} ok, {failures} failed')  # noqa: T201
+
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse a batch command line and run it.
+
+    Args:
+        argv (list[str] | None): The command line, starting with the command.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser('bitmappy', description='Batch sprite conversion')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert = commands.add_parser('convert', help='convert sprite files to another format')
+    convert.add_argument(
+        '-f', '--format', choices=sorted(FORMATS), default='binary', help='the format to write'
+    )
+    convert.add_argument(
+        '-o',
+        '--output',
+        type=Path,
+        default=None,
+        help='directory to write to (default: next to each source file, never over it)',
+    )
+    convert.add_argument(
+        '-k',
+        '--key-width',
+        type=int,
+        default=0,
+        help='characters per color key in INI and YAML sprites (default: the fewest that fit)',
+    )
+
+    validate = commands.add_parser('validate', help='check that sprite files decode')
+
+    for command in (convert, validate):
+        command.add_argument('paths', type=Path, nargs='+', help='sprite files or directories')
+        command.add_argument(
+            '-j', '--jobs', type=int, default=None, help='worker processes (default: one per CPU)'
+        )
+        command.add_argument(
+            '--raw-size',
+            type=sprite_size,
+            default='32x32',
+            help='the WIDTHxHEIGHT of raw RGB 565 sprites',
+        )
+        command.add_argument('-v', '--verbose', action='store_true', help='list every file')
+
+    args = parser.parse_args(argv)
+
+    return 1 if run(args) else 0
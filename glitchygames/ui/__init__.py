@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, ClassVar, Self
 
 import pygame
 from glitchygames import events
@@ -443,7 +443,7 @@ class MenuItem(BitmappySprite):
 
         # Don't set a name for the icon.
         if self.name:
-            self.image.fill((255, 255, 255))
+            self.own_image().fill((255, 255, 255))
             self.image.set_colorkey((255, 255, 255))
             self.text = TextSprite(
                 background_color=self.background_color,
@@ -572,7 +572,7 @@ class MenuItem(BitmappySprite):
         # Draw to our own surface instead of the screen
         if self.active and self.menu_image and self.menu_rect:
             self.log.debug('Drawing the menu')
-            self.image.blit(self.menu_image, (0, 0))  # Draw relative to our own surface
+            self.own_image().blit(self.menu_image, (0, 0))  # Draw relative to our own surface
 
     def on_left_mouse_drag_event(self: Self, event: pygame.event.Event, trigger: object) -> None:
         """Handle left mouse drag events.
@@ -863,6 +863,9 @@ class TextSprite(BitmappySprite):
 
     log = LOG
 
+    # pygame's default font, loaded by the first text sprite
+    FONT: ClassVar = None
+
     def __init__(
         self: Self,
         x: int,
@@ -951,8 +954,11 @@ class TextSprite(BitmappySprite):
         self.image.fill((0, 0, 0, 0))  # Fully transparent black
 
         # Create text surface using pygame's default font with no anti-aliasing
-        font = pygame.font.Font(None, 24)
-        text_surface = font.render(str(text), False, self.text_color)  # False = no anti-aliasing
+        if TextSprite.FONT is None:
+            TextSprite.FONT = pygame.font.Font(None, 24)
+        text_surface = FontManager.render(
+            TextSprite.FONT, str(text), self.text_color, antialias=False
+        )
 
         # Position the text in the center of our surface
         text_rect = text_surface.get_rect()
@@ -1342,6 +1348,7 @@ class InputBox(Sprite):
         Returns:
             None
         """
+        # Edited text changes every keystroke, so keep it out of the shared render cache
         self.text_image = self.font.render(self.text, True, (255, 255, 255))  # noqa: FBT003
 
     def on_mouse_up_event(self: Self, event: pygame.event.Event) -> None:
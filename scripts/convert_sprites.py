@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Convert sprite files to binary sprites.
+
+This is shorthand for `bitmappy convert -f binary`, see
+glitchygames.tools.sprite_batch.  Each sprite is written next to the
+original (or into --output) with the binary sprite extension, so it
+can be memory mapped at load time.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from glitchygames.tools import sprite_batch
+
+
+def main() -> int:
+    """Convert the sprite files and directories named on the command line.
+
+    Returns:
+        int: The process exit status.
+    """
+    return sprite_batch.main(['convert', '--format', 'binary', *sys.argv[1:]])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Event dispatch micro-benchmark.
+
+Times on_*_event dispatch through the resource manager and scene
+manager proxies, without running the game loop.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+from typing import Self
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from glitchygames.events import HashableEvent
+from glitchygames.events.keyboard import KeyboardManager
+from glitchygames.events.window import WindowManager
+from glitchygames.scenes import Scene, SceneManager
+
+
+class BenchmarkScene(Scene):
+    """A scene with no-op event handlers."""
+
+    NAME = 'Event Dispatch Benchmark'
+
+    def on_key_down_event(self: Self, event: HashableEvent) -> None:
+        """Handle key down events.
+
+        Args:
+            event (HashableEvent): The event to handle.
+
+        Returns:
+            None
+        """
+
+    def on_key_chord_down_event(self: Self, event: HashableEvent, keys_down: list) -> None:
+        """Handle key chord down events.
+
+        Args:
+            event (HashableEvent): The event to handle.
+            keys_down (list): The keys that are currently down.
+
+        Returns:
+            None
+        """
+
+    def on_window_moved_event(self: Self, event: HashableEvent) -> None:
+        """Handle window moved events.
+
+        Args:
+            event (HashableEvent): The event to handle.
+
+        Returns:
+            None
+        """
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser('Event Dispatch Benchmark')
+    parser.add_argument(
+        '-n', '--number', type=int, default=100000, help='dispatches per measurement'
+    )
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+
+    scene = BenchmarkScene()
+    scene_manager = SceneManager()
+    scene_manager.switch_to_scene(scene)
+
+    keyboard_manager = KeyboardManager(game=scene_manager)
+    window_manager = WindowManager(game=scene_manager)
+
+    key_down = HashableEvent(pygame.KEYDOWN, key=pygame.K_a, mod=0, scancode=4, unicode='a')
+    window_moved = HashableEvent(pygame.WINDOWMOVED, x=0, y=0)
+
+    benchmarks = {
+        'on_key_down_event': lambda: keyboard_manager.on_key_down_event(key_down),
+        'on_window_moved_event': lambda: window_manager.on_window_moved_event(window_moved),
+        'scene_manager.on_key_down_event': lambda: scene_manager.on_key_down_event(key_down),
+    }
+
+    for name, benchmark in benchmarks.items():
+        elapsed = min(timeit.repeat(benchmark, number=args.number, repeat=5))
+        print(f'{name:<36} {elapsed / args.number * 1e9:>10.1f} ns/dispatch')  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Pack a directory of sprites into a texture atlas.
+
+Writes the atlas index and its pages, which can be loaded with
+TextureAtlas.load() and set as BitmappySprite.ATLAS.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from glitchygames.sprites.atlas import TextureAtlas
+
+
+def main() -> None:
+    """Pack the sprite directory named on the command line."""
+    parser = argparse.ArgumentParser('Texture Atlas Packer')
+    parser.add_argument('directory', type=Path, help='directory of sprites to pack')
+    parser.add_argument('output', type=Path, help='atlas index file to write')
+    parser.add_argument('--max-size', type=int, default=1024, help='maximum page size')
+    parser.add_argument('--padding', type=int, default=1, help='gap between sprites')
+    args = parser.parse_args()
+
+    atlas = TextureAtlas.from_directory(
+        args.directory, max_size=args.max_size, padding=args.padding
+    )
+    atlas.save(args.output)
+
+    pages = ', '.join(f'{page.get_width()}x{page.get_height()}' for page in atlas.pages)
+    print(f'Packed {len(atlas)} sprites onto {len(atlas.pages)} pages ({pages})')  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import configparser
 import logging
-import struct
 from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING, Self
@@ -15,7 +14,7 @@ if TYPE_CHECKING:
 
 import pygame
 from glitchygames.engine import GameEngine
-from glitchygames.pixels import rgb_565_triplet_generator, rgb_triplet_generator
+from glitchygames.pixels import image_from_packed_rgb, rgb_triplet_generator
 from glitchygames.scenes import Scene
 from glitchygames.sprites import Sprite
 
@@ -61,60 +60,13 @@ class BitmappyLegacySprite(Sprite):
         Returns:
             tuple[pygame.Surface, pygame.Rect, str]: The image, rect, and name.
         """
-        image = None
-        rect = None
-        data = []
+        # Load the raw bits in; they're little endian RGB 565 pixels
+        data = Path(filename).read_bytes()
 
-        # Load the raw bits in.
-        with Path.open(filename, 'rb') as fh:
-            data = fh.read()
-
-        # Unpack the bytes into 565 triplets.
-        # Read 2 bytes, unsigned.
-        packed_rgb_data = struct.iter_unpack('<H', data)
-
-        pixels = rgb_565_triplet_generator(data=packed_rgb_data)
-
-        pixels = list(pixels)
-
-        for pixel in pixels:
-            LOG.info(pixel)
-
-        (image, rect) = self.inflate(width=width, height=height, pixels=pixels)
-
-        return (image, rect, filename)
-
-    @classmethod
-    def inflate(
-        cls: Self, width: int, height: int, pixels: list
-    ) -> tuple[pygame.Surface, pygame.Rect]:
-        """Inflate the sprite.
-
-        Args:
-            width (int): The width of the sprite.
-            height (int): The height of the sprite.
-            pixels (list): The list of pixels.
-
-        Returns:
-            tuple[pygame.Surface, pygame.Rect]: The image and rect.
-        """
-        image = pygame.Surface((width, height))
-        image.fill((0, 255, 0))
-        image.convert()
+        image = image_from_packed_rgb(data, width, height, pixel_format='565')
         image.set_colorkey((255, 0, 255))
 
-        x = 0
-        y = 0
-        for color in pixels:
-            pygame.draw.rect(image, color, (y, x, 0, 0))
-
-            if x and x % width == 0:
-                y += 1
-                x = 1
-            else:
-                x += 1
-
-        return (image, image.get_rect())
+        return (image, image.get_rect(), filename)
 
     def save(self: Self, filename: str) -> None:
         """Save the sprite to a file.
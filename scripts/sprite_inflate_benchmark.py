@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""BitmappySprite.inflate() benchmark.
+
+Times inflating random character grids into surfaces, against the
+previous one pygame.draw.rect() call per pixel implementation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import timeit
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from glitchygames.sprites import BitmappySprite, np
+
+
+def draw_rect_inflate(
+    width: int, height: int, pixels: list, color_map: dict
+) -> tuple[pygame.Surface, pygame.Rect]:
+    """Inflate a sprite one pixel at a time, like inflate() used to.
+
+    Args:
+        width: the width of the sprite.
+        height: the height of the sprite.
+        pixels: the list of pixels, one string of color map keys per row.
+        color_map: the color map.
+
+    Returns:
+        A tuple containing the sprite's image and rect.
+    """
+    image = pygame.Surface((width, height))
+
+    for y, row in enumerate(pixels):
+        for x, pixel in enumerate(row):
+            pygame.draw.rect(image, color_map[pixel], (x, y, 1, 1))
+
+    return (image, image.get_rect())
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser('Sprite Inflate Benchmark')
+    parser.add_argument(
+        '-s',
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[16, 64, 256],
+        help='sprite sizes to inflate (width and height)',
+    )
+    parser.add_argument('-n', '--number', type=int, default=10, help='inflates per measurement')
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+
+    print(f'NumPy: {"available" if np is not None else "not available"}')  # noqa: T201
+
+    color_map = {
+        char: (random.randrange(256), random.randrange(256), random.randrange(256))
+        for char in BitmappySprite.SPRITE_CHARS
+    }
+
+    for size in args.sizes:
+        pixels = [
+            ''.join(random.choices(BitmappySprite.SPRITE_CHARS, k=size))
+            for _ in range(size)
+        ]
+
+        timings = {}
+
+        for name, inflate in (
+            ('draw.rect', draw_rect_inflate),
+            ('inflate', BitmappySprite.inflate),
+        ):
+            elapsed = min(
+                timeit.repeat(
+                    lambda inflate=inflate, size=size, pixels=pixels: inflate(
+                        width=size, height=size, pixels=pixels, color_map=color_map
+                    ),
+                    number=args.number,
+                    repeat=3,
+                )
+            )
+            timings[name] = elapsed / args.number
+
+        print(  # noqa: T201
+            f'{size:>4}x{size:<4} draw.rect {timings["draw.rect"] * 1e3:>9.3f} ms'
+            f'   inflate {timings["inflate"] * 1e3:>7.3f} ms'
+            f'   {timings["draw.rect"] / timings["inflate"]:>6.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()